@@ -0,0 +1,132 @@
+"""
+Benchmark read-heavy parallel access to the cache, as many elAPI processes
+started at once (e.g., from cron) would do. Each process looks up the cached
+eLabFTW version of a host, and a small share of the lookups refresh it.
+
+The SQLite (WAL) ``CacheStore`` is compared with the JSON file it has replaced,
+which was read whole on every lookup and rewritten whole on every update without
+a lock. Reads of the JSON file that hit a partially written file are counted as
+errors.
+
+    python benchmarks/cache_store.py --processes 8 --operations 5000
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from elapi._core_init import CacheStore
+from elapi._names import ELAB_HOSTS_CACHE_NAMESPACE
+
+HOSTS: tuple[str, ...] = tuple(f"https://elab-{i}.example.org/api/v2" for i in range(5))
+
+
+def _run_cache_store(
+    path: Path, operations: int, write_ratio: float, start
+) -> tuple[float, int]:
+    store = CacheStore(ELAB_HOSTS_CACHE_NAMESPACE, path=path)
+    start.wait()
+    started_at = time.perf_counter()
+    for _ in range(operations):
+        host = random.choice(HOSTS)
+        if random.random() < write_ratio:
+            store.set(host, "5.3.9", ttl=3600)
+        else:
+            store.get(host)
+    return time.perf_counter() - started_at, 0
+
+
+def _run_json_file(
+    path: Path, operations: int, write_ratio: float, start
+) -> tuple[float, int]:
+    errors = 0
+    start.wait()
+    started_at = time.perf_counter()
+    for _ in range(operations):
+        host = random.choice(HOSTS)
+        try:
+            cache = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            errors += 1
+            continue
+        if random.random() < write_ratio:
+            cache["date"] = datetime.now().isoformat()
+            cache["elab_hosts"][host] = "5.3.9"
+            path.write_text(json.dumps(cache), encoding="utf-8")
+        else:
+            cache["elab_hosts"].get(host)
+    return time.perf_counter() - started_at, errors
+
+
+def _prepare(backend: str, directory: Path) -> Path:
+    if backend == "cache_store":
+        path = directory / "elapi.sqlite3"
+        CacheStore(ELAB_HOSTS_CACHE_NAMESPACE, path=path).update(
+            dict.fromkeys(HOSTS, "5.3.9"), ttl=3600
+        )
+        CacheStore.close_all()
+    else:
+        path = directory / "elapi.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "date": datetime.now().isoformat(),
+                    "elab_hosts": dict.fromkeys(HOSTS, "5.3.9"),
+                }
+            ),
+            encoding="utf-8",
+        )
+    return path
+
+
+def run(backend: str, processes: int, operations: int, write_ratio: float) -> None:
+    worker = _run_cache_store if backend == "cache_store" else _run_json_file
+    # Spawned processes start with no shared SQLite connection, like separate
+    # elAPI invocations
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        path = _prepare(backend, Path(directory))
+        start = context.Manager().Event()
+        with context.Pool(processes) as pool:
+            pending = [
+                pool.apply_async(worker, (path, operations, write_ratio, start))
+                for _ in range(processes)
+            ]
+            # Let every process get ready before the clock starts
+            time.sleep(1)
+            start.set()
+            results = [_.get() for _ in pending]
+    elapsed = max(_[0] for _ in results)
+    errors = sum(_[1] for _ in results)
+    total = processes * operations
+    print(
+        f"{backend:<12} {processes:>3} processes: {total / elapsed:>10.0f} ops/s "
+        f"({elapsed:.2f} s, {errors} failed reads)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--operations", type=int, default=5000)
+    parser.add_argument(
+        "--write-ratio",
+        type=float,
+        default=0.01,
+        help="Share of operations that update the cache.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("cache_store", "json_file", "all"),
+        default="all",
+    )
+    args = parser.parse_args()
+    for backend_ in (
+        ("cache_store", "json_file") if args.backend == "all" else (args.backend,)
+    ):
+        run(backend_, args.processes, args.operations, args.write_ratio)
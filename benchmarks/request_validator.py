@@ -0,0 +1,94 @@
+"""
+Benchmark the cost of validating a request locally before it is sent, i.e.,
+of the checks ``_request_validator.compile_schema`` builds from an OpenAPI
+schema. Bodies of a bulk PATCH job are validated against a schema in the
+shape of eLabFTW's entity schema, with a growing number of tags and steps.
+
+    python benchmarks/request_validator.py --repeat 20000
+"""
+
+import argparse
+import timeit
+
+from elapi.api._request_validator import compile_schema
+
+ENTITY_SCHEMA: dict = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "body": {"type": "string"},
+        "date": {"type": "string", "pattern": r"^\d{4}-\d{2}-\d{2}$"},
+        "rating": {"type": "integer", "minimum": 0, "maximum": 5},
+        "category": {"type": "integer", "nullable": True},
+        "status": {"type": "integer", "nullable": True},
+        "content_type": {"type": "integer", "enum": [1, 2]},
+        "canread": {"type": "string"},
+        "canwrite": {"type": "string"},
+        "metadata": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "steps": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["body"],
+                "properties": {
+                    "body": {"type": "string"},
+                    "finished": {"type": "boolean"},
+                },
+            },
+        },
+    },
+}
+QUERY_SCHEMA: dict = {
+    "type": "object",
+    "properties": {
+        "limit": {"type": "integer", "minimum": 1},
+        "offset": {"type": "integer", "minimum": 0},
+        "order": {"type": "string", "enum": ["asc", "desc"]},
+        "q": {"type": "string"},
+    },
+}
+
+
+def get_body(size: int) -> dict:
+    return {
+        "title": "Cell culture",
+        "body": "<p>Protocol</p>" * 10,
+        "date": "2025-01-31",
+        "rating": 4,
+        "category": None,
+        "content_type": 1,
+        "tags": [f"tag-{i}" for i in range(size)],
+        "steps": [{"body": f"Step {i}", "finished": False} for i in range(size)],
+    }
+
+
+def main(repeat: int) -> None:
+    compile_time = (
+        timeit.timeit(lambda: compile_schema(ENTITY_SCHEMA), number=1000) / 1000
+    )
+    print(f"{'Compile entity schema (once per route)':<40}{compile_time * 1e6:8.1f} µs")
+    body_check = compile_schema(ENTITY_SCHEMA)
+    query_check = compile_schema(QUERY_SCHEMA, from_query_string=True)
+    query = {"limit": "100", "offset": "0", "order": "desc", "q": "cell"}
+    per_query = (
+        timeit.timeit(lambda: query_check(query, "query", []), number=repeat) / repeat
+    )
+    print(f"{'Validate query (4 parameters)':<40}{per_query * 1e6:8.1f} µs")
+    for size in (0, 10, 100):
+        body = get_body(size)
+        errors: list[str] = []
+        body_check(body, "data", errors)
+        assert not errors, errors
+        per_body = (
+            timeit.timeit(lambda: body_check(body, "data", []), number=repeat)  # noqa: B023
+            / repeat
+        )
+        label = f"Validate body ({size} tags and steps)"
+        print(f"{label:<40}{per_body * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20000)
+    main(parser.parse_args().repeat)
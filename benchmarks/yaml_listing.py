@@ -0,0 +1,122 @@
+"""
+Benchmark YAML output and input for a typical experiment listing, and the
+export throughput of the YAML format and the other export formats.
+
+YAML is dumped and loaded with PyYAML's pure-Python classes and with the
+classes ``elapi._yaml`` uses (libyaml's, if PyYAML is built with it). Each
+export format writes the listing once as a whole and once streamed, as
+``elapi get --export`` does.
+
+    python benchmarks/yaml_listing.py --items 5000 --formats yaml json csv
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+from elapi import _yaml
+from elapi.plugins.commons import Export
+from elapi.styles import __PACKAGE_IDENTIFIER__ as styles_package_identifier
+from elapi.styles import Format
+
+
+def get_experiments(count: int) -> list[dict]:
+    # Most of the fields eLabFTW returns when listing experiments
+    return [
+        {
+            "id": i,
+            "elabid": f"20250131-{i:040x}",
+            "title": f"Cell culture passage {i}",
+            "date": "2025-01-31",
+            "body": "<h1>Protocol</h1><p>Split cells 1:4 into fresh medium.</p>" * 3,
+            "rating": i % 6,
+            "userid": 2,
+            "fullname": "Jane Doe",
+            "team": 1,
+            "category": None,
+            "status": 3,
+            "status_title": "Success",
+            "locked": 0,
+            "canread": '{"base": 30, "teams": [], "users": [], "teamgroups": []}',
+            "canwrite": '{"base": 20, "teams": [], "users": [], "teamgroups": []}',
+            "created_at": "2025-01-31 09:30:00",
+            "modified_at": "2025-02-01 16:12:43",
+            "tags": "cell culture|HeLa|passage",
+            "tags_id": "1,4,9",
+            "has_attachment": 1,
+            "metadata": '{"extra_fields": {"Cell line": {"type": "text", "value": "HeLa"}}}',
+            "custom_id": None,
+            "up_item_id": None,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(function: Callable[[], Any]) -> tuple[float, Any]:
+    started_at = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started_at, result
+
+
+def bench_yaml(items: list[dict]) -> None:
+    kwargs: dict = {"indent": 2, "allow_unicode": True, "sort_keys": False}
+    python_dump_time, python_text = measure(
+        lambda: yaml.dump(items, Dumper=yaml.SafeDumper, **kwargs)
+    )
+    dump_time, text = measure(lambda: _yaml.safe_dump(items, **kwargs))
+    python_load_time, _ = measure(lambda: yaml.load(text, Loader=yaml.SafeLoader))
+    load_time, loaded = measure(lambda: _yaml.safe_load(text))
+    assert loaded == items
+    print(
+        f"YAML of {len(items)} experiments ({len(text) / 1e6:.1f} MB), "
+        f"elapi._yaml uses {_yaml.SafeDumper.__name__}/{_yaml.SafeLoader.__name__}"
+        f"{'' if text == python_text else ' (output differs)'}:"
+    )
+    print(f"  {'dump':<6}{python_dump_time:8.2f} s -> {dump_time:8.2f} s")
+    print(f"  {'load':<6}{python_load_time:8.2f} s -> {load_time:8.2f} s")
+
+
+def bench_export(items: list[dict], format_name: str) -> None:
+    formatter = Format(format_name, package_identifier=styles_package_identifier)
+    extension = (
+        formatter.convention
+        if isinstance(formatter.convention, str)
+        else formatter.convention[0]
+    )
+    with tempfile.TemporaryDirectory() as directory:
+
+        def get_export(stub: str) -> Export:
+            return Export(
+                Path(directory),
+                file_name_stub=stub,
+                file_extension=extension,
+                format_name=formatter.name,
+            )
+
+        whole_time, _ = measure(lambda: get_export("whole")(data=formatter(items)))
+        stream_time, _ = measure(
+            lambda: get_export("stream").stream(iter(items), formatter=formatter)
+        )
+        size = sum(_.stat().st_size for _ in Path(directory).iterdir()) / 2
+    print(
+        f"Export {formatter.name:<8} ({size / 1e6:6.1f} MB): "
+        f"whole {size / 1e6 / whole_time:7.1f} MB/s, "
+        f"streamed {size / 1e6 / stream_time:7.1f} MB/s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument(
+        "--formats", nargs="*", default=["yaml", "json", "jsonl", "csv"]
+    )
+    args = parser.parse_args()
+    experiments = get_experiments(args.items)
+    bench_yaml(experiments)
+    for format_name_ in args.formats:
+        bench_export(experiments, format_name_)
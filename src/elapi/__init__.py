@@ -1,2 +1,8 @@
-# ruff: noqa: F401
-from ._names import APP_NAME, APP_BRAND_NAME
+def __getattr__(name: str):
+    # Resolved lazily, so that importing a submodule does not import pydantic.
+    # E.g., the "elapi" command's entry point must stay cheap to import.
+    if name in ("APP_NAME", "APP_BRAND_NAME"):
+        from . import _names
+
+        return getattr(_names, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,12 +18,23 @@ __all__ = [
     "PatternNotFoundError",
     "get_cached_data",
     "update_cache",
+    "CacheEntry",
+    "CacheStore",
+    "CacheStoreError",
+    "get_or_revalidate",
 ]
 import logging
 
 from .._vendor import haggis
 from .._vendor.haggis.logs import add_logging_level
-from ._cache import get_cached_data, update_cache
+from ._cache import (
+    CacheEntry,
+    CacheStore,
+    CacheStoreError,
+    get_cached_data,
+    get_or_revalidate,
+    update_cache,
+)
 from ._loggers import (
     BaseHandler,
     DefaultLogLevels,
@@ -1,53 +1,405 @@
+import atexit
 import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from json import JSONDecodeError
+from pathlib import Path
+from typing import Any, Callable, Generator, Optional
 
-from pydantic import ValidationError
-
-from .._names import CacheFileProperties, CacheModel, CACHE_PATH
+from .._names import (
+    APP_NAME,
+    CACHE_PATH,
+    ELAB_HOSTS_CACHE_NAMESPACE,
+    CacheFileProperties,
+    CacheModel,
+)
 from ._loggers import Logger
 
 logger = Logger()
 
 
-def get_cached_data() -> CacheModel:
-    def _new_cache() -> CacheModel:
-        cache_ = CacheModel(date=datetime.now())
-        update_cache(cache_)
-        return cache_
+class CacheStoreError(Exception): ...
 
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    created_at: float
+    expires_at: Optional[float]
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+
+class CacheStore:
+    """
+    CacheStore is a small key-value store backed by a single SQLite database
+    in WAL mode. Multiple elAPI processes can safely read and write the same
+    database concurrently. Each entry belongs to a namespace (plugins should
+    use their own plugin name as the namespace) and can have its own TTL.
+    Values must be JSON serializable.
+    """
+
+    __slots__ = "namespace", "path"
+    _connections: dict[Path, sqlite3.Connection] = {}
+    _lock = threading.RLock()
+    # A single connection per database path is shared by all instances
+    # (and threads) of the same process. The lock serializes access to it.
+
+    def __init__(self, namespace: str = APP_NAME, /, *, path: Path = CACHE_PATH):
+        if not isinstance(namespace, str) or not namespace:
+            raise ValueError("namespace must be a non-empty string!")
+        self.namespace = namespace
+        self.path = path
+
+    @classmethod
+    def _get_connection(cls, path: Path) -> sqlite3.Connection:
+        with cls._lock:
+            try:
+                return cls._connections[path]
+            except KeyError:
+                ...
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(
+                    path,
+                    timeout=CacheFileProperties.busy_timeout,
+                    isolation_level=None,  # Transactions are managed manually
+                    check_same_thread=False,
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "namespace TEXT NOT NULL, "
+                    "key TEXT NOT NULL, "
+                    "value TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, "
+                    "expires_at REAL, "
+                    "PRIMARY KEY (namespace, key)"
+                    ") WITHOUT ROWID"
+                )
+            except (OSError, sqlite3.Error) as e:
+                raise CacheStoreError(
+                    f"Cache database '{path}' could not be opened. "
+                    f"Exception details: {e!r}"
+                ) from e
+            cls._connections[path] = connection
+            logger.debug(f"Cache database '{path}' is opened.")
+            return connection
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            for connection in cls._connections.values():
+                connection.close()
+            cls._connections.clear()
+
+    @classmethod
+    def clear_all(cls, path: Path = CACHE_PATH) -> None:
+        with cls._lock:
+            try:
+                cls._get_connection(path).execute("DELETE FROM cache")
+            except sqlite3.Error as e:
+                raise CacheStoreError(
+                    f"Cache database '{path}' could not be cleared. "
+                    f"Exception details: {e!r}"
+                ) from e
+
+    @contextmanager
+    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Run multiple reads and writes atomically. "BEGIN IMMEDIATE" acquires
+        the database write lock right away, so a read-modify-write inside
+        the transaction cannot race with another elAPI process.
+        """
+        with CacheStore._lock:
+            connection = self._get_connection(self.path)
+            if connection.in_transaction:
+                # Nested transaction: the outermost one commits
+                yield connection
+                return
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+            except sqlite3.Error as e:
+                raise CacheStoreError(
+                    f"Cache database '{self.path}' transaction could not be started. "
+                    f"Exception details: {e!r}"
+                ) from e
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            try:
+                connection.execute("COMMIT")
+            except sqlite3.Error as e:
+                connection.execute("ROLLBACK")
+                raise CacheStoreError(
+                    f"Cache database '{self.path}' transaction could not be committed. "
+                    f"Exception details: {e!r}"
+                ) from e
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with CacheStore._lock:
+            try:
+                row = (
+                    self._get_connection(self.path)
+                    .execute(
+                        "SELECT value, created_at, expires_at FROM cache "
+                        "WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error as e:
+                raise CacheStoreError(
+                    f"Cache entry '{key}' could not be read from namespace "
+                    f"'{self.namespace}'. Exception details: {e!r}"
+                ) from e
+        if row is None:
+            return None
+        value, created_at, expires_at = row
+        return CacheEntry(json.loads(value), created_at, expires_at)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self.get_entry(key)
+        if entry is None or entry.is_expired:
+            return default
+        return entry.value
+
+    def set(self, key: str, value: Any, /, ttl: Optional[float] = None) -> None:
+        self.update({key: value}, ttl=ttl)
+
+    def update(self, data: dict[str, Any], /, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        try:
+            rows = [
+                (self.namespace, key, json.dumps(value), now, expires_at)
+                for key, value in data.items()
+            ]
+        except (TypeError, ValueError) as e:
+            raise CacheStoreError(
+                f"Cache data for namespace '{self.namespace}' "
+                f"is not JSON serializable. Exception details: {e!r}"
+            ) from e
+        if not rows:
+            return
+        try:
+            with self.transaction() as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO cache "
+                    "(namespace, key, value, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            raise CacheStoreError(
+                f"Cache data could not be written to namespace '{self.namespace}'. "
+                f"Exception details: {e!r}"
+            ) from e
+
+    def delete(self, key: str) -> None:
+        try:
+            with self.transaction() as connection:
+                connection.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+        except sqlite3.Error as e:
+            raise CacheStoreError(
+                f"Cache entry '{key}' could not be deleted from namespace "
+                f"'{self.namespace}'. Exception details: {e!r}"
+            ) from e
+
+    def items(self) -> dict[str, Any]:
+        with CacheStore._lock:
+            try:
+                rows = (
+                    self._get_connection(self.path)
+                    .execute(
+                        "SELECT key, value FROM cache WHERE namespace = ? "
+                        "AND (expires_at IS NULL OR expires_at > ?)",
+                        (self.namespace, time.time()),
+                    )
+                    .fetchall()
+                )
+            except sqlite3.Error as e:
+                raise CacheStoreError(
+                    f"Cache namespace '{self.namespace}' could not be read. "
+                    f"Exception details: {e!r}"
+                ) from e
+        return {key: json.loads(value) for key, value in rows}
+
+    def claim(self, key: str, /, ttl: float) -> bool:
+        """
+        Create an entry only if it does not exist or has expired. Returns
+        True if this call created the entry. This can be used as a lease
+        that only one elAPI process can hold at a time.
+        """
+        with self.transaction():
+            entry = self.get_entry(key)
+            if entry is not None and not entry.is_expired:
+                return False
+            self.set(key, True, ttl=ttl)
+            return True
+
+    def clear(self) -> None:
+        try:
+            with self.transaction() as connection:
+                connection.execute(
+                    "DELETE FROM cache WHERE namespace = ?", (self.namespace,)
+                )
+        except sqlite3.Error as e:
+            raise CacheStoreError(
+                f"Cache namespace '{self.namespace}' could not be cleared. "
+                f"Exception details: {e!r}"
+            ) from e
+
+    def purge_expired(self) -> None:
+        try:
+            with self.transaction() as connection:
+                connection.execute(
+                    "DELETE FROM cache WHERE namespace = ? "
+                    "AND expires_at IS NOT NULL AND expires_at <= ?",
+                    (self.namespace, time.time()),
+                )
+        except sqlite3.Error as e:
+            raise CacheStoreError(
+                f"Expired cache entries could not be purged from namespace "
+                f"'{self.namespace}'. Exception details: {e!r}"
+            ) from e
+
+
+_revalidating: set[tuple[Path, str, str]] = set()
+_revalidation_threads: list[threading.Thread] = []
+
+
+def _revalidate_in_background(
+    store: CacheStore, key: str, fetch: Callable[[], Any], /, *, ttl: float
+) -> None:
+    if (store.path, store.namespace, key) in _revalidating:
+        return
+    lease = CacheStore(f"{store.namespace}.lease", path=store.path)
     try:
-        raw_cache = json.loads(
-            CACHE_PATH.read_text(encoding=CacheFileProperties.encoding)
-        )
-    except (FileNotFoundError, JSONDecodeError, UnicodeDecodeError):
-        raw_cache = {}
-    try:
-        cache = CacheModel(**raw_cache)
-    except ValidationError:
-        logger.debug(
-            f"Cache found in '{CACHE_PATH}' is either empty or invalid. "
-            f"New cache will be created."
-        )
-        return _new_cache()
-    else:
-        if (datetime.now() - cache.date).seconds > CacheFileProperties.expires_in_days:
+        if not lease.claim(key, ttl=CacheFileProperties.revalidation_lease):
+            # Another elAPI process is already refreshing the same entry
+            return
+    except CacheStoreError as e:
+        logger.debug(f"Cache entry '{key}' will not be refreshed. {e}")
+        return
+    _revalidating.add((store.path, store.namespace, key))
+
+    def revalidate() -> None:
+        try:
+            value = fetch()
+        except Exception as e:
             logger.debug(
-                f"Cache found in '{CACHE_PATH}' is older than "
-                f"{CacheFileProperties.expires_in_days} days. "
-                f"New cache will be created."
+                f"Background refresh of cache entry '{key}' in namespace "
+                f"'{store.namespace}' has failed. Exception details: {e!r}"
             )
-            return _new_cache()
+            return
+        try:
+            store.set(key, value, ttl=ttl + CacheFileProperties.stale_ttl)
+            lease.delete(key)
+        except CacheStoreError as e:
+            logger.debug(e)
         else:
-            return cache
+            logger.debug(
+                f"Cache entry '{key}' in namespace '{store.namespace}' "
+                f"has been refreshed in the background."
+            )
+        finally:
+            _revalidating.discard((store.path, store.namespace, key))
+
+    thread = threading.Thread(
+        target=revalidate, name=f"{APP_NAME}-cache-{key}", daemon=True
+    )
+    thread.start()
+    _revalidation_threads.append(thread)
+
+
+@atexit.register
+def _join_revalidation_threads() -> None:
+    # Give pending background refreshes a short chance to finish before exit.
+    # An unfinished refresh leaves the cache untouched as its write never commits.
+    deadline = time.monotonic() + CacheFileProperties.revalidation_join_timeout
+    for thread in _revalidation_threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
 
 
-def update_cache(cache: CacheModel) -> None:
+def get_or_revalidate(
+    store: CacheStore,
+    key: str,
+    fetch: Callable[[], Any],
+    /,
+    *,
+    ttl: float,
+) -> Any:
+    """
+    Return cached value for ``key`` with stale-while-revalidate semantics.
+    A fresh entry is returned as is. An entry older than
+    ``CacheFileProperties.refresh_ahead_ratio * ttl`` is still returned, but
+    it is refreshed with ``fetch`` in a background thread. An entry older than
+    ``ttl + CacheFileProperties.stale_ttl`` (or a missing entry) is fetched
+    synchronously. A ``ttl`` of 0 disables caching for the key.
+    """
+    if ttl <= 0:
+        return fetch()
+    try:
+        entry = store.get_entry(key)
+    except CacheStoreError as e:
+        logger.debug(f"Cache entry '{key}' could not be read. {e}")
+        entry = None
+    if entry is not None and not entry.is_expired:
+        age = time.time() - entry.created_at
+        if age >= ttl * CacheFileProperties.refresh_ahead_ratio:
+            _revalidate_in_background(store, key, fetch, ttl=ttl)
+        return entry.value
+    value = fetch()
+    try:
+        store.set(key, value, ttl=ttl + CacheFileProperties.stale_ttl)
+    except CacheStoreError as e:
+        logger.debug(f"Cache entry '{key}' could not be written. {e}")
+    return value
+
+
+def get_cached_data() -> CacheModel:
+    try:
+        elab_hosts = CacheStore(ELAB_HOSTS_CACHE_NAMESPACE).items()
+    except CacheStoreError as e:
+        logger.debug(f"Cache could not be read. A new cache will be used. {e}")
+        elab_hosts = {}
+    return CacheModel(date=datetime.now(), elab_hosts=elab_hosts)
+
+
+def update_cache(cache: CacheModel, /, *, ttl: float) -> None:
+    """
+    Write the eLabFTW hosts of ``cache`` to the cache database. ``ttl`` should
+    be the configured TTL of the hosts namespace, e.g., from
+    ``ElabFTWURL.get_elab_hosts_cache_ttl``. A ``ttl`` of 0 disables caching.
+    """
     cache.date = datetime.now()
-    if not CACHE_PATH.exists():
-        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        CACHE_PATH.touch(exist_ok=True)
-    CACHE_PATH.write_text(
-        cache.model_dump_json(indent=CacheFileProperties.indent),
-        encoding=CacheFileProperties.encoding,
-    )
+    if ttl <= 0:
+        return
+    store = CacheStore(ELAB_HOSTS_CACHE_NAMESPACE)
+    try:
+        with store.transaction():
+            # Only new or changed entries are written so that the
+            # TTL of other entries is not renewed without a refetch.
+            stored = store.items()
+            store.update(
+                {
+                    host: version
+                    for host, version in cache.elab_hosts.items()
+                    if stored.get(host) != version
+                },
+                ttl=ttl + CacheFileProperties.stale_ttl,
+            )
+    except CacheStoreError as e:
+        logger.debug(f"Cache could not be updated. Exception details: {e}")
@@ -60,6 +60,7 @@ KEY_ASYNC_RATE_LIMIT: str = "ASYNC_RATE_LIMIT"
 KEY_DEVELOPMENT_MODE: str = "DEVELOPMENT_MODE"
 KEY_PLUGIN_KEY_NAME: str = "PLUGINS"
 KEY_ELAB_STRICT_VERSION_MATCH: str = "ELAB_STRICT_VERSION_MATCH"
+KEY_CACHE_TTL: str = "CACHE_TTL"
 
 
 class ElabStrictVersionMatchModes(StrEnum):
@@ -83,9 +84,23 @@ class CacheModel(BaseModel):
 
 @dataclass(frozen=True)
 class CacheFileProperties:
-    expires_in_days: ClassVar[int] = 6 * 60 * 60
-    encoding: ClassVar[str] = "utf-8"
-    indent: ClassVar[int] = 4
-
-
-CACHE_PATH: Path = Path("~/.cache").expanduser() / APP_NAME / f"{APP_NAME}.json"
+    # Seconds a cache entry is considered fresh, unless overridden with KEY_CACHE_TTL
+    default_ttl: ClassVar[int] = 6 * 60 * 60
+    # Seconds an outdated entry can still be served while it is refreshed in the background
+    stale_ttl: ClassVar[int] = 7 * 24 * 60 * 60
+    # An entry older than this fraction of its TTL is refreshed in the background
+    refresh_ahead_ratio: ClassVar[float] = 0.9
+    # Seconds a process holds the right to refresh an entry in the background
+    revalidation_lease: ClassVar[int] = 60
+    # Seconds pending background refreshes are waited for on exit
+    revalidation_join_timeout: ClassVar[float] = 3.0
+    # Seconds a process waits for another process' write lock on the cache database
+    busy_timeout: ClassVar[float] = 10.0
+
+
+ELAB_HOSTS_CACHE_NAMESPACE: str = "elab_hosts"
+PLUGIN_MANIFEST_CACHE_NAMESPACE: str = "plugin_manifests"
+PLUGIN_VENV_CACHE_NAMESPACE: str = "plugin_venvs"
+
+
+CACHE_PATH: Path = Path("~/.cache").expanduser() / APP_NAME / f"{APP_NAME}.sqlite3"
@@ -0,0 +1,35 @@
+from typing import IO, Any, Iterable, Optional, Union
+
+import yaml
+
+try:
+    # C-accelerated classes are only available if PyYAML is built with libyaml
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = [
+    "SafeDumper",
+    "SafeLoader",
+    "YAMLError",
+    "safe_dump",
+    "safe_dump_all",
+    "safe_load",
+]
+
+YAMLError = yaml.YAMLError
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Optional[IO] = None, **kwargs) -> Optional[str]:
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def safe_dump_all(
+    documents: Iterable[Any], stream: Optional[IO] = None, **kwargs
+) -> Optional[str]:
+    return yaml.dump_all(documents, stream, Dumper=SafeDumper, **kwargs)
@@ -1,5 +1,8 @@
 from enum import IntEnum
+from functools import cache
+from importlib import import_module
 from pathlib import Path
+from types import MappingProxyType
 
 
 class ElabUserGroups(IntEnum):
@@ -53,5 +56,17 @@ class ElabVersionDefaults:
         "5.2.0",
         "5.1.15",
     )
-    versions_dir: Path = Path(__file__).parent / "_supported_versions"
-    file_ext: str = "json"
+    bundle_module_name: str = "_supported_versions"
+    bundle_path: Path = Path(__file__).parent / f"{bundle_module_name}.py"
+
+    @classmethod
+    @cache
+    def get_endpoints(cls, version: str) -> MappingProxyType[str, tuple[str, ...]]:
+        """
+        Return the endpoint map of a supported eLabFTW version. The generated
+        bundle is only imported on the first call, and its bytecode is cached
+        by Python like any other module, so no JSON is read at runtime.
+        Raises ``KeyError`` if the version is not in the bundle.
+        """
+        bundle = import_module(f".{cls.bundle_module_name}", __package__)
+        return MappingProxyType(bundle.ENDPOINT_MAPS[bundle.VERSION_INDEX[version]])
@@ -1,16 +1,19 @@
 import json
 import re
 from collections import defaultdict
+from importlib import import_module
+from pprint import pformat
 from typing import Any
 
 import httpx
-import yaml
 from httpx import HTTPError
 
 from .._names import ELAB_BRAND_NAME
+from .._yaml import YAMLError, safe_load
 from ..loggers import Logger
 from ..utils import OpenAPISpecificationException
 from ._names import ElabVersionDefaults
+from ._request_validator import REQUEST_SCHEMAS_MODULE_NAME, get_route_key
 
 logger = Logger()
 
@@ -25,8 +28,8 @@ def read_openapi_spec(url: str) -> dict[str, Any]:
         ) from e
     else:
         try:
-            spec_yaml = yaml.safe_load(spec.text)
-        except yaml.YAMLError as e:
+            spec_yaml = safe_load(spec.text)
+        except YAMLError as e:
             raise OpenAPISpecificationException(
                 f"{ELAB_BRAND_NAME} OpenAPI specification could not parsed "
                 f"as a valid YAML. Exception details: {e}"
@@ -84,17 +87,208 @@ def parse_openapi_spec(spec: dict[str, Any]) -> dict[str, list[str]]:
     return {k: sorted(list(v)) for k, v in sorted(endpoints.items())}
 
 
+_SCHEMA_ANNOTATION_KEYS: frozenset[str] = frozenset(
+    ("description", "example", "examples", "title", "deprecated", "externalDocs")
+)
+
+
+def _resolve_schema(node: Any, spec: dict[str, Any], _refs: frozenset = frozenset()):
+    # Inline every local "$ref" and drop annotation-only keywords,
+    # so the bundled schemas are self-contained and compact.
+    if isinstance(node, dict):
+        if (ref := node.get("$ref")) is not None:
+            if ref in _refs or not ref.startswith("#/"):
+                return {}
+            target = spec
+            try:
+                for part in ref.removeprefix("#/").split("/"):
+                    target = target[part]
+            except KeyError as e:
+                raise OpenAPISpecificationException(
+                    f"The OpenAPI specification reference '{ref}' could not be resolved."
+                ) from e
+            return _resolve_schema(target, spec, _refs | {ref})
+        return {
+            k: (
+                {name: _resolve_schema(_, spec, _refs) for name, _ in v.items()}
+                if k == "properties" and isinstance(v, dict)
+                else _resolve_schema(v, spec, _refs)
+            )
+            for k, v in node.items()
+            if k not in _SCHEMA_ANNOTATION_KEYS
+        }
+    if isinstance(node, list):
+        return [_resolve_schema(_, spec, _refs) for _ in node]
+    return node
+
+
+def parse_openapi_request_schemas(spec: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    route_table: dict[str, dict[str, Any]] = {}
+    try:
+        spec_paths = spec["paths"]
+    except KeyError as e:
+        raise OpenAPISpecificationException(
+            "The OpenAPI specification does not contain the 'paths' field! "
+        ) from e
+    route_pattern = re.compile(r"^/([{}\w\-]+)(/{id})?(/([\w\-]+)(/{subid})?)?$")
+    for path, path_item in spec_paths.items():
+        if not (match := route_pattern.match(path)):
+            continue
+        main_endpoint_name, endpoint_id, _, sub_endpoint_name, sub_endpoint_id = (
+            match.groups()
+        )
+        path_parameters = _resolve_schema(path_item.get("parameters", []), spec)
+        endpoint_names: list[str] = [main_endpoint_name]
+        if main_endpoint_name == "{entity_type}":
+            endpoint_names = next(
+                (
+                    parameter["schema"]["enum"]
+                    for parameter in path_parameters
+                    if parameter.get("name") == "entity_type"
+                ),
+                [],
+            )
+        for method in ("get", "post", "patch", "put", "delete"):
+            if (operation := path_item.get(method)) is None:
+                continue
+            query_properties: dict[str, Any] = {}
+            query_required: list[str] = []
+            for parameter in path_parameters + _resolve_schema(
+                operation.get("parameters", []), spec
+            ):
+                if parameter.get("in") != "query":
+                    continue
+                query_properties[parameter["name"]] = parameter.get("schema", {})
+                if parameter.get("required") is True:
+                    query_required.append(parameter["name"])
+            body_schema = (
+                _resolve_schema(operation.get("requestBody", {}), spec)
+                .get("content", {})
+                .get("application/json", {})
+                .get("schema")
+            )
+            schemas: dict[str, Any] = {}
+            if body_schema:
+                schemas["body"] = body_schema
+            if query_properties:
+                schemas["query"] = {"type": "object", "properties": query_properties}
+                if query_required:
+                    schemas["query"]["required"] = query_required
+            if not schemas:
+                continue
+            for endpoint_name in endpoint_names:
+                route_key = get_route_key(
+                    endpoint_name,
+                    endpoint_id is not None,
+                    sub_endpoint_name,
+                    sub_endpoint_id is not None,
+                )
+                route_table[f"{method.upper()} {route_key}"] = schemas
+    return dict(sorted(route_table.items()))
+
+
+def _load_bundled_request_schemas() -> dict[str, dict[str, dict[str, Any]]]:
+    try:
+        bundle = import_module(f".{REQUEST_SCHEMAS_MODULE_NAME}", __package__)
+    except ImportError:
+        return {}
+    return {
+        version: bundle.ROUTE_TABLES[index]
+        for version, index in bundle.VERSION_INDEX.items()
+    }
+
+
+def render_request_schemas_bundle(
+    versions: dict[str, dict[str, dict[str, Any]]],
+) -> str:
+    route_tables: list[dict[str, dict[str, Any]]] = []
+    version_index: dict[str, int] = {}
+    for version, route_table in versions.items():
+        try:
+            version_index[version] = route_tables.index(route_table)
+        except ValueError:
+            route_tables.append(route_table)
+            version_index[version] = len(route_tables) - 1
+    return (
+        f"# This file is generated by `python -m {__name__}`.\n"
+        "# Do not edit it by hand.\n\n"
+        "ROUTE_TABLES: tuple[dict, ...] = "
+        f"{pformat(tuple(route_tables), sort_dicts=False)}\n"
+        f"VERSION_INDEX: dict[str, int] = {pformat(version_index, sort_dicts=False)}\n"
+    )
+
+
+def _load_bundled_endpoints() -> dict[str, dict[str, list[str]]]:
+    try:
+        bundle = import_module(
+            f".{ElabVersionDefaults.bundle_module_name}", __package__
+        )
+    except ImportError:
+        return {}
+    return {
+        version: {k: list(v) for k, v in bundle.ENDPOINT_MAPS[index].items()}
+        for version, index in bundle.VERSION_INDEX.items()
+    }
+
+
+def render_endpoints_bundle(versions: dict[str, dict[str, list[str]]]) -> str:
+    endpoint_maps: list[dict[str, list[str]]] = []
+    version_index: dict[str, int] = {}
+    for version, endpoints in versions.items():
+        # Most micro versions don't change the API, so identical endpoint
+        # maps are only stored once and shared by index.
+        try:
+            version_index[version] = endpoint_maps.index(endpoints)
+        except ValueError:
+            endpoint_maps.append(endpoints)
+            version_index[version] = len(endpoint_maps) - 1
+    lines: list[str] = [
+        f"# This file is generated by `python -m {__name__}`.",
+        "# Do not edit it by hand.",
+        "",
+        "ENDPOINT_MAPS: tuple[dict[str, tuple[str, ...]], ...] = (",
+    ]
+    for endpoints in endpoint_maps:
+        lines.append("    {")
+        for name, sub_endpoints in endpoints.items():
+            sub_endpoints_repr = ", ".join(json.dumps(_) for _ in sub_endpoints)
+            if len(sub_endpoints) == 1:
+                sub_endpoints_repr += ","
+            lines.append(f"        {json.dumps(name)}: ({sub_endpoints_repr}),")
+        lines.append("    },")
+    lines += [")", "VERSION_INDEX: dict[str, int] = {"]
+    lines += [f"    {json.dumps(k)}: {v}," for k, v in version_index.items()]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
 if __name__ == "__main__":
-    versions_dir = ElabVersionDefaults.versions_dir
+    bundled_versions = _load_bundled_endpoints()
+    bundled_request_schemas = _load_bundled_request_schemas()
+    versions_data: dict[str, dict[str, list[str]]] = {}
+    request_schemas_data: dict[str, dict[str, dict[str, Any]]] = {}
     for version in ElabVersionDefaults.supported_versions:
-        version_file = versions_dir / f"{version}.{ElabVersionDefaults.file_ext}"
-        if version_file.exists():
-            logger.info(f"Version '{version}' already exists in {versions_dir}.")
+        if version in bundled_versions and version in bundled_request_schemas:
+            logger.info(f"Version '{version}' already exists in the bundle.")
+            versions_data[version] = bundled_versions[version]
+            request_schemas_data[version] = bundled_request_schemas[version]
             continue
         loaded_spec = read_openapi_spec(
             f"https://raw.githubusercontent.com/elabftw/elabftw/refs/tags/{version}/apidoc/v2/openapi.yaml"
         )
-        version_file.write_text(
-            json.dumps(parse_openapi_spec(loaded_spec), indent=4), encoding="utf-8"
-        )
-        logger.info(f"Version '{version}' data has been stored in {versions_dir}.")
+        versions_data[version] = parse_openapi_spec(loaded_spec)
+        request_schemas_data[version] = parse_openapi_request_schemas(loaded_spec)
+        logger.info(f"Version '{version}' data has been parsed.")
+    ElabVersionDefaults.bundle_path.write_text(
+        render_endpoints_bundle(versions_data), encoding="utf-8"
+    )
+    request_schemas_path = (
+        ElabVersionDefaults.bundle_path.parent / f"{REQUEST_SCHEMAS_MODULE_NAME}.py"
+    )
+    request_schemas_path.write_text(
+        render_request_schemas_bundle(request_schemas_data), encoding="utf-8"
+    )
+    logger.info(
+        f"Endpoints bundle has been stored in {ElabVersionDefaults.bundle_path}. "
+        f"Request schemas bundle has been stored in {request_schemas_path}."
+    )
@@ -0,0 +1,252 @@
+import re
+from functools import cache
+from importlib import import_module
+from typing import Any, Callable, Optional
+
+from ..loggers import Logger
+
+logger = Logger()
+
+REQUEST_SCHEMAS_MODULE_NAME: str = "_request_schemas"
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list, tuple),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+_QUERY_STRING_CASTS: dict[str, Callable[[str], Any]] = {
+    "integer": int,
+    "number": float,
+    "boolean": lambda value: {"true": True, "false": False, "1": True, "0": False}[
+        value.lower()
+    ],
+}
+
+# A compiled check receives a value and its JSON path, and appends
+# error messages to the list it is given.
+_Check = Callable[[Any, str, list[str]], None]
+
+
+def get_route_key(
+    endpoint_name: str,
+    has_endpoint_id: bool,
+    sub_endpoint_name: Optional[str],
+    has_sub_endpoint_id: bool,
+) -> str:
+    route = endpoint_name.lower()
+    if has_endpoint_id or sub_endpoint_name:
+        route += "/{id}"
+    if sub_endpoint_name:
+        route += f"/{sub_endpoint_name.lower()}"
+        if has_sub_endpoint_id:
+            route += "/{subid}"
+    return route
+
+
+def _is_type(value: Any, type_name: str) -> bool:
+    if isinstance(value, bool) and type_name in ("integer", "number"):
+        return False
+    return isinstance(value, _JSON_TYPES.get(type_name, (object,)))
+
+
+def compile_schema(
+    schema: dict[str, Any], *, from_query_string: bool = False
+) -> _Check:
+    """
+    Compile a (dereferenced) OpenAPI schema into a nested set of closures,
+    so validating a payload does not walk or interpret the schema again.
+    Only the keywords eLabFTW's specification uses are supported; unknown
+    keywords are ignored. With ``from_query_string``, string values are
+    accepted for numeric and boolean types if they can be cast.
+    """
+    checks: list[_Check] = []
+    types: list[str] = (
+        [schema["type"]] if isinstance(schema.get("type"), str) else schema.get("type")
+    ) or []
+    if types and schema.get("nullable") is True:
+        types = [*types, "null"]
+    if types:
+
+        def check_type(value: Any, path: str, errors: list[str]) -> None:
+            if any(_is_type(value, _) for _ in types):
+                return
+            if from_query_string and isinstance(value, str):
+                for type_name in types:
+                    try:
+                        _QUERY_STRING_CASTS[type_name](value)
+                    except (KeyError, ValueError):
+                        continue
+                    return
+            errors.append(f"'{path}' must be of type {' or '.join(types)}.")
+
+        checks.append(check_type)
+    if (enum := schema.get("enum")) is not None:
+        allowed = tuple(enum)
+
+        def check_enum(value: Any, path: str, errors: list[str]) -> None:
+            if value in allowed:
+                return
+            if not from_query_string or str(value) not in map(str, allowed):
+                errors.append(
+                    f"'{path}' must be one of: {', '.join(map(str, allowed))}."
+                )
+
+        checks.append(check_enum)
+    for keyword, compare, message in (
+        ("minimum", float.__ge__, "greater than or equal to"),
+        ("maximum", float.__le__, "less than or equal to"),
+    ):
+        if (limit := schema.get(keyword)) is not None:
+
+            def check_limit(
+                value: Any,
+                path: str,
+                errors: list[str],
+                _limit=float(limit),
+                _compare=compare,
+                _message=message,
+            ) -> None:
+                if _is_type(value, "number") and not _compare(float(value), _limit):
+                    errors.append(f"'{path}' must be {_message} {_limit:g}.")
+
+            checks.append(check_limit)
+    if (pattern := schema.get("pattern")) is not None:
+        compiled_pattern = re.compile(pattern)
+
+        def check_pattern(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, str) and not compiled_pattern.search(value):
+                errors.append(f"'{path}' must match the pattern '{pattern}'.")
+
+        checks.append(check_pattern)
+    if (properties := schema.get("properties")) is not None or schema.get("required"):
+        property_checks: dict[str, _Check] = {
+            name: compile_schema(sub_schema, from_query_string=from_query_string)
+            for name, sub_schema in (properties or {}).items()
+        }
+        required: tuple[str, ...] = tuple(schema.get("required", ()))
+        additional = schema.get("additionalProperties", True)
+        additional_check: Optional[_Check] = (
+            compile_schema(additional, from_query_string=from_query_string)
+            if isinstance(additional, dict)
+            else None
+        )
+
+        def check_object(value: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append(f"'{path}.{name}' is required.")
+            for name, item in value.items():
+                if (check := property_checks.get(name)) is not None:
+                    check(item, f"{path}.{name}", errors)
+                elif additional is False:
+                    errors.append(f"'{path}.{name}' is not an allowed property.")
+                elif additional_check is not None:
+                    additional_check(item, f"{path}.{name}", errors)
+
+        checks.append(check_object)
+    if (items := schema.get("items")) is not None:
+        item_check = compile_schema(items, from_query_string=from_query_string)
+
+        def check_array(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, (list, tuple)):
+                for i, item in enumerate(value):
+                    item_check(item, f"{path}[{i}]", errors)
+
+        checks.append(check_array)
+    for sub_schema in schema.get("allOf", ()):
+        checks.append(compile_schema(sub_schema, from_query_string=from_query_string))
+    for keyword in ("anyOf", "oneOf"):
+        if sub_schemas := schema.get(keyword):
+            alternatives = [
+                compile_schema(_, from_query_string=from_query_string)
+                for _ in sub_schemas
+            ]
+
+            def check_alternatives(
+                value: Any, path: str, errors: list[str], _alternatives=alternatives
+            ) -> None:
+                for alternative in _alternatives:
+                    alternative_errors: list[str] = []
+                    alternative(value, path, alternative_errors)
+                    if not alternative_errors:
+                        return
+                errors.append(f"'{path}' does not match any of the allowed schemas.")
+
+            checks.append(check_alternatives)
+
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        for _check in checks:
+            _check(value, path, errors)
+
+    return check
+
+
+@cache
+def _load_route_table(elab_version: str) -> Optional[dict[str, dict[str, Any]]]:
+    try:
+        bundle = import_module(f".{REQUEST_SCHEMAS_MODULE_NAME}", __package__)
+    except ImportError:
+        logger.debug(
+            "Request schemas bundle is not available. "
+            "Requests will not be validated locally."
+        )
+        return None
+    try:
+        return bundle.ROUTE_TABLES[bundle.VERSION_INDEX[elab_version]]
+    except KeyError:
+        logger.debug(
+            f"Request schemas for version '{elab_version}' are not available. "
+            f"Requests will not be validated locally."
+        )
+        return None
+
+
+@cache
+def get_request_validator(
+    elab_version: str, method: str, route_key: str
+) -> Optional[tuple[Optional[_Check], Optional[_Check]]]:
+    """
+    Return compiled ``(body, query)`` checks for a request, or ``None`` if no
+    schema is known for it. Checks are compiled once per route and reused.
+    """
+    route_table = _load_route_table(elab_version)
+    if route_table is None:
+        return None
+    try:
+        schemas = route_table[f"{method.upper()} {route_key}"]
+    except KeyError:
+        return None
+    body_schema, query_schema = schemas.get("body"), schemas.get("query")
+    return (
+        compile_schema(body_schema) if body_schema is not None else None,
+        (
+            compile_schema(query_schema, from_query_string=True)
+            if query_schema is not None
+            else None
+        ),
+    )
+
+
+def validate_request(
+    elab_version: str,
+    method: str,
+    route_key: str,
+    *,
+    data: Any = None,
+    query: Optional[dict] = None,
+) -> list[str]:
+    validator = get_request_validator(elab_version, method, route_key)
+    errors: list[str] = []
+    if validator is None:
+        return errors
+    body_check, query_check = validator
+    if body_check is not None and data is not None:
+        body_check(data, "data", errors)
+    if query_check is not None and query:
+        query_check(query, "query", errors)
+    return errors
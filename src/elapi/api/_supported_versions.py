@@ -0,0 +1,199 @@
+# This file is generated by `python -m elapi.api._openapi_parser`.
+# Do not edit it by hand.
+
+ENDPOINT_MAPS: tuple[dict[str, tuple[str, ...]], ...] = (
+    {
+        "apikeys": (),
+        "compounds": (),
+        "config": (),
+        "event": (),
+        "events": (),
+        "experiments": (
+            "comments",
+            "compounds",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "experiments_templates": ("revisions", "steps", "tags"),
+        "exports": (),
+        "extra_fields_keys": (),
+        "favtags": (),
+        "idps": (),
+        "import": (),
+        "info": (),
+        "items": (
+            "comments",
+            "compounds",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "items_types": ("steps", "tags"),
+        "reports": (),
+        "teams": (
+            "experiments_categories",
+            "experiments_status",
+            "items_status",
+            "resources_categories",
+            "teamgroups",
+        ),
+        "todolist": (),
+        "unfinished_steps": (),
+        "users": ("notifications", "uploads"),
+    },
+    {
+        "apikeys": (),
+        "compounds": (),
+        "config": (),
+        "event": (),
+        "events": (),
+        "experiments": (
+            "comments",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "experiments_templates": ("revisions", "steps", "tags"),
+        "exports": (),
+        "extra_fields_keys": (),
+        "favtags": (),
+        "idps": (),
+        "import": (),
+        "info": (),
+        "items": (
+            "comments",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "items_types": ("steps", "tags"),
+        "reports": (),
+        "teams": (
+            "experiments_categories",
+            "experiments_status",
+            "items_status",
+            "teamgroups",
+        ),
+        "todolist": (),
+        "unfinished_steps": (),
+        "users": ("notifications", "uploads"),
+    },
+    {
+        "apikeys": (),
+        "config": (),
+        "event": (),
+        "events": (),
+        "experiments": (
+            "comments",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "experiments_templates": ("revisions", "steps", "tags"),
+        "exports": (),
+        "extra_fields_keys": (),
+        "favtags": (),
+        "idps": (),
+        "import": (),
+        "info": (),
+        "items": (
+            "comments",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "items_types": ("steps", "tags"),
+        "reports": (),
+        "teams": (
+            "experiments_categories",
+            "experiments_status",
+            "items_status",
+            "teamgroups",
+        ),
+        "todolist": (),
+        "unfinished_steps": (),
+        "users": ("notifications", "uploads"),
+    },
+    {
+        "apikeys": (),
+        "config": (),
+        "event": (),
+        "events": (),
+        "experiments": (
+            "comments",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "experiments_templates": ("revisions", "steps", "tags"),
+        "exports": (),
+        "extra_fields_keys": (),
+        "favtags": (),
+        "idps": (),
+        "import": (),
+        "info": (),
+        "items": (
+            "comments",
+            "experiments_links",
+            "items_links",
+            "revisions",
+            "steps",
+            "tags",
+            "uploads",
+        ),
+        "items_types": ("steps", "tags"),
+        "teams": (
+            "experiments_categories",
+            "experiments_status",
+            "items_status",
+            "teamgroups",
+        ),
+        "todolist": (),
+        "unfinished_steps": (),
+        "users": ("notifications", "uploads"),
+    },
+)
+VERSION_INDEX: dict[str, int] = {
+    "5.3.9": 0,
+    "5.3.8": 0,
+    "5.3.7": 0,
+    "5.3.6": 0,
+    "5.3.5": 0,
+    "5.3.4": 0,
+    "5.3.3": 0,
+    "5.3.2": 1,
+    "5.3.1": 1,
+    "5.3.0": 1,
+    "5.2.8": 1,
+    "5.2.7": 1,
+    "5.2.6": 1,
+    "5.2.5": 1,
+    "5.2.4": 1,
+    "5.2.3": 1,
+    "5.2.2": 1,
+    "5.2.1": 1,
+    "5.2.0": 2,
+    "5.1.15": 3,
+}
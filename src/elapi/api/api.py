@@ -1,12 +1,11 @@
 import asyncio
-import json
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from functools import cached_property
 from json import JSONDecodeError
 from types import NoneType, NotImplementedType
-from typing import Literal, Optional, Union
+from typing import Literal, Mapping, Optional, Union
 
 # noinspection PyProtectedMember
 import httpx._client as httpx_private_client_module
@@ -29,10 +28,11 @@ from httpx_aiohttp import AiohttpTransport
 from httpx_auth import HeaderApiKey
 from httpx_limiter import AsyncRateLimitedTransport, Rate
 
-from .._core_init import get_cached_data, update_cache
 from .._names import (
     APP_BRAND_NAME,
     ELAB_BRAND_NAME,
+    ELAB_HOSTS_CACHE_NAMESPACE,
+    CacheFileProperties,
     ElabStrictVersionMatchModes,
 )
 from ..configuration import (
@@ -48,6 +48,7 @@ from ..configuration import (
     get_active_api_token,
     get_active_async_capacity,
     get_active_async_rate_limit,
+    get_active_cache_ttl,
     get_active_enable_http2,
     get_active_host,
     get_active_timeout,
@@ -55,11 +56,17 @@ from ..configuration import (
     get_elab_version_mode,
     preventive_missing_warning,
 )
-from ..configuration.config import ELAB_STRICT_VERSION_MATCH_DEFAULT_VAL, APIToken
+from ..configuration.config import (
+    CACHE_TTL_DEFAULT_VAL,
+    ELAB_STRICT_VERSION_MATCH_DEFAULT_VAL,
+    APIToken,
+)
 from ..loggers import Logger
 from ..styles import Missing
 from ..utils import (
+    CacheStore,
     get_app_version,
+    get_or_revalidate,
     update_kwargs_with_defaults,
 )
 from ._names import ElabVersionDefaults
@@ -212,6 +219,11 @@ class SimpleClient(BaseClient):
 class GlobalSharedSession:
     _instance = None
     suppress_override_warning = False
+    # With keep_alive, closing a session leaves its sync client open for the next
+    # session to reuse, e.g., across the commands "elapi daemon" serves.
+    # An async client is still closed, as it cannot outlive its event loop.
+    keep_alive = False
+    _kept_sync_client: Optional[tuple[dict, Client]] = None
 
     class _GlobalSharedSession:
         __slots__ = "_limited_to", "__dict__", "_kwargs"
@@ -240,6 +252,14 @@ class GlobalSharedSession:
         @cached_property
         def sync_client(self) -> Optional[Client]:
             if self.limited_to in ("sync", "all"):
+                if (kept := GlobalSharedSession._kept_sync_client) is not None:
+                    kept_kwargs, client = kept
+                    if kept_kwargs == self._kwargs and client.is_closed is False:
+                        logger.debug(
+                            f"{GlobalSharedSession.__name__} instance {self!r} "
+                            f"reused kept sync client {client!r}."
+                        )
+                        return client
                 client = SimpleClient(is_async_client=False, **self._kwargs)
                 logger.debug(
                     f"{GlobalSharedSession.__name__} instance {self!r} "
@@ -262,7 +282,12 @@ class GlobalSharedSession:
         def close(self) -> None:
             GlobalSharedSession._instance = None
             if self.sync_client is not None:
-                if self.sync_client.is_closed is False:
+                if GlobalSharedSession.keep_alive is True:
+                    GlobalSharedSession._kept_sync_client = (
+                        self._kwargs,
+                        self.sync_client,
+                    )
+                elif self.sync_client.is_closed is False:
                     self.sync_client.close()
                     logger.debug(
                         f"{self.__class__.__name__} has closed sync client {self.sync_client!r}."
@@ -309,6 +334,13 @@ class GlobalSharedSession:
             self._outer_instance.close()
             self._outer_instance = None
 
+    @classmethod
+    def close_kept_sync_client(cls) -> None:
+        if cls._kept_sync_client is not None:
+            _, client = cls._kept_sync_client
+            cls._kept_sync_client = None
+            client.close()
+
     def __new__(
         cls,
         *,
@@ -484,14 +516,8 @@ class ElabFTWURL:
         self.query = query
 
     @classmethod
-    def get_latest_version_endpoints(cls) -> dict[str, list[str]]:
-        latest_version = cls.get_latest_elab_version()
-        version_file = (
-            ElabVersionDefaults.versions_dir
-            / f"{latest_version}.{ElabVersionDefaults.file_ext}"
-        )
-        valid_endpoints = json.loads(version_file.read_text(encoding="utf-8"))
-        return valid_endpoints
+    def get_latest_version_endpoints(cls) -> Mapping[str, tuple[str, ...]]:
+        return ElabVersionDefaults.get_endpoints(cls.get_latest_elab_version())
 
     @staticmethod
     def get_latest_elab_version() -> str:
@@ -509,12 +535,26 @@ class ElabFTWURL:
                 f"Configuration file(s) is incomplete. "
                 f"{ELAB_BRAND_NAME} version cannot be retrieved."
             )
-        cached_data = get_cached_data()
-        cached_elab_version = cached_data.elab_hosts.get(host)
-        if cached_elab_version is not None:
-            elab_version = cached_elab_version
-        else:
-            client = SimpleClient(is_async_client=False)
+        return get_or_revalidate(
+            CacheStore(ELAB_HOSTS_CACHE_NAMESPACE),
+            host,
+            lambda: ElabFTWURL._fetch_elab_version(host, endpoint),
+            ttl=ElabFTWURL.get_elab_hosts_cache_ttl(),
+        )
+
+    @staticmethod
+    def get_elab_hosts_cache_ttl() -> float:
+        cache_ttl = get_active_cache_ttl(skip_validation=True)
+        if not isinstance(cache_ttl, dict):
+            cache_ttl = CACHE_TTL_DEFAULT_VAL
+        ttl = cache_ttl.get(ELAB_HOSTS_CACHE_NAMESPACE, CacheFileProperties.default_ttl)
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool):
+            ttl = CacheFileProperties.default_ttl
+        return ttl
+
+    @staticmethod
+    def _fetch_elab_version(host: str, endpoint: str) -> str:
+        with SimpleClient(is_async_client=False) as client:
             try:
                 elab_server_request = client.get(
                     f"{host}/{endpoint}", headers={"Accept": "application/json"}
@@ -524,27 +564,23 @@ class ElabFTWURL:
                     f"Failed to retrieve '{host}/{endpoint}' response. "
                     f"Exception details: {e!r}."
                 ) from e
-            else:
-                try:
-                    elab_server_info = elab_server_request.json()
-                except JSONDecodeError as e:
-                    raise ElabFTWURLError(
-                        f"Failed to retrieve '{host}/{endpoint}' response. "
-                        f"Exception details: {e!r}. Response status: "
-                        f"{elab_server_request.status_code}"
-                    ) from e
-                else:
-                    elab_version = elab_server_info["elabftw_version"]
-                    cached_data.elab_hosts.update({host: elab_version})
-                    update_cache(cached_data)
-                    logger.debug(
-                        f"ElabFTW version '{elab_version}' retrieved from server '{host}' "
-                        f"has been cached."
-                    )
+        try:
+            elab_server_info = elab_server_request.json()
+        except JSONDecodeError as e:
+            raise ElabFTWURLError(
+                f"Failed to retrieve '{host}/{endpoint}' response. "
+                f"Exception details: {e!r}. Response status: "
+                f"{elab_server_request.status_code}"
+            ) from e
+        elab_version = elab_server_info["elabftw_version"]
+        logger.debug(
+            f"ElabFTW version '{elab_version}' retrieved from server '{host}' "
+            f"will be cached."
+        )
         return elab_version
 
     @classmethod
-    def get_valid_endpoints(cls) -> Optional[dict[str, list[str]]]:
+    def get_valid_endpoints(cls) -> Optional[Mapping[str, tuple[str, ...]]]:
         global _DEBUG_LOG_EMIT_ONCE
         elab_version = cls.get_elab_version()
         if elab_version not in ElabVersionDefaults.supported_versions:
@@ -587,12 +623,7 @@ class ElabFTWURL:
                     return None
 
         else:
-            version_file = (
-                ElabVersionDefaults.versions_dir
-                / f"{elab_version}.{ElabVersionDefaults.file_ext}"
-            )
-            valid_endpoints = json.loads(version_file.read_text(encoding="utf-8"))
-            return valid_endpoints
+            return ElabVersionDefaults.get_endpoints(elab_version)
 
     @property
     def _host(self) -> str:
@@ -705,14 +736,28 @@ class GETRequest(APIRequest):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def _make(self, *args, headers: Optional[dict] = None, **kwargs) -> Response:
+    def _make(
+        self,
+        *args,
+        headers: Optional[dict] = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> Response:
         endpoint_name, endpoint_id, sub_endpoint_name, sub_endpoint_id, query = args
         url = ElabFTWURL(
             endpoint_name, endpoint_id, sub_endpoint_name, sub_endpoint_id, query
         )
-        return super().client.get(
-            url.get(), headers=headers or {"Accept": "application/json"}, **kwargs
-        )
+        headers = headers or {"Accept": "application/json"}
+        if stream:
+            # The body is not read; it must be consumed with Response.iter_bytes
+            # (or similar) and the response closed before the client is closed.
+            client = super().client
+            return client.send(
+                client.build_request("GET", url.get(), headers=headers),
+                stream=True,
+                **kwargs,
+            )
+        return super().client.get(url.get(), headers=headers, **kwargs)
 
     def close(self) -> Optional[NotImplementedType]:
         return super().close()
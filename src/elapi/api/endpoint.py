@@ -1,6 +1,7 @@
-from functools import cached_property
+from functools import cached_property, partial
+from itertools import chain
 from types import NotImplementedType
-from typing import Awaitable, Generator, Iterable, Optional, Union
+from typing import Awaitable, Callable, Generator, Iterable, Optional, Union
 
 from httpx import AsyncClient, Client, Response
 
@@ -239,9 +240,16 @@ class RecursiveGETEndpoint:
         except TypeError:
             raise _error
         else:
-            if not isinstance(next(_iter), dict):
+            try:
+                first_item = next(_iter)
+            except StopIteration:
+                self._source = ()
+                return
+            if not isinstance(first_item, dict):
                 raise _error
-            self._source = value
+            # An iterator (e.g. a generator) would lose its first item
+            # by the check above, so it's put back in front.
+            self._source = chain((first_item,), _iter) if _iter is value else value
 
     @property
     def source_id_prefix(self):
@@ -265,8 +273,19 @@ class RecursiveGETEndpoint:
             )
         self._target_endpoint = value
 
-    def endpoints(self, **kwargs) -> Generator[Awaitable[Response], None, None]:
+    def endpoint_requests(
+        self, **kwargs
+    ) -> Generator[
+        tuple[Union[int, str], Callable[[], Awaitable[Response]]], None, None
+    ]:
+        # Unlike a coroutine, a request factory can be called again to retry
         for item in self.source:
-            yield self.target_endpoint.get(
-                endpoint_id=item[self.source_id_prefix], **kwargs
+            endpoint_id = item[self.source_id_prefix]
+            yield (
+                endpoint_id,
+                partial(self.target_endpoint.get, endpoint_id=endpoint_id, **kwargs),
             )
+
+    def endpoints(self, **kwargs) -> Generator[Awaitable[Response], None, None]:
+        for _, request in self.endpoint_requests(**kwargs):
+            yield request()
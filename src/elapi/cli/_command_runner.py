@@ -0,0 +1,63 @@
+import sys
+import traceback
+from typing import Callable, Self
+
+from .._names import APP_NAME
+from ..api import GlobalSharedSession
+from ..loggers import GlobalLogRecordContainer
+from ..utils import GlobalCLIGracefulCallback, GlobalCLIResultCallback
+
+
+class CommandRunner:
+    def __init__(self, app: Callable):
+        """
+        Run CLI commands with ``app`` one after another in the same process, as
+        "elapi daemon" and "elapi shell" do. Validated configuration is kept
+        between commands, and so is the sync client of ``GlobalSharedSession``
+        while the runner is used as a context manager.
+        """
+        self.app = app
+        # Callbacks are registered once on import, and cleared once they are called.
+        # Those that have already been called, e.g., by the command that has
+        # created the runner, are not called again.
+        self._callbacks = {
+            callback: list(callback.get_callbacks() or ())
+            for callback in (GlobalCLIGracefulCallback(), GlobalCLIResultCallback())
+        }
+
+    def __enter__(self) -> Self:
+        GlobalSharedSession.keep_alive = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        GlobalSharedSession.keep_alive = False
+        GlobalSharedSession.close_kept_sync_client()
+
+    def _reset_cli_state(self) -> None:
+        for callback, functions in self._callbacks.items():
+            # noinspection PyProtectedMember
+            callback._callbacks = list(functions) or None
+            callback.in_a_call = False
+        GlobalLogRecordContainer().data.clear()
+
+    def run(self, args: list[str]) -> int:
+        """
+        Run a command with arguments ``args`` and return its exit code.
+        """
+        # The CLI module checks sys.argv, which it has imported as "argv"
+        sys.argv[:] = [APP_NAME, *args]
+        self._reset_cli_state()
+        try:
+            self.app(args=args, prog_name=APP_NAME)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except (BrokenPipeError, ConnectionResetError):
+            # Output can no longer be written, so it is left to the caller
+            raise
+        except Exception:  # noqa
+            traceback.print_exc()
+            return 1
+        return 0
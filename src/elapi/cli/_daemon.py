@@ -0,0 +1,393 @@
+import ctypes
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Callable, Optional
+
+from rich.console import Console
+
+from .._names import APP_NAME
+from ..loggers import Logger
+from ..styles import stderr_console, stdout_console
+from ._command_runner import CommandRunner
+from ._daemon_client import (
+    DAEMON_CLIENT_ENVIRONMENT_KEYS,
+    FRAME_CANCEL,
+    FRAME_CONTROL,
+    FRAME_EXIT,
+    FRAME_HEADER,
+    FRAME_REFUSED,
+    FRAME_STDERR,
+    FRAME_STDOUT,
+    get_config_fingerprint,
+    get_daemon_socket_path,
+    is_private_directory,
+    read_frame,
+    request_daemon_control,
+)
+
+logger = Logger()
+DAEMON_START_TIMEOUT: float = 15.0  # seconds
+# How often the daemon checks whether it should stop
+DAEMON_POLL_INTERVAL: float = 0.5  # seconds
+
+
+class DaemonError(Exception): ...
+
+
+def send_frame(connection: socket.socket, kind: bytes, payload: bytes) -> None:
+    connection.sendall(FRAME_HEADER.pack(kind, len(payload)) + payload)
+
+
+class _ClientStream(io.RawIOBase):
+    """Forwards writes to one of the client's output streams."""
+
+    def __init__(self, connection: socket.socket, kind: bytes, is_terminal: bool):
+        super().__init__()
+        self._connection = connection
+        self._kind = kind
+        self._is_terminal = is_terminal
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._is_terminal
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        send_frame(self._connection, self._kind, data)
+        return len(data)
+
+
+def _get_client_stream(
+    connection: socket.socket, kind: bytes, is_terminal: bool
+) -> io.TextIOWrapper:
+    return io.TextIOWrapper(
+        io.BufferedWriter(_ClientStream(connection, kind, is_terminal)),
+        encoding="utf-8",
+        errors="replace",
+        line_buffering=True,
+    )
+
+
+def _get_consoles() -> list[Console]:
+    consoles = [stdout_console, stderr_console]
+    for logger_ in logging.Logger.manager.loggerDict.values():
+        for handler in getattr(logger_, "handlers", ()):
+            if isinstance(console := getattr(handler, "console", None), Console):
+                consoles.append(console)
+    return consoles
+
+
+def _sync_consoles() -> None:
+    # Rich detects the color system of a console only once, when it is created,
+    # and remembers FORCE_COLOR. So both are detected again for each client.
+    for console in _get_consoles():
+        # noinspection PyProtectedMember
+        console._force_terminal = None
+        console.no_color = "NO_COLOR" in os.environ
+        # noinspection PyProtectedMember
+        console._color_system = console._detect_color_system()
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    server: "ElapiDaemon"
+
+    def handle(self) -> None:
+        self.server.last_active_at = time.monotonic()
+        try:
+            request: dict = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if "control" in request:
+            self.server.control(request, self.connection)
+        else:
+            self.server.run_command(request, self.connection, self.rfile)
+
+
+class ElapiDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    def __init__(
+        self,
+        app: Callable,
+        socket_path: Path,
+        *,
+        idle_timeout: Optional[float] = None,
+    ):
+        """
+        Serve the commands of the thin client in ``_daemon_client`` with ``app``
+        with a ``CommandRunner``. Each connection is handled in its own thread,
+        but the CLI state is process-wide, so only one command runs at a time.
+        A command that arrives while another one is running is refused, and the
+        client runs it in-process instead of waiting. A command is stopped with
+        KeyboardInterrupt, as Ctrl-C would stop it in-process, when its client
+        cancels it or disconnects. The daemon stops after ``idle_timeout``
+        seconds without a command, if it is given.
+        """
+        self.runner = CommandRunner(app)
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout or None
+        self.fingerprint: dict = get_config_fingerprint(os.getcwd())
+        self.started_at: float = time.time()
+        self.served_count: int = 0
+        self.is_stopping: bool = False
+        self.last_active_at: float = time.monotonic()
+        self._command_lock = threading.Lock()
+        self._interrupt_lock = threading.Lock()
+        self._command_thread_id: Optional[int] = None
+        self._prepare_socket_path()
+        super().__init__(str(socket_path), _DaemonRequestHandler)
+        self.timeout = DAEMON_POLL_INTERVAL
+
+    def _prepare_socket_path(self) -> None:
+        socket_dir = self.socket_path.parent
+        try:
+            socket_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError as e:
+            raise DaemonError(
+                f"Could not create directory {socket_dir} for the daemon socket. "
+                f"Exception details: {e!r}"
+            ) from e
+        if not is_private_directory(socket_dir):
+            raise DaemonError(
+                f"Directory {socket_dir} for the daemon socket must be owned by "
+                f"the current user and must not be accessible by anyone else."
+            )
+        if self.socket_path.exists():
+            if request_daemon_control("status") is not None:
+                raise DaemonError(
+                    f"An {APP_NAME} daemon is already listening on {self.socket_path}."
+                )
+            # Left behind by a daemon that did not stop properly
+            self.socket_path.unlink()
+
+    def get_status(self, fingerprint: Optional[dict] = None) -> dict:
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "started_at": self.started_at,
+            "served_count": self.served_count,
+            "idle_timeout": self.idle_timeout,
+            "is_config_current": fingerprint == self.fingerprint,
+        }
+
+    def control(self, request: dict, connection: socket.socket) -> None:
+        if request["control"] == "stop":
+            self.is_stopping = True
+        status = self.get_status(request.get("fingerprint"))
+        send_frame(connection, FRAME_CONTROL, json.dumps(status).encode())
+
+    def _get_refusal_reason(self, request: dict) -> Optional[str]:
+        if request.get("fingerprint") != self.fingerprint:
+            return "Configuration has changed since the daemon has started."
+        if not isinstance(request.get("argv"), list):
+            return "Invalid command."
+        if not os.path.isdir(request.get("cwd", "")):
+            return "Working directory of the command does not exist."
+        return None
+
+    @staticmethod
+    def _set_async_exception(thread_id: int, exception: Optional[type]) -> None:
+        # The exception is raised in the thread when it next runs Python code.
+        # Passing None clears an exception that has not been raised yet.
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(
+            ctypes.c_ulong(thread_id),
+            None if exception is None else ctypes.py_object(exception),
+        )
+
+    def _interrupt_command(self) -> None:
+        with self._interrupt_lock:
+            if self._command_thread_id is None:
+                return
+            logger.debug("Client has cancelled the running command.")
+            self._set_async_exception(self._command_thread_id, KeyboardInterrupt)
+            self._command_thread_id = None
+
+    def _end_interruptible(self) -> None:
+        # Once this returns, KeyboardInterrupt can no longer be raised in the
+        # command's thread, e.g., while the command's result is sent.
+        try:
+            with self._interrupt_lock:
+                self._command_thread_id = None
+                self._set_async_exception(threading.get_ident(), None)
+        except KeyboardInterrupt:
+            # The command was cancelled just as it finished
+            self._end_interruptible()
+
+    def _watch_client(self, rfile: io.BufferedIOBase) -> None:
+        # The client sends FRAME_CANCEL on Ctrl-C, and the connection is closed
+        # if the client is killed. A command is never kept running for no one.
+        while (frame := read_frame(rfile)) is not None:
+            if frame[0] == FRAME_CANCEL:
+                break
+        self._interrupt_command()
+
+    def run_command(
+        self, request: dict, connection: socket.socket, rfile: io.BufferedIOBase
+    ) -> None:
+        if not self._command_lock.acquire(blocking=False):
+            # Nothing is logged, as the output is redirected to the client
+            # of the running command.
+            try:
+                send_frame(
+                    connection,
+                    FRAME_REFUSED,
+                    b"Daemon is busy with another command.",
+                )
+            except OSError:
+                ...
+            return
+        try:
+            self._run_command(request, connection, rfile)
+        finally:
+            self.last_active_at = time.monotonic()
+            self._command_lock.release()
+
+    def _run_command(
+        self, request: dict, connection: socket.socket, rfile: io.BufferedIOBase
+    ) -> None:
+        if (reason := self._get_refusal_reason(request)) is not None:
+            logger.debug(f"Daemon has refused a command. {reason}")
+            send_frame(connection, FRAME_REFUSED, reason.encode())
+            return
+        stdout = _get_client_stream(
+            connection, FRAME_STDOUT, request.get("stdout_isatty", False)
+        )
+        stderr = _get_client_stream(
+            connection, FRAME_STDERR, request.get("stderr_isatty", False)
+        )
+        cwd = os.getcwd()
+        environment = {
+            key: os.environ.get(key) for key in DAEMON_CLIENT_ENVIRONMENT_KEYS
+        }
+        client_environment: dict = request.get("environment", {})
+        exit_code = 1
+        watcher = threading.Thread(
+            target=self._watch_client, args=(rfile,), daemon=True
+        )
+        try:
+            os.chdir(request["cwd"])
+            for key in DAEMON_CLIENT_ENVIRONMENT_KEYS:
+                if key in client_environment:
+                    os.environ[key] = client_environment[key]
+                else:
+                    os.environ.pop(key, None)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                _sync_consoles()
+                with self._interrupt_lock:
+                    self._command_thread_id = threading.get_ident()
+                watcher.start()
+                try:
+                    exit_code = self.runner.run(request["argv"])
+                except KeyboardInterrupt:
+                    # Raised outside the command's own handling of Ctrl-C
+                    exit_code = 130
+                finally:
+                    self._end_interruptible()
+                try:
+                    stdout.flush()
+                    stderr.flush()
+                except OSError:
+                    ...
+            send_frame(connection, FRAME_EXIT, str(exit_code).encode())
+        except OSError:
+            logger.debug("Client has disconnected before the command finished.")
+        finally:
+            if watcher.is_alive():
+                # Wakes the watcher up, as it reads from the connection
+                try:
+                    connection.shutdown(socket.SHUT_RD)
+                except OSError:
+                    ...
+                watcher.join()
+            self.served_count += 1
+            os.chdir(cwd)
+            for key, value in environment.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            _sync_consoles()
+
+    def handle_timeout(self) -> None:
+        if (
+            self.idle_timeout is None
+            or self._command_lock.locked()
+            or time.monotonic() - self.last_active_at < self.idle_timeout
+        ):
+            return
+        logger.info(
+            f"{APP_NAME} daemon has been idle for {self.idle_timeout} seconds "
+            f"and will stop."
+        )
+        self.is_stopping = True
+
+    def _handle_sigterm(self, *_) -> None:
+        # A running command is finished first, as server_close waits for it
+        self.is_stopping = True
+
+    def serve(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_sigterm)
+        try:
+            with self.runner:
+                while not self.is_stopping:
+                    self.handle_request()
+        except KeyboardInterrupt:
+            ...
+        finally:
+            self.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            logger.info(f"{APP_NAME} daemon has stopped.")
+
+
+def start_daemon(*, idle_timeout: Optional[float] = None) -> dict:
+    """
+    Start a daemon in the background, and return its status once it is listening.
+    """
+    if (status := request_daemon_control("status")) is not None:
+        raise DaemonError(
+            f"An {APP_NAME} daemon (PID {status['pid']}) is already "
+            f"listening on {status['socket']}."
+        )
+    # The terminal size is passed by each client instead
+    environment = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ("COLUMNS", "LINES")
+    }
+    command = [sys.executable, "-m", __package__, "daemon", "run"]
+    if idle_timeout:
+        command += ["--idle-timeout", str(idle_timeout)]
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=environment,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if (status := request_daemon_control("status")) is not None:
+            return status
+        if process.poll() is not None:
+            raise DaemonError(
+                f"{APP_NAME} daemon has exited with code {process.returncode} "
+                f"before it could listen. Run '{APP_NAME} daemon run' "
+                f"to see the error."
+            )
+        time.sleep(0.1)
+    raise DaemonError(
+        f"{APP_NAME} daemon (PID {process.pid}) did not listen on "
+        f"{get_daemon_socket_path()} within {DAEMON_START_TIMEOUT} seconds."
+    )
@@ -0,0 +1,255 @@
+"""
+Thin client of "elapi daemon", used as the "elapi" command's entry point.
+
+A command is forwarded to a running daemon over its Unix domain socket, which
+saves the start-up cost of importing elAPI, loading the configuration and
+validating it against the server. Without a daemon, or if the daemon refuses
+the command, the command runs in-process as usual. This module must only import
+from the standard library, so that forwarding stays cheap.
+"""
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+from pathlib import Path
+from typing import IO, Optional
+
+# Duplicates of elapi._names definitions, as importing it would import pydantic
+_APP_NAME: str = "elapi"
+_CONFIG_FILE_NAME: str = f"{_APP_NAME}.yml"
+_VERSION_FILE_NAME: str = "VERSION"
+
+DAEMON_SOCKET_FILE_NAME: str = "daemon.sock"
+DAEMON_CONNECT_TIMEOUT: float = 0.5  # seconds
+# Commands that do not depend on state only a fresh process has, e.g., they
+# do not read stdin, write configuration or load third-party plugins.
+DAEMON_FORWARDED_COMMANDS: frozenset[str] = frozenset(
+    (
+        "get",
+        "post",
+        "patch",
+        "delete",
+        "batch",
+        "whoami",
+        "version",
+        "show-config",
+    )
+)
+# The client's terminal settings that the daemon applies for the duration of a command
+DAEMON_CLIENT_ENVIRONMENT_KEYS: tuple[str, ...] = (
+    "TERM",
+    "COLORTERM",
+    "NO_COLOR",
+    "FORCE_COLOR",
+    "COLUMNS",
+    "LINES",
+)
+# A frame is a 1-byte kind followed by a 4-byte big-endian payload length
+FRAME_HEADER: struct.Struct = struct.Struct(">cI")
+FRAME_STDOUT: bytes = b"o"
+FRAME_STDERR: bytes = b"e"
+FRAME_EXIT: bytes = b"x"
+FRAME_REFUSED: bytes = b"r"
+FRAME_CONTROL: bytes = b"c"
+# Sent by the client to stop the running command, e.g., on Ctrl-C
+FRAME_CANCEL: bytes = b"k"
+
+
+def get_daemon_socket_path() -> Path:
+    if runtime_dir := os.getenv("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / _APP_NAME / DAEMON_SOCKET_FILE_NAME
+    return (
+        Path(os.getenv("TMPDIR") or "/tmp")
+        / f"{_APP_NAME}-{os.getuid()}"
+        / DAEMON_SOCKET_FILE_NAME
+    )
+
+
+def is_private_directory(path: Path) -> bool:
+    # The socket receives the environment, which can hold an API token.
+    # So it must not be in a directory another user could have created.
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o077
+
+
+def get_config_fingerprint(cwd: str) -> dict:
+    """
+    Return what elAPI configuration depends on at start-up: the configuration
+    files, elAPI version and the environment variables. The daemon only serves
+    a command if the fingerprint is the same as its own from when it started.
+    """
+    files: dict[str, Optional[list]] = {}
+    for name, path in (
+        ("system", Path("/etc") / _CONFIG_FILE_NAME),
+        (
+            "local",
+            Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config"))
+            / _CONFIG_FILE_NAME,
+        ),
+        # The project configuration file is compared by identity, as the
+        # daemon and the client can run in different directories.
+        ("project", Path(cwd) / _CONFIG_FILE_NAME),
+        ("version", Path(__file__).parent.parent / _VERSION_FILE_NAME),
+    ):
+        try:
+            stat = path.stat()
+        except OSError:
+            files[name] = None
+        else:
+            files[name] = [stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns]
+    environment = {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith((f"{_APP_NAME.upper()}_", "DYNACONF_"))
+        or key in ("HOME", "XDG_CONFIG_HOME", "XDG_DATA_HOME", "XDG_DOWNLOAD_DIR")
+    }
+    return {"files": files, "environment": environment}
+
+
+def _get_terminal_size(*streams: IO) -> Optional[os.terminal_size]:
+    for stream in streams:
+        try:
+            return os.get_terminal_size(stream.fileno())
+        except (AttributeError, ValueError, OSError):
+            continue
+    return None
+
+
+def _connect() -> Optional[socket.socket]:
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        # E.g., on Windows
+        return None
+    if not is_private_directory((socket_path := get_daemon_socket_path()).parent):
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(DAEMON_CONNECT_TIMEOUT)
+    try:
+        connection.connect(str(socket_path))
+    except OSError:
+        # No daemon is running, or a stale socket was left behind
+        connection.close()
+        return None
+    connection.settimeout(None)
+    return connection
+
+
+def read_frame(stream: IO[bytes]) -> Optional[tuple[bytes, bytes]]:
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    kind, size = FRAME_HEADER.unpack(header)
+    payload = stream.read(size)
+    if len(payload) < size:
+        return None
+    return kind, payload
+
+
+def request_daemon_control(command: str) -> Optional[dict]:
+    """
+    Send a control command ("status" or "stop") to the daemon. None is returned
+    if no daemon is running.
+    """
+    if (connection := _connect()) is None:
+        return None
+    with connection, connection.makefile("rb") as stream:
+        request = {
+            "control": command,
+            "fingerprint": get_config_fingerprint(os.getcwd()),
+        }
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        if (frame := read_frame(stream)) is None or frame[0] != FRAME_CONTROL:
+            return None
+        return json.loads(frame[1])
+
+
+def run_on_daemon(args: list[str]) -> Optional[int]:
+    """
+    Run a command on the daemon and return its exit code. None is returned if
+    the command must run in-process instead.
+    """
+    if not args or args[0] not in DAEMON_FORWARDED_COMMANDS:
+        # Global options, e.g., "--override-config", are not forwarded either
+        return None
+    if (connection := _connect()) is None:
+        return None
+    terminal_size = _get_terminal_size(sys.stdout, sys.stderr)
+    environment = {
+        key: os.environ[key]
+        for key in DAEMON_CLIENT_ENVIRONMENT_KEYS
+        if key in os.environ
+    }
+    if terminal_size is not None:
+        environment.setdefault("COLUMNS", str(terminal_size.columns))
+        environment.setdefault("LINES", str(terminal_size.lines))
+    request = {
+        "argv": args,
+        "cwd": os.getcwd(),
+        "stdout_isatty": sys.stdout.isatty(),
+        "stderr_isatty": sys.stderr.isatty(),
+        "environment": environment,
+        "fingerprint": get_config_fingerprint(os.getcwd()),
+    }
+    is_cancelled: bool = False
+
+    def cancel_command(*_) -> None:
+        # Ctrl-C stops the command on the daemon, as it would stop it in-process.
+        # Its output is still shown until it has stopped, unless Ctrl-C is
+        # pressed again.
+        nonlocal is_cancelled
+
+        is_cancelled = True
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            connection.sendall(FRAME_HEADER.pack(FRAME_CANCEL, 0))
+        except OSError:
+            ...
+
+    with connection, connection.makefile("rb") as stream:
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        # A signal handler is used instead of catching KeyboardInterrupt,
+        # as the exception could leave a frame partially read.
+        previous_sigint_handler = signal.signal(signal.SIGINT, cancel_command)
+        try:
+            while (frame := read_frame(stream)) is not None:
+                kind, payload = frame
+                if kind == FRAME_STDOUT:
+                    sys.stdout.buffer.write(payload)
+                    sys.stdout.buffer.flush()
+                elif kind == FRAME_STDERR:
+                    sys.stderr.buffer.write(payload)
+                    sys.stderr.buffer.flush()
+                elif kind == FRAME_EXIT:
+                    return int(payload)
+                elif kind == FRAME_REFUSED:
+                    return 130 if is_cancelled else None
+        finally:
+            signal.signal(signal.SIGINT, previous_sigint_handler)
+    # The command may have been partly run, so it is not run again in-process
+    sys.stderr.write(
+        f"{_APP_NAME}: Connection to {_APP_NAME} daemon was lost before "
+        f"the command finished.\n"
+    )
+    return 1
+
+
+def main() -> None:
+    try:
+        exit_code = run_on_daemon(sys.argv[1:])
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except BrokenPipeError:
+        # E.g., output is piped to "head". Python would otherwise
+        # report the broken pipe again when it flushes stdout on exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    if exit_code is not None:
+        sys.exit(exit_code)
+    from .elapi import app
+
+    app(prog_name=_APP_NAME)
@@ -1,11 +1,15 @@
 import importlib.util
 import sys
 from collections import namedtuple
+from functools import partial
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple, Union
+from typing import Callable, Generator, Iterable, List, Optional, Tuple, Union
 
+import click
 import typer
+from typer.core import TyperCommand, TyperGroup
 
+from .._names import PLUGIN_MANIFEST_CACHE_NAMESPACE
 from ..configuration import get_development_mode
 from ..configuration.config import (
     EXTERNAL_LOCAL_PLUGIN_DIR,
@@ -15,14 +19,256 @@ from ..configuration.config import (
     INTERNAL_PLUGIN_TYPER_APP_VAR_NAME,
     ROOT_INSTALLATION_DIR,
 )
-from ..core_validators import Validate, ValidationError, Validator
-from ..loggers import Logger
+from ..core_validators import Exit, Validate, ValidationError, Validator
+from ..loggers import Logger, ResultCallbackHandler
 from ..path import ProperPath
 from ..plugins import __PACKAGE_IDENTIFIER__ as plugins_sub_package_identifier
-from ..utils import SafeCWD, add_message
+from ..plugins.commons.cli_helpers import OrderedCommands, Typer
+from ..utils import (
+    CacheStore,
+    CacheStoreError,
+    GlobalCLIGracefulCallback,
+    GlobalCLIResultCallback,
+    GlobalCLISuperStartupCallback,
+    SafeCWD,
+    add_message,
+    get_app_version,
+)
 
 logger = Logger()
 PluginInfo = namedtuple("PluginInfo", ["plugin_app", "path", "venv", "project_dir"])
+PLUGIN_MANIFEST_FORMAT_VERSION: int = 1
+
+
+def get_plugin_fingerprint(cli_script: Path, *paths: Path) -> list:
+    """
+    Return the sizes and modification times of a plugin's CLI script, the other
+    Python modules next to it and ``paths``. A plugin manifest is only used while
+    the fingerprint stays the same as when the manifest was made.
+    """
+    fingerprint: list = [
+        PLUGIN_MANIFEST_FORMAT_VERSION,
+        get_app_version(),
+        get_development_mode(skip_validation=True) is True,
+    ]
+    for path in sorted({cli_script, *cli_script.parent.glob("*.py"), *paths}):
+        try:
+            stat = path.stat()
+        except OSError:
+            fingerprint.append([str(path), None])
+        else:
+            fingerprint.append([str(path), stat.st_size, stat.st_mtime_ns])
+    return fingerprint
+
+
+def _get_global_callback_state() -> tuple[int, ...]:
+    # A plugin that registers callbacks when it is imported must always be imported
+    return (
+        *(
+            len(callback.get_callbacks() or ())
+            for callback in (
+                GlobalCLIGracefulCallback(),
+                GlobalCLIResultCallback(),
+                GlobalCLISuperStartupCallback(),
+            )
+        ),
+        ResultCallbackHandler.get_client_count(),
+    )
+
+
+def _get_plugin_command(typer_app: typer.Typer, **kwargs) -> click.Command:
+    # The command is built the same way the main app builds its plugins' commands
+    holder = Typer(add_completion=False)
+    holder.add_typer(typer_app, **kwargs)
+    (command,) = typer.main.get_command(holder).commands.values()
+    return command
+
+
+def _get_command_manifest(command: click.Command) -> dict:
+    manifest = {
+        "help": command.help,
+        "short_help": command.short_help,
+        "hidden": command.hidden,
+        "deprecated": command.deprecated,
+        "options": [
+            [param.opts, param.secondary_opts, param.is_flag]
+            for param in command.params
+            if isinstance(param, click.Option) and not param.hidden
+        ],
+        "arguments": [
+            param.name for param in command.params if isinstance(param, click.Argument)
+        ],
+    }
+    if isinstance(command, click.Group):
+        manifest["commands"] = {
+            name: _get_command_manifest(sub_command)
+            for name, sub_command in command.commands.items()
+        }
+    return manifest
+
+
+def _get_placeholder_command(
+    name: str, manifest: dict, *, rich_help_panel: Optional[str] = None
+) -> click.Command:
+    params: list[click.Parameter] = []
+    for opts, secondary_opts, is_flag in manifest["options"]:
+        option = click.Option(opts, is_flag=is_flag)
+        option.secondary_opts = secondary_opts
+        params.append(option)
+    params += [click.Argument([argument]) for argument in manifest["arguments"]]
+    kwargs = {
+        "name": name,
+        "params": params,
+        "help": manifest["help"],
+        "short_help": manifest["short_help"],
+        "hidden": manifest["hidden"],
+        "deprecated": manifest["deprecated"],
+        "rich_help_panel": rich_help_panel,
+    }
+    if (commands := manifest.get("commands")) is not None:
+        return TyperGroup(
+            commands={
+                sub_name: _get_placeholder_command(sub_name, sub_manifest)
+                for sub_name, sub_manifest in commands.items()
+            },
+            **kwargs,
+        )
+    return TyperCommand(**kwargs)
+
+
+def get_plugin_manifest(cli_script: Path, fingerprint: list) -> Optional[dict]:
+    try:
+        manifest = CacheStore(PLUGIN_MANIFEST_CACHE_NAMESPACE).get(str(cli_script))
+    except CacheStoreError as e:
+        logger.debug(f"Plugin manifest for {cli_script} could not be read: {e}")
+        return None
+    if manifest is None or manifest["fingerprint"] != fingerprint:
+        return None
+    return manifest
+
+
+def save_plugin_manifest(
+    cli_script: Path,
+    fingerprint: list,
+    typer_app: Optional[typer.Typer],
+    /,
+    *,
+    has_side_effects: bool,
+) -> None:
+    """
+    Save the names, help texts and options of a plugin's commands, so that the
+    plugin is only imported the next time when one of its commands is called.
+    Plugins without a Typer app, or that register callbacks on import, are
+    always imported, and only that is saved.
+    """
+    manifest: dict = {"fingerprint": fingerprint, "lazy": False}
+    if typer_app is not None and not has_side_effects:
+        command = _get_plugin_command(typer_app)
+        manifest.update(
+            lazy=True, name=command.name, command=_get_command_manifest(command)
+        )
+    try:
+        CacheStore(PLUGIN_MANIFEST_CACHE_NAMESPACE).set(str(cli_script), manifest)
+    except CacheStoreError as e:
+        logger.debug(f"Plugin manifest for {cli_script} could not be saved: {e}")
+
+
+class LazyPlugin:
+    __slots__ = "_loader", "_typer_app", "manifest", "name"
+
+    def __init__(
+        self,
+        name: str,
+        manifest: dict,
+        loader: Callable[[], Optional[typer.Typer]],
+    ):
+        """
+        A plugin whose commands are known from its manifest. The plugin is only
+        imported by ``loader`` when ``load`` is called.
+        """
+        self.name = name
+        self.manifest = manifest
+        self._loader = loader
+        self._typer_app: Optional[typer.Typer] = None
+
+    def load(self) -> typer.Typer:
+        if self._typer_app is None:
+            if (typer_app := self._loader()) is None:
+                raise AttributeError(f"Plugin '{self.name}' has no Typer app.")
+            self._typer_app = typer_app
+        return self._typer_app
+
+
+def get_plugin_name(plugin_app: Union[typer.Typer, LazyPlugin]) -> str:
+    if isinstance(plugin_app, LazyPlugin):
+        return plugin_app.name
+    return plugin_app.info.name
+
+
+class LazyPluginCommands(OrderedCommands):
+    """
+    LazyPluginCommands lists lazy plugins along with the other commands, with
+    their help texts from the plugin manifest. A lazy plugin is only imported
+    once its command is called.
+    """
+
+    lazy_plugins: dict[str, tuple[LazyPlugin, dict]] = {}
+
+    @classmethod
+    def add_lazy_plugin(cls, plugin: LazyPlugin, /, **kwargs) -> None:
+        # kwargs are passed to add_typer when the plugin is loaded
+        cls.lazy_plugins[plugin.name] = plugin, kwargs
+
+    def list_commands(self, ctx: click.Context) -> Iterable[str]:
+        return [
+            *super().list_commands(ctx),
+            *(name for name in self.lazy_plugins if name not in self.commands),
+        ]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if (command := super().get_command(ctx, cmd_name)) is not None:
+            return command
+        try:
+            plugin, kwargs = self.lazy_plugins[cmd_name]
+        except KeyError:
+            return None
+        return _get_placeholder_command(
+            cmd_name,
+            plugin.manifest["command"],
+            rich_help_panel=kwargs.get("rich_help_panel"),
+        )
+
+    def load_plugin_command(self, cmd_name: str) -> click.Command:
+        plugin, kwargs = self.lazy_plugins[cmd_name]
+        logger.debug(f"Plugin '{cmd_name}' will be loaded.")
+        command = self.commands[cmd_name] = _get_plugin_command(plugin.load(), **kwargs)
+        return command
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[Optional[str], Optional[click.Command], list[str]]:
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        if cmd_name in self.lazy_plugins and cmd_name not in self.commands:
+            try:
+                command = self.load_plugin_command(cmd_name)
+            except Exception as e:
+                if get_development_mode(skip_validation=True) is True:
+                    raise e
+                logger.error(
+                    f"Plugin '{cmd_name}' could not be loaded. "
+                    f'Exception details: "{e.__class__.__name__}: {e}"'
+                )
+                raise Exit(1) from e
+        return cmd_name, command, args
+
+
+def add_plugin(
+    main_app: typer.Typer, plugin_app: Union[typer.Typer, LazyPlugin], /, **kwargs
+) -> None:
+    if isinstance(plugin_app, LazyPlugin):
+        LazyPluginCommands.add_lazy_plugin(plugin_app, **kwargs)
+    else:
+        main_app.add_typer(plugin_app, **kwargs)
 
 
 class InternalPluginHandler:
@@ -35,21 +281,43 @@ class InternalPluginHandler:
                     _paths.append((path.name, path))
         return _paths
 
-    def get_typer_apps(self) -> Generator[typer.Typer, None, None]:
+    @staticmethod
+    def load_typer_app(plugin_name: str, path: Path) -> Optional[typer.Typer]:
+        spec = importlib.util.spec_from_file_location(
+            plugin_name,
+            path / INTERNAL_PLUGIN_TYPER_APP_FILE_NAME,
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        module.__package__ = f"{plugins_sub_package_identifier}.{plugin_name}"  # Python will find module relative to __package__ path,
+        # without this module.__package__ change Python will throw an ImportError.
+        spec.loader.exec_module(module)
+        return getattr(module, INTERNAL_PLUGIN_TYPER_APP_VAR_NAME, None)
+
+    def get_typer_apps(
+        self,
+    ) -> Generator[Union[typer.Typer, LazyPlugin, None], None, None]:
         for plugin_name, path in self.plugin_locations:
-            spec = importlib.util.spec_from_file_location(
-                plugin_name,
-                path / INTERNAL_PLUGIN_TYPER_APP_FILE_NAME,
-            )
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[spec.name] = module
-            module.__package__ = f"{plugins_sub_package_identifier}.{plugin_name}"  # Python will find module relative to __package__ path,
-            # without this module.__package__ change Python will throw an ImportError.
-            spec.loader.exec_module(module)
-            try:
-                yield getattr(module, INTERNAL_PLUGIN_TYPER_APP_VAR_NAME)
-            except AttributeError:
-                yield
+            cli_script = path / INTERNAL_PLUGIN_TYPER_APP_FILE_NAME
+            fingerprint = get_plugin_fingerprint(cli_script)
+            manifest = get_plugin_manifest(cli_script, fingerprint)
+            if manifest is not None and manifest["lazy"]:
+                yield LazyPlugin(
+                    manifest["name"],
+                    manifest,
+                    partial(self.load_typer_app, plugin_name, path),
+                )
+                continue
+            callback_state = _get_global_callback_state()
+            typer_app = self.load_typer_app(plugin_name, path)
+            if manifest is None:
+                save_plugin_manifest(
+                    cli_script,
+                    fingerprint,
+                    typer_app,
+                    has_side_effects=callback_state != _get_global_callback_state(),
+                )
+            yield typer_app
 
 
 class ExternalPluginLocationValidator(Validator):
@@ -75,8 +343,7 @@ class ExternalPluginLocationValidator(Validator):
     def validate(self):
         import os
 
-        import yaml
-
+        from .._yaml import YAMLError, safe_load
         from ..configuration import (
             APP_BRAND_NAME,
             CANON_YAML_EXTENSION,
@@ -130,8 +397,8 @@ class ExternalPluginLocationValidator(Validator):
                     ] = True
                     with ProperPath(plugin_metadata_file).open(mode="r") as f:
                         try:
-                            plugin_metadata = yaml.safe_load(f)
-                        except yaml.YAMLError as e:
+                            plugin_metadata = safe_load(f)
+                        except YAMLError as e:
                             raise ValidationError(
                                 f"Plugin {CANON_YAML_EXTENSION.upper()} "
                                 f"metadata file {plugin_metadata_file} exists, "
@@ -310,15 +577,37 @@ class ExternalPluginHandler:
         spec.loader.exec_module(module)
         return module
 
+    @classmethod
+    def load_typer_app(
+        cls,
+        plugin_name: str,
+        cli_script: Path,
+        project_dir: Path,
+        venv_dir: Optional[Path],
+    ) -> Optional[typer.Typer]:
+        from ._venv_state_manager import switch_venv_state
+
+        if venv_dir is not None:
+            switch_venv_state(True, venv_dir, project_dir)
+        try:
+            module = cls.load_plugin(plugin_name, cli_script, project_dir)
+        finally:
+            if venv_dir is not None:
+                switch_venv_state(False, venv_dir, project_dir)
+        typer_app = getattr(module, EXTERNAL_LOCAL_PLUGIN_TYPER_APP_VAR_NAME, None)
+        if typer_app is not None:
+            typer_app.info.name = plugin_name
+        return typer_app
+
     def get_typer_apps(self) -> Generator[Optional[PluginInfo], None, None]:
         import logging
 
         from ..configuration import (
             EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_CLI_SCRIPT_PATH,
-            EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_FILE_EXISTS,
             EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_PLUGIN_NAME,
             EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_PROJECT_PATH,
             EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_VENV_PATH,
+            EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_NAME,
             EXTERNAL_LOCAL_PLUGIN_METADATA_KEY_PLUGIN_ROOT_DIR,
         )
         from ._venv_state_manager import switch_venv_state
@@ -338,108 +627,83 @@ class ExternalPluginHandler:
             project_dir: Path = metadata[
                 EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_PROJECT_PATH
             ]
-            if metadata[EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_FILE_EXISTS] is False:
+            # Virtual environment can only be set in the metadata file
+            venv_dir: Optional[Path] = metadata.get(
+                EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_VENV_PATH
+            )
+            fingerprint = get_plugin_fingerprint(
+                cli_script, plugin_root_dir / EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_NAME
+            )
+            manifest = get_plugin_manifest(cli_script, fingerprint)
+            if manifest is not None and manifest["lazy"]:
+                yield PluginInfo(
+                    LazyPlugin(
+                        plugin_name,
+                        manifest,
+                        partial(
+                            self.load_typer_app,
+                            plugin_name,
+                            cli_script,
+                            project_dir,
+                            venv_dir,
+                        ),
+                    ),
+                    plugin_root_dir,
+                    venv_dir,
+                    project_dir,
+                )
+                continue
+            with_venv: str = (
+                f"with virtual environment {venv_dir} " if venv_dir is not None else ""
+            )
+            if venv_dir is not None:
                 try:
-                    module = self.load_plugin(plugin_name, cli_script, project_dir)
-                except (Exception, BaseException) as e:
-                    if get_development_mode(skip_validation=True) is True:
-                        raise e
+                    switch_venv_state(True, venv_dir, project_dir)
+                except (ValueError, RuntimeError) as e:
                     message: str = (
                         f"An exception occurred while trying to load a local "
-                        f"plugin '{plugin_name}' in path {cli_script}. "
+                        f"plugin '{plugin_name}' {with_venv}in path {cli_script}. "
                         f"Plugin '{plugin_name}' will be ignored. "
                         f'Exception details: "{e.__class__.__name__}: {e}"'
                     )
                     add_message(message, logging.WARNING)
                     yield
-                else:
-                    try:
-                        typer_app: typer.Typer = getattr(
-                            module, EXTERNAL_LOCAL_PLUGIN_TYPER_APP_VAR_NAME
-                        )
-                    except AttributeError:
-                        yield
-                    else:
-                        typer_app.info.name = plugin_name
-                        yield PluginInfo(
-                            typer_app,
-                            plugin_root_dir,
-                            None,
-                            project_dir,
-                        )
-            else:
-                venv_dir: Path = metadata[
-                    EXTERNAL_LOCAL_PLUGIN_METADATA_FILE_KEY_VENV_PATH
-                ]
+                    continue
+            callback_state = _get_global_callback_state()
+            try:
+                module = self.load_plugin(plugin_name, cli_script, project_dir)
+            except (Exception, BaseException) as e:
                 if venv_dir is not None:
-                    try:
-                        switch_venv_state(True, venv_dir, project_dir)
-                    except (ValueError, RuntimeError) as e:
-                        message: str = (
-                            f"An exception occurred while trying to load a local "
-                            f"plugin '{plugin_name}' with virtual environment {venv_dir} "
-                            f"in path {cli_script}. "
-                            f"Plugin '{plugin_name}' will be ignored. "
-                            f'Exception details: "{e.__class__.__name__}: {e}"'
-                        )
-                        add_message(message, logging.WARNING)
-                        yield
-                    else:
-                        try:
-                            module = self.load_plugin(
-                                plugin_name, cli_script, project_dir
-                            )
-                        except (Exception, BaseException) as e:
-                            if get_development_mode(skip_validation=True) is True:
-                                raise e
-                            message: str = (
-                                f"An exception occurred while trying to load a local "
-                                f"plugin '{plugin_name}' with virtual environment {venv_dir} "
-                                f"in path {cli_script}. "
-                                f"Plugin '{plugin_name}' will be ignored. "
-                                f'Exception details: "{e.__class__.__name__}: {e}"'
-                            )
-                            add_message(message, logging.WARNING)
-                            yield
-                        else:
-                            try:
-                                typer_app: typer.Typer = getattr(
-                                    module, EXTERNAL_LOCAL_PLUGIN_TYPER_APP_VAR_NAME
-                                )
-                            except AttributeError:
-                                yield
-                            else:
-                                switch_venv_state(False, venv_dir, project_dir)
-                                typer_app.info.name = plugin_name
-                                yield PluginInfo(
-                                    typer_app, plugin_root_dir, venv_dir, project_dir
-                                )
-                else:
-                    try:
-                        module = self.load_plugin(plugin_name, cli_script, project_dir)
-                    except (Exception, BaseException) as e:
-                        if get_development_mode(skip_validation=True) is True:
-                            raise e
-                        message: str = (
-                            f"An exception occurred while trying to load a local "
-                            f"plugin '{plugin_name}' in path {cli_script}. "
-                            f"Plugin '{plugin_name}' will be ignored. "
-                            f'Exception details: "{e.__class__.__name__}: {e}"'
-                        )
-                        add_message(message, logging.WARNING)
-                        yield
-                    else:
-                        try:
-                            typer_app: typer.Typer = getattr(
-                                module, EXTERNAL_LOCAL_PLUGIN_TYPER_APP_VAR_NAME
-                            )
-                        except AttributeError:
-                            yield
-                        else:
-                            typer_app.info.name = plugin_name
-                            yield PluginInfo(
-                                typer_app, plugin_root_dir, None, project_dir
-                            )
+                    switch_venv_state(False, venv_dir, project_dir)
+                if get_development_mode(skip_validation=True) is True:
+                    raise e
+                message: str = (
+                    f"An exception occurred while trying to load a local "
+                    f"plugin '{plugin_name}' {with_venv}in path {cli_script}. "
+                    f"Plugin '{plugin_name}' will be ignored. "
+                    f'Exception details: "{e.__class__.__name__}: {e}"'
+                )
+                add_message(message, logging.WARNING)
+                yield
+                continue
+            if venv_dir is not None:
+                switch_venv_state(False, venv_dir, project_dir)
+            try:
+                typer_app: typer.Typer = getattr(
+                    module, EXTERNAL_LOCAL_PLUGIN_TYPER_APP_VAR_NAME
+                )
+            except AttributeError:
+                yield
+                continue
+            typer_app.info.name = plugin_name
+            if manifest is None:
+                save_plugin_manifest(
+                    cli_script,
+                    fingerprint,
+                    typer_app,
+                    has_side_effects=callback_state != _get_global_callback_state(),
+                )
+            yield PluginInfo(typer_app, plugin_root_dir, venv_dir, project_dir)
 
 
 internal_plugin_typer_apps = InternalPluginHandler().get_typer_apps()
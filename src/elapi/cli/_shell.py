@@ -0,0 +1,223 @@
+import cmd
+import os
+import shlex
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Optional
+
+import click
+import typer
+
+from .._names import APP_NAME
+from ..loggers import Logger
+from ._command_runner import CommandRunner
+
+try:
+    import readline
+except ImportError:  # E.g., on Windows
+    readline = None
+
+logger = Logger()
+SHELL_HISTORY_FILE_NAME: str = "shell_history"
+SHELL_HISTORY_LENGTH: int = 1000
+SHELL_EXIT_COMMANDS: tuple[str, ...] = ("exit", "quit")
+# Commands that cannot run inside a shell
+SHELL_EXCLUDED_COMMANDS: tuple[str, ...] = ("shell", "daemon")
+SUB_ENDPOINT_OPTION_NAME: str = "--sub"
+
+
+class ElapiShell(cmd.Cmd):
+    prompt = f"{APP_NAME}> "
+
+    def __init__(
+        self,
+        runner: CommandRunner,
+        *,
+        endpoints: Mapping[str, tuple[str, ...]],
+        history_path: Optional[Path] = None,
+        intro: Optional[str] = None,
+    ):
+        """
+        Read commands interactively and run them with ``runner``. Commands are
+        completed from the CLI itself, and endpoint names from ``endpoints``.
+        """
+        super().__init__()
+        self.intro = intro
+        self.runner = runner
+        self.endpoints = endpoints
+        self.history_path = history_path
+        self.root_command: click.Group = typer.main.get_command(runner.app)
+        # Plugins that are not loaded yet are only known to list_commands and get_command
+        self._root_context = click.Context(self.root_command)
+        self.last_exit_code: int = 0
+
+    def emptyline(self) -> bool:
+        # cmd.Cmd would repeat the last command otherwise
+        return False
+
+    def do_EOF(self, _) -> bool:
+        self.stdout.write("\n")
+        return True
+
+    def do_help(self, arg: str) -> None:
+        try:
+            args = shlex.split(arg)
+        except ValueError as e:
+            logger.error(f"Command could not be parsed. {e}.")
+            return
+        self.runner.run([*args, "--help"])
+
+    def default(self, line: str) -> Optional[bool]:
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            logger.error(f"Command could not be parsed. {e}.")
+            return None
+        if not args:
+            return None
+        if args[0] in SHELL_EXIT_COMMANDS:
+            return True
+        if args[0].startswith("-"):
+            logger.error(
+                f"Global options cannot be passed inside {APP_NAME} shell. "
+                f"They can be passed before 'shell' instead, e.g., "
+                f"'{APP_NAME} --OC ... shell', to apply to all commands."
+            )
+            return None
+        if args[0] in SHELL_EXCLUDED_COMMANDS:
+            logger.error(f"'{args[0]}' cannot be run inside {APP_NAME} shell.")
+            return None
+        self.last_exit_code = self.runner.run(args)
+        return None
+
+    def completenames(self, text: str, *ignored) -> list[str]:
+        names = [
+            name
+            for name in self.root_command.list_commands(self._root_context)
+            if name not in SHELL_EXCLUDED_COMMANDS
+        ]
+        names += ["help", *SHELL_EXIT_COMMANDS]
+        return sorted(name for name in names if name.startswith(text))
+
+    @staticmethod
+    def _get_option_names(command: click.Command) -> list[str]:
+        names = ["--help"]
+        for param in command.params:
+            if isinstance(param, click.Option):
+                names += param.opts + param.secondary_opts
+        return names
+
+    def completedefault(self, text: str, line: str, *ignored) -> list[str]:
+        # Completion is based on the words before the one being completed
+        try:
+            words = shlex.split(line[: len(line) - len(text)])
+        except ValueError:
+            return []
+        if words and words[0] in SHELL_EXCLUDED_COMMANDS:
+            return []
+        command: click.Command = self.root_command
+        positionals: list[str] = []
+        expects_value: Optional[str] = None
+        for word in words:
+            if expects_value is not None:
+                expects_value = None
+            elif word.startswith("-"):
+                param = next(
+                    (
+                        _
+                        for _ in command.params
+                        if isinstance(_, click.Option) and word in _.opts
+                    ),
+                    None,
+                )
+                if param is not None and not param.is_flag:
+                    expects_value = word
+            elif isinstance(command, click.Group) and (
+                sub_command := command.get_command(self._root_context, word)
+            ):
+                command = sub_command
+            else:
+                positionals.append(word)
+        if expects_value == SUB_ENDPOINT_OPTION_NAME:
+            if positionals:
+                candidates = list(self.endpoints.get(positionals[0], ()))
+            else:
+                candidates = []
+        elif expects_value is not None:
+            # Values other than endpoint names are not known in advance
+            candidates = []
+        elif text.startswith("-"):
+            candidates = self._get_option_names(command)
+        elif isinstance(command, click.Group):
+            candidates = list(command.list_commands(self._root_context))
+        elif not positionals and any(
+            isinstance(_, click.Argument) and _.name == "endpoint_name"
+            for _ in command.params
+        ):
+            candidates = list(self.endpoints)
+        else:
+            candidates = []
+        return sorted(_ for _ in candidates if _.startswith(text))
+
+    def _load_history(self) -> None:
+        if readline is None or self.history_path is None:
+            return
+        readline.set_history_length(SHELL_HISTORY_LENGTH)
+        try:
+            readline.read_history_file(self.history_path)
+        except FileNotFoundError:
+            ...
+        except OSError as e:
+            logger.debug(f"Shell history {self.history_path} could not be read: {e!r}")
+
+    def _save_history(self) -> None:
+        if readline is None or self.history_path is None:
+            return
+        temporary_path: Optional[str] = None
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            # Commands can have API tokens or other secrets in them. So the
+            # history is written to a file that only the user can read from
+            # the start (mkstemp creates it with 0600), which then replaces
+            # the history file.
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                prefix=f".{self.history_path.name}.", dir=self.history_path.parent
+            )
+            os.close(file_descriptor)
+            readline.write_history_file(temporary_path)
+            os.replace(temporary_path, self.history_path)
+        except OSError as e:
+            logger.warning(
+                f"Shell history could not be saved to {self.history_path}. "
+                f"Exception details: {e!r}"
+            )
+            if temporary_path is not None:
+                Path(temporary_path).unlink(missing_ok=True)
+
+    def run(self) -> int:
+        """
+        Run the shell until it is exited, and return the exit code
+        of the last command.
+        """
+        if self.intro:
+            self.stdout.write(f"{self.intro}\n")
+            # cmdloop would show it again after an interrupt otherwise
+            self.intro = None
+        self._load_history()
+        if readline is not None:
+            # Command and endpoint names contain "-" and "_"
+            readline.set_completer_delims(" \t\n=")
+        try:
+            with self.runner:
+                while True:
+                    try:
+                        self.cmdloop()
+                    except KeyboardInterrupt:
+                        # Discards the line being typed, like other shells
+                        self.stdout.write("\n")
+                    else:
+                        break
+        finally:
+            self._save_history()
+        return self.last_exit_code
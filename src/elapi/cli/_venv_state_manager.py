@@ -1,11 +1,25 @@
+from functools import partial
 from pathlib import Path
 from typing import Union
 
 from ..path import ProperPath
+from ..utils import get_cached_venv_value
 
 VENV_INDICATOR_DIR_NAME: str = "site-packages"
 
 
+def _get_site_packages(venv_dir: Union[Path, ProperPath]) -> list[str]:
+    site_packages = sorted(
+        venv_dir.rglob(VENV_INDICATOR_DIR_NAME), key=lambda x: str(x).lower()
+    )
+    if not site_packages:
+        raise ValueError(
+            f"Could not find '{VENV_INDICATOR_DIR_NAME}' directory in "
+            "virtual environment path."
+        )
+    return [str(path) for path in site_packages]
+
+
 def switch_venv_state(
     state: bool,
     /,
@@ -15,17 +29,12 @@ def switch_venv_state(
     import sys
 
     project_dir = str(project_dir)
-    site_packages = sorted(
-        venv_dir.rglob(VENV_INDICATOR_DIR_NAME), key=lambda x: str(x).lower()
+    # Searching the whole virtual environment is slow, so found
+    # paths are cached until the virtual environment changes.
+    site_packages = get_cached_venv_value(
+        venv_dir, "site_packages", partial(_get_site_packages, venv_dir)
     )
-
-    if not site_packages:
-        raise ValueError(
-            f"Could not find '{VENV_INDICATOR_DIR_NAME}' directory in "
-            "virtual environment path."
-        )
     for unique_dir in site_packages:
-        unique_dir = str(unique_dir)
         if state is True:
             sys.path.insert(1, unique_dir)
             sys.path.insert(1, project_dir)
@@ -42,13 +42,21 @@ __PARAMETERS__doc__ = {
     "endpoint_name": f"Name of an endpoint. Valid endpoints are ({ELAB_BRAND_NAME} {version}): {valid_main_endpoints}. "
                      f"{endpoint_names_message}",
     "endpoint_id_get": "ID for one of the preceding endpoints. If provided, only information associated with that "
-                     "ID will be returned. E.g., user ID, team ID, experiments ID.",
+                     "ID will be returned. E.g., user ID, team ID, experiments ID. --id/-i can be passed multiple "
+                     "times, and also accepts comma-separated IDs and ID ranges, e.g., `--id 1,5 --id 10-20`. "
+                     "Multiple IDs are fetched concurrently, and their responses are combined in the given order.",
+    "ids_from": "Path to a text file with IDs, one ID, comma-separated IDs or ID range per line. "
+                "Text after `#` is ignored. It can be combined with --id/-i.",
     "endpoint_id_post": "ID for a preceding endpoint. If provided, `POST` request will be made against that "
     "specific ID. E.g., events ID,.",
     "endpoint_id_patch": "ID for one of the preceding endpoints. If provided, `PATCH` request will be made "
-                         "against that specific ID. E.g., events ID.",
+                         "against that specific ID. E.g., events ID. --id/-i can be passed multiple times, "
+                         "and also accepts comma-separated IDs and ID ranges, e.g., `--id 1,5 --id 10-20`. "
+                         "Requests for multiple IDs are made concurrently.",
     "endpoint_id_delete": "ID for one of the preceding endpoints. If provided, `DELETE` request will be made "
-                         "against that specific ID. E.g., experiments ID.",
+                         "against that specific ID. E.g., experiments ID. --id/-i can be passed multiple times, "
+                         "and also accepts comma-separated IDs and ID ranges, e.g., `--id 1,5 --id 10-20`. "
+                         "Requests for multiple IDs are made concurrently.",
     "sub_endpoint_name": "Name of a sub-endpoint. Not all endpoints have sub-endpoints. "
                          "'uploads' is the sub-endpoint name of the API URL "
                          "_'https://demo.elabftw.net/api/v2/experiments/1/`uploads`/'_. "
@@ -72,7 +80,11 @@ __PARAMETERS__doc__ = {
     #         f"`{APP_NAME} post teams --name Alpha`.",
     "data": f"HTTP POST data. This works similar to how data is passed to `curl`. E.g., "
             f"`{APP_NAME} post teams -d '{{\"name\": \"Alpha\"}}'`. Instead of a JSON string, "
-            f"a JSON or YAML **file path** can also be passed to --data/-d.",
+            f"a JSON or YAML **file path** can also be passed to --data/-d. "
+            f"To create many resources at once, pass a JSON Lines (`.jsonl`, `.ndjson`) or CSV **file path** "
+            f"with one request body per line. In a CSV file, each cell is parsed as JSON, "
+            f"and kept as a string if it is not valid JSON (e.g., `3` and `true` are a number and "
+            f"a boolean, `Alpha` is a string, and `\"3\"` is the string 3). Empty cells are left out.",
     "file_post": "Send a file with a request. The value for --file can be a string in **JSON** format, or "
                  "a JSON or YAML **file path**. The value must follow "
                  "one of the following structures: `'{\"file\": \"<file path>\"}'`, "
@@ -81,7 +93,11 @@ __PARAMETERS__doc__ = {
                  "`'{\"file\": [\"<file new name>\", \"<file path>\"], \"comment\": \"<file comment>\"}'`.",
     "data_patch": f"Modified data to be sent as HTTP PATCH data. This works similar to how data is passed to `curl`. "
                   f'E.g., `{APP_NAME} patch teams --id <team id> -d \'{{"name": "New team name"}}\'`. '
-                  f'Instead of a JSON string, a JSON or YAML **file path** can also be passed to --data/-d.',
+                  f'Instead of a JSON string, a JSON or YAML **file path** can also be passed to --data/-d. '
+                  f'To modify many resources at once, pass a JSON Lines (`.jsonl`, `.ndjson`) or CSV **file path** '
+                  f'with one request body per line. The "id" key of each body is used as the ID to modify, '
+                  f'and removed from the body. A body without "id" is sent to --id. CSV cells are parsed '
+                  f'the same way as for `{APP_NAME} post --data`.',
     "get_loc": "When _--get-loc_ is passed, if the request is successful, instead of printing the success message, "
                f"{APP_NAME} returns the ID and the URL (separated by comma) of the newly created resource that can "
                f"be used to just modify or do automation with the resource later on. The ID and the URL can be "
@@ -103,7 +119,24 @@ __PARAMETERS__doc__ = {
               f"then data is simply exported to that file. This allows custom file name scheme. "
               f"If _--format/-F_ is absent, then {APP_NAME} can use the file extension as the data format. "
               f"If _--format/-F_ is also present, then file extension is ignored, "
-              f"and --format value takes precedence.\n",
+              f"and --format value takes precedence.\n"
+              f"- If the file path ends with a compression extension, i.e., _'.gz'_ or _'.zst'_, "
+              f"e.g., _'--export <path/to/file.json.gz>'_, the exported data is compressed accordingly. "
+              f"The extension before it is still used as the data format.\n",
+    "export_compress": "Compress exported data with the given compression, i.e., _gzip_ or _zstd_. "
+                       "If _--export_ is a directory path, the compression extension is appended to the "
+                       "generated file name. _zstd_ requires the optional 'zstandard' package.",
+    "query_select": "Select the IDs to modify or delete with a query, as a string in **JSON** format, or a JSON or "
+                    "YAML **file path**. The endpoint listing for that query is requested, and the IDs of the "
+                    "listed items are used. If the query has a _limit_, all pages are requested. "
+                    "It can be combined with --id/-i and --ids-from.",
+    "dry_run": "Show the requests that would be made, as an `elapi batch` manifest, without sending them.",
+    "bulk_results": "File path to append the result of each request to as a JSON line. If the file already has "
+                    "successful results of some of the requests (same endpoint, ID, --sub, --sub-id and data), "
+                    "those requests are skipped, so an interrupted run "
+                    "can be resumed by running the same command again.",
+    "export_per_id": "When multiple IDs are passed, export the response of each ID to its own file "
+                     "in the --export/-e directory, instead of combining them in one file.",
     "export_overwrite": f"If given --export/-e path is a file, but it already **exists**, "
                         f"{APP_NAME} will not overwrite the file by default, and will instead use the "
                         f"fallback location. _--overwrite_ needs to be passed if {APP_NAME} should overwrite "
@@ -112,6 +145,28 @@ __PARAMETERS__doc__ = {
               f"The values are case insensitive. The default format is `{DEFAULT_EXPORT_DATA_FORMAT.upper()}`. "
               "If an unsupported format value is provided then the output format "
               f"falls back to `{DEFAULT_EXPORT_DATA_FORMAT.upper()}`.",
+    "get_data_format": f"Format style for the output. Supported values are: {supported_highlighting_formats}, "
+                       f"and **SQLITE** with --export/-e. "
+                       f"The values are case insensitive. The default format is `{DEFAULT_EXPORT_DATA_FORMAT.upper()}`. "
+                       "If an unsupported format value is provided then the output format "
+                       f"falls back to `{DEFAULT_EXPORT_DATA_FORMAT.upper()}`.",
+    "raw": "Stream the response data as it is sent by the server to the terminal or to the --export path, "
+           "without parsing and formatting it. This is much faster and uses far less memory for large responses. "
+           "_--format/-F_ and _--highlight/-H_ are ignored.",
+    "raw_indent": "Like _--raw_, but JSON response data is indented while it is being streamed, "
+                  "without parsing it. _--raw-indent_ implies _--raw_.",
+    "batch_manifest": "Path to a manifest file of requests. It can be a **JSON Lines**, **CSV**, **JSON** or "
+                      "**YAML** file. Each record can have the keys _verb_ (get, post, patch or delete), "
+                      "_endpoint_, _id_, _sub_, _sub_id_, _query_, _data_ and _headers_. In a CSV manifest, "
+                      "the values of _query_, _data_ and _headers_ are JSON strings.",
+    "batch_results": "File path to write the result of each request to as a JSON line. "
+                     "If _--results_ is not passed, results are printed to the terminal.",
+    "batch_window": "Maximum number of requests in flight at a time. "
+                    "Default is the configured 'async_capacity', or **100**.",
+    "batch_retries": "Number of re-attempts per request on a network error or a server error. "
+                     "POST requests are only retried if the server could not have processed them.",
+    "daemon_idle_timeout": "Stop the daemon after it has not served a command for this many seconds. "
+                           "Pass **0** to keep it running until it is stopped. Default is **3600**.",
     "highlight_syntax": "Enable syntax highlighting for shown output if possible. Default is **False**. "
                         "Tools like `jq` or `less` might behave erratically when syntax highlighted output "
                         "is piped to them.",
@@ -13,12 +13,13 @@ documented in https://doc.elabftw.net/api/v2/ with ease.
 """
 
 import platform
+import re
 import sys
 from enum import StrEnum
 from functools import partial
 from json import JSONDecodeError
 from sys import argv
-from typing import Optional
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional
 
 import click
 import typer
@@ -43,7 +44,6 @@ from ..loggers import (
     ResultCallbackHandler,
     SimpleLogger,
 )
-from ..path import ProperPath
 from ..plugins.commons.cli_helpers import Typer
 from ..plugins.commons.get_whoami import get_whoami
 from ..styles import (
@@ -67,8 +67,11 @@ from ..utils import (
 )
 from ..utils.typer_patches import patch_typer_flag_value
 from ._plugin_handler import (
+    LazyPluginCommands,
     PluginInfo,
+    add_plugin,
     external_local_plugin_typer_apps,
+    get_plugin_name,
     internal_plugin_typer_apps,
 )
 from .doc import __PARAMETERS__doc__ as docs
@@ -106,7 +109,7 @@ def result_callback_wrapper(_, override_config):
                 global_result_callback.call_callbacks()
 
 
-app = Typer(result_callback=result_callback_wrapper)
+app = Typer(result_callback=result_callback_wrapper, cls_=LazyPluginCommands)
 
 
 SENSITIVE_PLUGIN_NAMES: tuple[str, ...] = (
@@ -114,6 +117,7 @@ SENSITIVE_PLUGIN_NAMES: tuple[str, ...] = (
     "show-config",
     "version",
     "clear-cache",
+    "daemon",
 )  # version is no longer a plugin, but it used to be
 SPECIAL_SENSITIVE_PLUGIN_NAMES: tuple[str] = ("show-config",)
 COMMANDS_TO_SKIP_CLI_STARTUP: list = list(SENSITIVE_PLUGIN_NAMES)
@@ -129,6 +133,8 @@ RESERVED_PLUGIN_NAMES: tuple[str, ...] = (
     "idps",
     "import",
     "exports",
+    "daemon",
+    "shell",
     APP_NAME,
 )
 INTERNAL_PLUGIN_NAME_REGISTRY: dict = {}
@@ -348,10 +354,11 @@ def cli_cleanup_for_third_party_plugins(*args, **kwargs):
 logger.debug(f"{APP_NAME} will load internal plugins.")
 for inter_app_obj in internal_plugin_typer_apps:
     if inter_app_obj is not None:
-        app_name = inter_app_obj.info.name
+        app_name = get_plugin_name(inter_app_obj)
         INTERNAL_PLUGIN_NAME_REGISTRY[app_name] = inter_app_obj
-        COMMANDS_TO_SKIP_CLI_STARTUP.append(inter_app_obj.info.name)
-        app.add_typer(
+        COMMANDS_TO_SKIP_CLI_STARTUP.append(app_name)
+        add_plugin(
+            app,
             inter_app_obj,
             rich_help_panel=INTERNAL_PLUGIN_PANEL_NAME,
             callback=cli_startup_for_plugins,
@@ -376,6 +383,8 @@ def disable_plugin(
         if plugin_name == registered_app.typer_instance.info.name:
             main_app.registered_groups.pop(i)
             break
+    else:
+        LazyPluginCommands.lazy_plugins.pop(plugin_name, None)
     help_message = (
         f"🚫️ Disabled{' due to ' + short_reason if short_reason is not None else ''}. "
         f"See `--help` or log file to know more."
@@ -587,6 +596,230 @@ development_mode: false
                 )
 
 
+def _get_export_file_name_stub(
+    endpoint_name: str,
+    endpoint_id: Optional[str],
+    sub_endpoint_name: Optional[str],
+    sub_endpoint_id: Optional[str],
+    query: dict,
+) -> str:
+    import re
+
+    file_name_stub = f"{endpoint_name}_{endpoint_id or ''}_{sub_endpoint_name or ''}_{sub_endpoint_id or ''}"
+    if query:
+        _query_params = "_".join(map(lambda x: f"{x[0]}={x[1]}", query.items()))
+        file_name_stub += f"_query_{_query_params}"
+    return re.sub(r"_{2,}", "_", file_name_stub).rstrip("_")
+
+
+def _get_endpoint_ids(endpoint_ids: list[str], ids_from: Optional[str]) -> list[str]:
+    # IDs can be given as "1", "1,2,3" or as an inclusive range "1-500".
+    # With --ids-from, a file with such values on each line is read too.
+    # Empty lines and text after "#" are ignored. Duplicate IDs are dropped.
+    import re
+
+    from ..path import ProperPath
+
+    values: list[str] = list(endpoint_ids)
+    if ids_from is not None:
+        ids_file = ProperPath(ids_from, err_logger=logger)
+        if not ids_file.expanded.is_file():
+            raise ValueError(
+                f"--ids-from was passed '{ids_from}', but it is not an existing file."
+            )
+        with ids_file.open(mode="r", encoding="utf-8") as f:
+            values.extend(line.split("#", 1)[0] for line in f)
+    ids: dict[str, None] = {}
+    for value in values:
+        for part in map(str.strip, value.split(",")):
+            if not part:
+                continue
+            if id_range := re.fullmatch(r"(\d+)\s*-\s*(\d+)", part):
+                start, end = int(id_range[1]), int(id_range[2])
+                if start > end:
+                    raise ValueError(
+                        f"ID range '{part}' is invalid. "
+                        f"The start of the range must not be greater than the end."
+                    )
+                ids.update(dict.fromkeys(map(str, range(start, end + 1))))
+            else:
+                ids[part] = None
+    return list(ids)
+
+
+def _get_multiple_ids(
+    endpoint_name: str,
+    endpoint_ids: list[str],
+    sub_endpoint_name: Optional[str],
+    sub_endpoint_id: Optional[str],
+    query: dict,
+    headers: dict,
+    *,
+    format,
+    export_dest,
+    export_per_id: bool,
+    export_compression: Optional[str],
+    highlight_syntax: bool,
+) -> Optional[list]:
+    # Fetch all IDs concurrently over the shared async client. Responses are
+    # combined in the given ID order, either to one output or one file per ID.
+    import asyncio
+
+    from rich.progress import Progress
+
+    from ..api import GlobalSharedSession
+    from ..plugins.commons import Batch, Export, SQLiteExport, get_batch_progress
+    from ..styles import FormatError, Highlight
+
+    records = (
+        {
+            "verb": "get",
+            "endpoint": endpoint_name,
+            "id": _id,
+            "sub": sub_endpoint_name,
+            "sub_id": sub_endpoint_id,
+            "query": query,
+            "headers": headers,
+        }
+        for _id in endpoint_ids
+    )
+    failed: dict[str, str] = {}
+    items: list = []
+    exported_count: int = 0
+    export_response = None
+    if export_dest is not None and not export_per_id:
+        export_stub: str = _get_export_file_name_stub(
+            endpoint_name,
+            f"{len(endpoint_ids)}_ids",
+            sub_endpoint_name,
+            sub_endpoint_id,
+            query,
+        )
+        try:
+            if format.name == "sqlite":
+                export_response = SQLiteExport(
+                    export_dest,
+                    file_name_stub=export_stub,
+                    file_extension=format.convention,
+                    format_name=format.name,
+                    table_name=f"{endpoint_name}_{sub_endpoint_name}"
+                    if sub_endpoint_name
+                    else endpoint_name,
+                )
+            else:
+                export_response = Export(
+                    export_dest,
+                    file_name_stub=export_stub,
+                    file_extension=format.convention,
+                    format_name=format.name,
+                    compression=export_compression,
+                )
+        except ValueError as e:
+            logger.error(e)
+            raise Exit(1) from e
+
+    async def iter_items(progress: Progress) -> AsyncIterator:
+        progress_task = progress.add_task(
+            f"Getting {endpoint_name} data:", total=len(endpoint_ids)
+        )
+        async for result in Batch().stream(records, ordered=True):
+            progress.advance(progress_task)
+            if result.success:
+                yield endpoint_ids[result.index - 1], result.response
+            else:
+                failed[endpoint_ids[result.index - 1]] = (
+                    f"{result.error} Response: '{result.response}'"
+                    if result.response is not None
+                    else f"{result.error}"
+                )
+
+    def export_id(_id: str, response: Any) -> None:
+        Export(
+            export_dest,
+            file_name_stub=_get_export_file_name_stub(
+                endpoint_name,
+                _id,
+                sub_endpoint_name,
+                sub_endpoint_id,
+                query,
+            ),
+            file_extension=format.convention,
+            format_name=format.name,
+            compression=export_compression,
+        )(data=format(response), verbose=False)
+
+    async def fetch() -> None:
+        nonlocal exported_count
+        try:
+            with get_batch_progress(console=stderr_console, transient=True) as progress:
+                if export_response is not None:
+
+                    async def iter_responses() -> AsyncIterator:
+                        nonlocal exported_count
+                        async for _, response in iter_items(progress):
+                            exported_count += 1
+                            yield response
+
+                    await export_response.astream(iter_responses(), formatter=format)
+                    return
+                async for _id, response in iter_items(progress):
+                    if export_per_id:
+                        # Formatting and writing to disk would block the
+                        # requests still in flight in the event loop
+                        await asyncio.to_thread(export_id, _id, response)
+                        exported_count += 1
+                        continue
+                    items.append(response)
+        finally:
+            # The async client must be closed in the event loop it was used in
+            await GlobalSharedSession().async_client.aclose()
+
+    try:
+        asyncio.run(fetch())
+    except KeyboardInterrupt as e:
+        logger.error(
+            f"'{KeyboardInterrupt.__name__}' (or similar) aborted the requests."
+        )
+        raise Exit(1) from e
+    except (ValueError, FormatError) as e:
+        logger.error(
+            f"Responses for '{endpoint_name}' could not be exported. "
+            f"Exception details: {e!r}"
+        )
+        raise Exit(1) from e
+    for _id, error in failed.items():
+        logger.warning(
+            f"Request for '{endpoint_name}' data with ID '{_id}' was not successful. "
+            f"{error}"
+        )
+    if export_response is not None:
+        logger.info(
+            f"Responses for {exported_count} '{endpoint_name}' ID(s) are successfully exported to "
+            f"{export_response.destination} in {export_response.format_name} format."
+        )
+    elif export_per_id:
+        logger.info(
+            f"Responses for {exported_count} '{endpoint_name}' ID(s) are successfully exported to "
+            f"{export_dest} in {format.name} format, one file per ID."
+        )
+    else:
+        formatted_data = format(items)
+        if highlight_syntax is True:
+            highlight = Highlight(
+                format.name, package_identifier=styles_package_identifier
+            )
+            highlight.print(formatted_data, stdout_console)
+        else:
+            typer.echo(formatted_data)
+    if failed:
+        logger.error(
+            f"{len(failed)} out of {len(endpoint_ids)} '{endpoint_name}' "
+            f"request(s) were not successful."
+        )
+        raise Exit(1)
+    return items if export_dest is None else None
+
+
 @app.command(
     short_help="Make `GET` requests to eLabFTW endpoints.",
     rich_help_panel=RAW_API_COMMANDS_PANEL_NAME,
@@ -596,9 +829,13 @@ def get(
         str, typer.Argument(help=docs["endpoint_name"], show_default=False)
     ],
     endpoint_id: Annotated[
-        str,
+        Optional[list[str]],
         typer.Option("--id", "-i", help=docs["endpoint_id_get"], show_default=False),
     ] = None,
+    ids_from: Annotated[
+        Optional[str],
+        typer.Option("--ids-from", help=docs["ids_from"], show_default=False),
+    ] = None,
     sub_endpoint_name: Annotated[
         str,
         typer.Option("--sub", help=docs["sub_endpoint_name"], show_default=False),
@@ -613,7 +850,9 @@ def get(
     ] = "{}",
     data_format: Annotated[
         Optional[str],
-        typer.Option("--format", "-F", help=docs["data_format"], show_default=False),
+        typer.Option(
+            "--format", "-F", help=docs["get_data_format"], show_default=False
+        ),
     ] = None,
     highlight_syntax: Annotated[
         Optional[bool],
@@ -639,11 +878,27 @@ def get(
         bool,
         typer.Option("--overwrite", help=docs["export_overwrite"], show_default=False),
     ] = False,
+    export_compression: Annotated[
+        Optional[str],
+        typer.Option("--compress", help=docs["export_compress"], show_default=False),
+    ] = None,
+    export_per_id: Annotated[
+        bool,
+        typer.Option("--export-per-id", help=docs["export_per_id"], show_default=False),
+    ] = False,
+    raw: Annotated[
+        bool,
+        typer.Option("--raw", help=docs["raw"], show_default=False),
+    ] = False,
+    raw_indent: Annotated[
+        bool,
+        typer.Option("--raw-indent", help=docs["raw_indent"], show_default=False),
+    ] = False,
     headers: Annotated[
         Optional[str],
         typer.Option("--headers", help=docs["headers"], show_default=False),
     ] = "{}",
-) -> dict:
+) -> Optional[dict]:
     """
     Make `GET` requests to eLabFTW endpoints as documented in
     [https://doc.elabftw.net/api/v2/](https://doc.elabftw.net/api/v2/).
@@ -659,8 +914,10 @@ def get(
     `$ elapi get users` will return a list of all users.
     <br/>
     `$ elapi get users --id <id>` will return information about the specific user `<id>`.
+    <br/>
+    `$ elapi get experiments --id 1-300 -F jsonl -e` will fetch experiments 1 to 300 concurrently
+    and export them to a single JSON Lines file.
     """
-    import re
     from ssl import SSLError
 
     from httpx import ConnectError
@@ -669,11 +926,31 @@ def get(
     from ..api.validators import HostIdentityValidator
     from ..configuration import get_active_host
     from ..core_validators import Validate
-    from ..plugins.commons import Export, get_structured_data
+    from ..plugins.commons import Export, SQLiteExport, get_structured_data
     from ..plugins.commons.cli_helpers import CLIExport, CLIFormat
     from ..styles import Highlight, NoteText, print_typer_error
+    from ..styles.formats import SQLITE_PACKAGE_IDENTIFIER, JSONFormat, SQLiteFormat
 
-    with GlobalSharedSession(limited_to="sync"):
+    try:
+        endpoint_ids: list[str] = _get_endpoint_ids(endpoint_id or [], ids_from)
+    except ValueError as e:
+        logger.error(e)
+        raise Exit(1) from e
+    has_multiple_ids: bool = len(endpoint_ids) > 1 or ids_from is not None
+    endpoint_id: Optional[str] = endpoint_ids[0] if endpoint_ids else None
+    if raw_indent:
+        raw = True
+    if has_multiple_ids and raw:
+        logger.error("--raw and --raw-indent can only be used with a single --id.")
+        raise Exit(1)
+    if export_per_id and not has_multiple_ids:
+        logger.info("--export-per-id is ignored, as only a single --id is given.")
+    if raw and (data_format is not None or highlight_syntax):
+        logger.info(
+            "When --raw is passed, response data is not parsed, so "
+            "'--format/-F' and '--highlight/-H' are ignored."
+        )
+    with GlobalSharedSession(limited_to="all" if has_multiple_ids else "sync"):
         validate_identity = Validate(HostIdentityValidator())
         validate_identity()
 
@@ -690,14 +967,49 @@ def get(
         data_format, export_dest, export_file_ext = CLIExport(
             data_format, export, export_overwrite
         )
-        if not query:
-            format = CLIFormat(data_format, styles_package_identifier, export_file_ext)
+        if not query or has_multiple_ids:
+            # Responses for multiple IDs are always parsed, so they can be combined
+            format = CLIFormat(
+                data_format,
+                SQLITE_PACKAGE_IDENTIFIER
+                if re.match(SQLiteFormat.pattern(), data_format, flags=re.IGNORECASE)
+                else styles_package_identifier,
+                export_file_ext,
+            )
+            if format.name == "sqlite" and export is None:
+                logger.error(
+                    "SQLite format can only be used with --export/-e, "
+                    "i.e., '--export <path/to/database.sqlite>'."
+                )
+                raise Exit(1)
         else:
             logger.info(
                 "When --query is not empty, formatting with '--format/-F' and highlighting are disabled."
             )
             highlight_syntax = False
             format = CLIFormat("txt", styles_package_identifier, None)
+        if has_multiple_ids:
+            if export_per_id and (export is None or export_dest.kind != "dir"):
+                logger.error(
+                    "--export-per-id can only be used with an --export/-e directory path."
+                )
+                raise Exit(1)
+            if export_per_id and format.name == "sqlite":
+                logger.error("--export-per-id cannot be used with SQLite format.")
+                raise Exit(1)
+            return _get_multiple_ids(
+                endpoint_name,
+                endpoint_ids,
+                sub_endpoint_name,
+                sub_endpoint_id,
+                query,
+                headers,
+                format=format,
+                export_dest=export_dest if export is not None else None,
+                export_per_id=export_per_id,
+                export_compression=export_compression,
+                highlight_syntax=highlight_syntax,
+            )
 
         try:
             session = GETRequest()
@@ -712,6 +1024,7 @@ def get(
                 sub_endpoint_id,
                 query,
                 headers=headers,
+                stream=raw,
             )
         except (AttributeError, TypeError) as e:
             err_msg = (
@@ -737,6 +1050,57 @@ def get(
                 f"Exception details: {e}"
             )
             raise Exit(1) from e
+        if raw:
+            # The response body is streamed while the shared client is still open
+            try:
+                is_json: bool = "json" in raw_response.headers.get("content-type", "")
+                chunks = raw_response.iter_bytes()
+                if raw_indent and is_json:
+                    chunks = JSONFormat.reindent(chunks)
+                if export is not None:
+                    try:
+                        export_response = Export(
+                            export_dest,
+                            file_name_stub=_get_export_file_name_stub(
+                                endpoint_name,
+                                endpoint_id,
+                                sub_endpoint_name,
+                                sub_endpoint_id,
+                                query,
+                            ),
+                            file_extension=JSONFormat.convention if is_json else "bin",
+                            format_name=JSONFormat.name if is_json else "binary",
+                            compression=export_compression,
+                        )
+                    except ValueError as e:
+                        logger.error(e)
+                        raise Exit(1) from e
+                    export_response.stream(chunks)
+                    if not raw_response.is_success:
+                        logger.warning(
+                            "Request was not successful. "
+                            f"Response for '{export_response.file_name_stub}' is exported to "
+                            f"{export_response.destination} anyway in {export_response.format_name} format."
+                        )
+                        raise Exit(1)
+                    logger.info(
+                        f"Response for '{export_response.file_name_stub}' is successfully exported to "
+                        f"{export_response.destination} in {export_response.format_name} format."
+                    )
+                else:
+                    output = (
+                        sys.stdout.buffer
+                        if raw_response.is_success
+                        else sys.stderr.buffer
+                    )
+                    for chunk in chunks:
+                        output.write(chunk)
+                    output.flush()
+                    if not raw_response.is_success:
+                        raise Exit(1)
+            finally:
+                raw_response.close()
+            return None
     try:
         formatted_data = format(response_data := raw_response.json())
         # Because we prioritize the fact that most responses are sent as JSON
@@ -766,17 +1130,39 @@ def get(
             format.name = "binary"
             format.convention = "bin"
             formatted_data = response_data
-        file_name_stub = f"{endpoint_name}_{endpoint_id or ''}_{sub_endpoint_name or ''}_{sub_endpoint_id or ''}"
-        if query:
-            _query_params = "_".join(map(lambda x: f"{x[0]}={x[1]}", query.items()))
-            file_name_stub += f"_query_{_query_params}" if query else ""
-        file_name_stub = re.sub(r"_{2,}", "_", file_name_stub).rstrip("_")
-        export_response = Export(
-            export_dest,
-            file_name_stub=file_name_stub,
-            file_extension=format.convention,
-            format_name=format.name,
+        file_name_stub = _get_export_file_name_stub(
+            endpoint_name, endpoint_id, sub_endpoint_name, sub_endpoint_id, query
         )
+        try:
+            if format.name == "sqlite":
+                export_response = SQLiteExport(
+                    export_dest,
+                    file_name_stub=file_name_stub,
+                    file_extension=format.convention,
+                    format_name=format.name,
+                    table_name=f"{endpoint_name}_{sub_endpoint_name}"
+                    if sub_endpoint_name
+                    else endpoint_name,
+                )
+            else:
+                export_response = Export(
+                    export_dest,
+                    file_name_stub=file_name_stub,
+                    file_extension=format.convention,
+                    format_name=format.name,
+                    compression=export_compression,
+                )
+        except ValueError as e:
+            logger.error(e)
+            raise Exit(1) from e
+        if not raw_response.is_success and isinstance(export_response, SQLiteExport):
+            logger.error(
+                "Request was not successful. "
+                f"Response for '{export_response.file_name_stub}' is not exported to "
+                f"{export_response.destination} so the database is left unchanged. "
+                f"Response status: {raw_response.status_code}."
+            )
+            raise Exit(1)
         if not raw_response.is_success:
             export_response(data=formatted_data, verbose=False)
             logger.warning(
@@ -797,9 +1183,9 @@ def get(
                 format.name, package_identifier=styles_package_identifier
             )
             if not raw_response.is_success:
-                stderr_console.print(highlight(formatted_data))
+                highlight.print(formatted_data, stderr_console)
                 raise Exit(1)
-            stdout_console.print(highlight(formatted_data))
+            highlight.print(formatted_data, stdout_console)
         else:
             if isinstance(response_data, bytes):
                 formatted_data = response_data
@@ -840,6 +1226,14 @@ def post(
         str, typer.Option("--data", "-d", help=docs["data"], show_default=False)
     ] = "{}",
     # data: typer.Context = None,  TODO: To be re-enabled in Python 3.11
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help=docs["dry_run"], show_default=False),
+    ] = False,
+    results_path: Annotated[
+        Optional[str],
+        typer.Option("--results", help=docs["bulk_results"], show_default=False),
+    ] = None,
     file: Annotated[
         str,
         typer.Option("--file", help=docs["file_post"], show_default=False),
@@ -880,6 +1274,10 @@ def post(
     <br/>
     `$ elapi post users -d '{"firstname": "John", "lastname": "Doe", "email": "test_test@itnerd.de"}'`
     will create a new user.
+    <br/>
+    Many resources can be created at once from a JSON Lines or CSV file with one request body per line:
+    <br/>
+    `$ elapi post items -d new_items.jsonl --results created_items.jsonl`
     """
     from ssl import SSLError
 
@@ -891,10 +1289,22 @@ def post(
     from ..configuration import get_active_host
     from ..core_validators import Validate
     from ..path import ProperPath
-    from ..plugins.commons import get_location_from_headers, get_structured_data
+    from ..plugins.commons import (
+        get_location_from_headers,
+        get_structured_data,
+        is_records_file_path,
+        iter_structured_data,
+    )
     from ..styles import Format, Highlight, NoteText, print_typer_error
 
-    with GlobalSharedSession(limited_to="sync"):
+    is_bulk: bool = is_records_file_path(json_) or dry_run or results_path is not None
+    if is_bulk and file != "{}":
+        print_typer_error(
+            "--file cannot be used when many requests are made with a JSON Lines or "
+            "CSV file, --dry-run or --results."
+        )
+        raise Exit(1)
+    with GlobalSharedSession(limited_to="all" if is_bulk else "sync"):
         validate_identity = Validate(HostIdentityValidator())
         validate_identity()
 
@@ -906,6 +1316,22 @@ def post(
             headers: dict = get_structured_data(headers, option_name="--headers")
         except ValueError:
             raise Exit(1)
+        if is_bulk:
+            try:
+                records = iter_structured_data(json_, option_name="--data/-d")
+            except ValueError:
+                raise Exit(1)
+            return _run_bulk_requests(
+                "post",
+                endpoint_name,
+                ((endpoint_id, record) for record in records),
+                sub_endpoint_name,
+                sub_endpoint_id,
+                query,
+                headers,
+                dry_run=dry_run,
+                results_path=results_path,
+            )
         try:
             data: dict = get_structured_data(json_, option_name="--data/-d")
         except ValueError:
@@ -1029,9 +1455,9 @@ def post(
                 format.name, package_identifier=styles_package_identifier
             )
             if not raw_response.is_success:
-                stderr_console.print(highlight(formatted_data))
+                highlight.print(formatted_data, stderr_console)
                 raise Exit(1)
-            stdout_console.print(highlight(formatted_data))
+            highlight.print(formatted_data, stdout_console)
         else:
             if not raw_response.is_success:
                 typer.echo(formatted_data, file=sys.stderr)
@@ -1040,6 +1466,241 @@ def post(
         return formatted_data
 
 
+def _select_endpoint_ids(
+    endpoint_name: str, query_select: str, endpoint_ids: list[str], headers: dict
+) -> list[str]:
+    # IDs of the items an endpoint lists for the --query-select query are added
+    # to the given IDs. If the query has a "limit", the listing is requested page
+    # by page (with "offset") until a page has fewer items than the limit.
+    from ..api import ElabFTWURLError, GETRequest
+    from ..plugins.commons import get_structured_data
+
+    try:
+        query: dict = get_structured_data(query_select, option_name="--query-select")
+    except ValueError:
+        raise Exit(1)
+    ids: dict[str, None] = dict.fromkeys(endpoint_ids)
+    limit: Optional[int] = int(query["limit"]) if query.get("limit") else None
+    offset: int = int(query.get("offset", 0))
+    session = GETRequest()
+    while True:
+        try:
+            response = session(
+                endpoint_name,
+                None,
+                None,
+                None,
+                {**query, "offset": offset} if limit else query,
+                headers=headers,
+            )
+        except ElabFTWURLError as e:
+            logger.error(e)
+            raise Exit(1) from e
+        if not response.is_success:
+            logger.error(
+                f"Request for selecting '{endpoint_name}' with --query-select was not "
+                f"successful. Response status: {response.status_code}. "
+                f"Response: '{response.text}'"
+            )
+            raise Exit(1)
+        try:
+            page = response.json()
+        except JSONDecodeError as e:
+            logger.error(
+                f"Response for selecting '{endpoint_name}' with --query-select "
+                f"could not be parsed as JSON. Exception details: {e!r}"
+            )
+            raise Exit(1) from e
+        if not isinstance(page, list):
+            logger.error(
+                f"--query-select can only be used with endpoints that return a list, "
+                f"but '{endpoint_name}' did not."
+            )
+            raise Exit(1)
+        selected_count: int = len(ids)
+        for item in page:
+            if isinstance(item, dict):
+                for id_key in ("id", "userid"):
+                    if item.get(id_key) is not None:
+                        ids[str(item[id_key])] = None
+                        break
+        if not limit or len(page) < limit or len(ids) == selected_count:
+            # A page without new IDs means "offset" is not supported by the endpoint
+            break
+        offset += limit
+    logger.info(f"{len(ids)} '{endpoint_name}' ID(s) are selected.")
+    return list(ids)
+
+
+def _run_bulk_requests(
+    verb: str,
+    endpoint_name: str,
+    targets: Iterable[tuple[Optional[str], Optional[dict]]],
+    sub_endpoint_name: Optional[str],
+    sub_endpoint_id: Optional[str],
+    query: dict,
+    headers: dict,
+    *,
+    total: Optional[int] = None,
+    dry_run: bool,
+    results_path: Optional[str],
+) -> None:
+    # Make a request for each (ID, data) target concurrently over the shared async
+    # client. Targets are consumed lazily, so they can be read from a large file.
+    # Each result is appended to the results file as a JSON line. Targets that
+    # already have a successful result for the same request (endpoint, ID,
+    # sub-endpoint and data) in that file are skipped, so an interrupted run can
+    # simply be started again with the same results file.
+    import asyncio
+    import json
+
+    from ..api import GlobalSharedSession
+    from ..path import ProperPath
+    from ..plugins.commons import Batch, BatchRequest, get_batch_progress
+
+    def _str_or_none(value) -> Optional[str]:
+        return None if value is None else str(value)
+
+    completed_requests: set[tuple] = set()
+    if results_path is not None:
+        results_path = ProperPath(results_path, kind="file", err_logger=logger)
+        if results_path.expanded.exists():
+            with results_path.open(mode="r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        result = json.loads(line)
+                    except JSONDecodeError:
+                        # Most likely the last line was partially written
+                        # when the previous run was interrupted.
+                        continue
+                    if isinstance(result, dict) and result.get("success") is True:
+                        completed_requests.add(
+                            (
+                                result.get("verb"),
+                                result.get("endpoint"),
+                                _str_or_none(result.get("endpoint_id")),
+                                result.get("sub_endpoint"),
+                                _str_or_none(result.get("sub_endpoint_id")),
+                                result.get("data_digest"),
+                            )
+                        )
+    skipped_count: int = 0
+
+    def get_records() -> Iterator[dict]:
+        nonlocal skipped_count
+
+        for endpoint_id, data in targets:
+            if (
+                completed_requests
+                and (
+                    verb,
+                    endpoint_name,
+                    _str_or_none(endpoint_id),
+                    sub_endpoint_name,
+                    _str_or_none(sub_endpoint_id),
+                    BatchRequest(0, verb, endpoint_name, data=data).data_digest,
+                )
+                in completed_requests
+            ):
+                skipped_count += 1
+                continue
+            yield {
+                "verb": verb,
+                "endpoint": endpoint_name,
+                "id": endpoint_id,
+                "sub": sub_endpoint_name,
+                "sub_id": sub_endpoint_id,
+                "query": query,
+                "data": data,
+                "headers": headers,
+            }
+
+    def log_skipped() -> None:
+        if skipped_count:
+            logger.info(
+                f"{skipped_count} {verb.upper()} request(s) are skipped, as they "
+                f"already have a successful result in '{results_path}'."
+            )
+
+    if dry_run:
+        # Planned requests are shown as an 'elapi batch' manifest
+        planned_count: int = 0
+        for record in get_records():
+            planned_count += 1
+            typer.echo(json.dumps({k: v for k, v in record.items() if v}))
+        log_skipped()
+        stderr_console.print(
+            f"Dry run: {planned_count} {verb.upper()} request(s) would be made. "
+            f"No request was sent.",
+            style="yellow",
+        )
+        return None
+
+    async def run_bulk_requests() -> tuple[int, int]:
+        succeeded = failed = 0
+        results_file = None
+        try:
+            if results_path is not None:
+                results_path.create(verbose=False)
+                results_file = results_path.open(mode="a", encoding="utf-8")
+                if results_file.tell():
+                    # Start on a new line in case the last one was partially written
+                    results_file.write("\n")
+            with get_batch_progress(console=stderr_console) as progress:
+                progress_task = progress.add_task(
+                    f"{verb.upper()} {endpoint_name}:", total=total
+                )
+                async for result in Batch().stream(get_records()):
+                    if result.success:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                        logger.warning(
+                            f"{verb.upper()} request for '{endpoint_name}' with ID "
+                            f"'{result.endpoint_id}' was not successful. {result.error}"
+                        )
+                    if results_file is not None:
+                        results_file.write(result.to_json() + "\n")
+                        results_file.flush()
+                    progress.update(
+                        progress_task,
+                        # Skipped targets are not part of the progress
+                        total=None if total is None else total - skipped_count,
+                        advance=1,
+                    )
+        finally:
+            if results_file is not None:
+                results_file.close()
+            # The async client must be closed in the event loop it was used in
+            await GlobalSharedSession().async_client.aclose()
+        return succeeded, failed
+
+    try:
+        succeeded, failed = asyncio.run(run_bulk_requests())
+    except KeyboardInterrupt as e:
+        logger.error(
+            f"'{KeyboardInterrupt.__name__}' (or similar) aborted the requests."
+            + (
+                f" Run the same command again to resume from '{results_path}'."
+                if results_path is not None
+                else ""
+            )
+        )
+        raise Exit(1) from e
+    log_skipped()
+    if not succeeded + failed:
+        stderr_console.print(f"No {verb.upper()} requests left to make.")
+        return None
+    stderr_console.print(
+        f"{succeeded + failed} {verb.upper()} request(s) completed: "
+        f"{succeeded} succeeded, {failed} failed.",
+        style="green" if not failed else "red",
+    )
+    if failed:
+        raise Exit(1)
+    return None
+
+
 @app.command(
     short_help="Make `PATCH` requests to eLabFTW endpoints.",
     # context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
@@ -1051,9 +1712,25 @@ def patch(
     ],
     *,
     endpoint_id: Annotated[
-        str,
+        Optional[list[str]],
         typer.Option("--id", "-i", help=docs["endpoint_id_patch"], show_default=False),
     ] = None,
+    ids_from: Annotated[
+        Optional[str],
+        typer.Option("--ids-from", help=docs["ids_from"], show_default=False),
+    ] = None,
+    query_select: Annotated[
+        Optional[str],
+        typer.Option("--query-select", help=docs["query_select"], show_default=False),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help=docs["dry_run"], show_default=False),
+    ] = False,
+    results_path: Annotated[
+        Optional[str],
+        typer.Option("--results", help=docs["bulk_results"], show_default=False),
+    ] = None,
     sub_endpoint_name: Annotated[
         str,
         typer.Option("--sub", help=docs["sub_endpoint_name"], show_default=False),
@@ -1101,6 +1778,10 @@ def patch(
     With `elapi` you can run the following to change your email address:
     <br/>
     `$ elapi patch users --id me -d '{"email": "new_email@itnerd.de"}'`.
+    <br/>
+    Many items can be modified at once with multiple IDs, `--ids-from` or `--query-select`:
+    <br/>
+    `$ elapi patch items --ids-from stale_items.txt -d '{"state": 2}' --results archive.jsonl`
     """
     from ssl import SSLError
 
@@ -1110,10 +1791,38 @@ def patch(
     from ..api.validators import HostIdentityValidator
     from ..configuration import get_active_host
     from ..core_validators import Validate
-    from ..plugins.commons import get_structured_data
+    from ..plugins.commons import (
+        get_structured_data,
+        is_records_file_path,
+        iter_structured_data,
+    )
     from ..styles import Format, Highlight, NoteText, print_typer_error
 
-    with GlobalSharedSession(limited_to="sync"):
+    try:
+        endpoint_ids: list[str] = _get_endpoint_ids(endpoint_id or [], ids_from)
+    except ValueError as e:
+        logger.error(e)
+        raise Exit(1) from e
+    has_records: bool = is_records_file_path(json_)
+    if has_records and (
+        len(endpoint_ids) > 1 or ids_from is not None or query_select is not None
+    ):
+        print_typer_error(
+            "A JSON Lines or CSV file passed to --data/-d cannot be combined with "
+            "multiple IDs, --ids-from or --query-select. The ID of each record is "
+            "taken from its 'id' key instead."
+        )
+        raise Exit(1)
+    is_bulk: bool = (
+        has_records
+        or len(endpoint_ids) > 1
+        or ids_from is not None
+        or query_select is not None
+        or dry_run
+        or results_path is not None
+    )
+    endpoint_id: Optional[str] = endpoint_ids[0] if endpoint_ids else None
+    with GlobalSharedSession(limited_to="all" if is_bulk else "sync"):
         validate_identity = Validate(HostIdentityValidator())
         validate_identity()
 
@@ -1125,10 +1834,44 @@ def patch(
             headers: dict = get_structured_data(headers, option_name="--headers")
         except ValueError:
             raise Exit(1)
+        if has_records:
+            try:
+                records = iter_structured_data(json_, option_name="--data/-d")
+            except ValueError:
+                raise Exit(1)
+            return _run_bulk_requests(
+                "patch",
+                endpoint_name,
+                # A record without an "id" key is sent to --id
+                ((record.pop("id", endpoint_id), record) for record in records),
+                sub_endpoint_name,
+                sub_endpoint_id,
+                query,
+                headers,
+                dry_run=dry_run,
+                results_path=results_path,
+            )
         try:
             data: dict = get_structured_data(json_, option_name="--data/-d")
         except ValueError:
             raise Exit(1)
+        if is_bulk:
+            if query_select is not None:
+                endpoint_ids = _select_endpoint_ids(
+                    endpoint_name, query_select, endpoint_ids, headers
+                )
+            return _run_bulk_requests(
+                "patch",
+                endpoint_name,
+                [(_id, data) for _id in endpoint_ids],
+                sub_endpoint_name,
+                sub_endpoint_id,
+                query,
+                headers,
+                total=len(endpoint_ids),
+                dry_run=dry_run,
+                results_path=results_path,
+            )
         try:
             session = PATCHRequest()
         except SSLError as e:
@@ -1193,9 +1936,9 @@ def patch(
                 format.name, package_identifier=styles_package_identifier
             )
             if not raw_response.is_success:
-                stderr_console.print(highlight(formatted_data))
+                highlight.print(formatted_data, stderr_console)
                 raise Exit(1)
-            stdout_console.print(highlight(formatted_data))
+            highlight.print(formatted_data, stdout_console)
         else:
             if not raw_response.is_success:
                 typer.echo(formatted_data, file=sys.stderr)
@@ -1215,9 +1958,25 @@ def delete(
     ],
     *,
     endpoint_id: Annotated[
-        str,
+        Optional[list[str]],
         typer.Option("--id", "-i", help=docs["endpoint_id_delete"], show_default=False),
     ] = None,
+    ids_from: Annotated[
+        Optional[str],
+        typer.Option("--ids-from", help=docs["ids_from"], show_default=False),
+    ] = None,
+    query_select: Annotated[
+        Optional[str],
+        typer.Option("--query-select", help=docs["query_select"], show_default=False),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help=docs["dry_run"], show_default=False),
+    ] = False,
+    results_path: Annotated[
+        Optional[str],
+        typer.Option("--results", help=docs["bulk_results"], show_default=False),
+    ] = None,
     sub_endpoint_name: Annotated[
         str,
         typer.Option("--sub", help=docs["sub_endpoint_name"], show_default=False),
@@ -1265,6 +2024,10 @@ def delete(
     Run the following to delete a tag:
     <br/>
     `$ elapi delete experiments -i <experiment ID> --sub tags --sub-id <tag ID>`
+    <br/>
+    Run the following to see which items would be deleted by a selection, without deleting them:
+    <br/>
+    `$ elapi delete items --query-select '{"q": "draft", "limit": 500}' --dry-run`
     """
     from ssl import SSLError
 
@@ -1277,7 +2040,20 @@ def delete(
     from ..plugins.commons import get_structured_data
     from ..styles import Format, Highlight, NoteText, print_typer_error
 
-    with GlobalSharedSession(limited_to="sync"):
+    try:
+        endpoint_ids: list[str] = _get_endpoint_ids(endpoint_id or [], ids_from)
+    except ValueError as e:
+        logger.error(e)
+        raise Exit(1) from e
+    is_bulk: bool = (
+        len(endpoint_ids) > 1
+        or ids_from is not None
+        or query_select is not None
+        or dry_run
+        or results_path is not None
+    )
+    endpoint_id: Optional[str] = endpoint_ids[0] if endpoint_ids else None
+    with GlobalSharedSession(limited_to="all" if is_bulk else "sync"):
         validate_identity = Validate(HostIdentityValidator())
         validate_identity()
 
@@ -1289,6 +2065,23 @@ def delete(
             headers: dict = get_structured_data(headers, option_name="--headers")
         except ValueError:
             raise Exit(1)
+        if is_bulk:
+            if query_select is not None:
+                endpoint_ids = _select_endpoint_ids(
+                    endpoint_name, query_select, endpoint_ids, headers
+                )
+            return _run_bulk_requests(
+                "delete",
+                endpoint_name,
+                [(_id, None) for _id in endpoint_ids],
+                sub_endpoint_name,
+                sub_endpoint_id,
+                query,
+                headers,
+                total=len(endpoint_ids),
+                dry_run=dry_run,
+                results_path=results_path,
+            )
         try:
             session = DELETERequest()
         except SSLError as e:
@@ -1352,9 +2145,9 @@ def delete(
                 format.name, package_identifier=styles_package_identifier
             )
             if not raw_response.is_success:
-                stderr_console.print(highlight(formatted_data))
+                highlight.print(formatted_data, stderr_console)
                 raise Exit(1)
-            stdout_console.print(highlight(formatted_data))
+            highlight.print(formatted_data, stdout_console)
         else:
             if not raw_response.is_success:
                 typer.echo(formatted_data, file=sys.stderr)
@@ -1363,6 +2156,117 @@ def delete(
         return formatted_data
 
 
+@app.command(
+    short_help="Make many requests to eLabFTW endpoints concurrently from a manifest.",
+    rich_help_panel=RAW_API_COMMANDS_PANEL_NAME,
+)
+def batch(
+    manifest: Annotated[
+        str, typer.Argument(help=docs["batch_manifest"], show_default=False)
+    ],
+    *,
+    results_path: Annotated[
+        Optional[str],
+        typer.Option("--results", "-r", help=docs["batch_results"], show_default=False),
+    ] = None,
+    window: Annotated[
+        Optional[int],
+        typer.Option(
+            "--window", "-w", min=1, help=docs["batch_window"], show_default=False
+        ),
+    ] = None,
+    retries: Annotated[
+        int,
+        typer.Option("--retries", min=0, help=docs["batch_retries"]),
+    ] = 3,
+) -> None:
+    """
+    Run the requests of a manifest file concurrently over one connection pool,
+    with the configured async rate limit. The result of each request is written
+    as a JSON line as soon as it completes, with its manifest record number as _index_.
+
+    <br/>
+    **Example**:
+    <br/>
+    With a JSON Lines manifest `changes.jsonl` that looks like the following:
+    <br/>
+    `{"verb": "patch", "endpoint": "items", "id": 12, "data": {"title": "New title"}}`
+    <br/>
+    `{"verb": "post", "endpoint": "experiments", "data": {"title": "New experiment"}}`
+    <br/>
+    Run the following to make all requests and keep a log of their results:
+    <br/>
+    `$ elapi batch changes.jsonl --results changes-results.jsonl`
+    """
+    import asyncio
+
+    from ..api import GlobalSharedSession
+    from ..api.validators import HostIdentityValidator
+    from ..core_validators import Validate
+    from ..path import ProperPath
+    from ..plugins.commons import Batch, get_batch_progress, iter_structured_data
+
+    try:
+        records = iter_structured_data(manifest, option_name="MANIFEST")
+    except ValueError:
+        raise Exit(1)
+    results_file = None
+    if results_path is not None:
+        results_path = ProperPath(results_path, kind="file", err_logger=logger)
+        results_path.create(verbose=False)
+        results_file = results_path.open(mode="w", encoding="utf-8")
+    show_progress: bool = results_file is not None or not sys.stdout.isatty()
+
+    async def run_batch() -> tuple[int, int]:
+        succeeded = failed = 0
+        try:
+            with get_batch_progress(
+                console=stderr_console,
+                transient=True,
+                disable=not show_progress,
+            ) as progress:
+                progress_task = progress.add_task("Running requests:", total=None)
+                async for result in Batch(retries=retries).stream(
+                    records, window=window
+                ):
+                    if result.success:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                    if results_file is not None:
+                        results_file.write(result.to_json() + "\n")
+                        results_file.flush()
+                    else:
+                        typer.echo(result.to_json())
+                    progress.advance(progress_task)
+        finally:
+            # The async client must be closed in the event loop it was used in
+            await GlobalSharedSession().async_client.aclose()
+        return succeeded, failed
+
+    with GlobalSharedSession(limited_to="all"):
+        validate_identity = Validate(HostIdentityValidator())
+        validate_identity()
+        try:
+            succeeded, failed = asyncio.run(run_batch())
+        except KeyboardInterrupt as e:
+            logger.error(
+                f"'{KeyboardInterrupt.__name__}' (or similar) aborted the batch. "
+                f"Requests that had completed are logged in the results."
+            )
+            raise Exit(1) from e
+        finally:
+            if results_file is not None:
+                results_file.close()
+    stderr_console.print(
+        f"{succeeded + failed} request(s) completed: "
+        f"{succeeded} succeeded, {failed} failed.",
+        style="green" if not failed else "red",
+    )
+    if failed:
+        raise Exit(1)
+
+
 @app.command(name="show-config")
 def show_config(
     no_keys: Annotated[
@@ -1382,16 +2286,20 @@ def show_config(
 @app.command(name="clear-cache", short_help="Clear cache.")
 def clear_cache() -> None:
     """
-    Clear elAPI cache file. Running this command will just remove the cache file.
+    Clear elAPI cache. Running this command will remove all entries from the cache database.
     Run this command if elAPI detected eLabFTW version is incorrect.
     """
     from .._names import CACHE_PATH
+    from ..utils import CacheStore, CacheStoreError
 
+    if not CACHE_PATH.exists():
+        logger.error(f"Cache is already empty. Cache file {CACHE_PATH} does not exist.")
+        raise Exit(1)
     try:
-        ProperPath(CACHE_PATH).remove()
-    except FileNotFoundError as file_404_exc:
-        logger.error(f"Cache is already empty. Exception: {file_404_exc}")
-        raise Exit(1) from file_404_exc
+        CacheStore.clear_all()
+    except CacheStoreError as e:
+        logger.error(e)
+        raise Exit(1) from e
     logger.info(f"{APP_NAME} cache in {CACHE_PATH} is cleared.")
 
 
@@ -1474,6 +2382,139 @@ def whoami() -> None:
     stdout_console.print(Markdown(formatted_whoami_info))
 
 
+@app.command(name="shell", short_help=f"Run {APP_NAME} commands interactively.")
+def shell() -> None:
+    """
+    Run elAPI commands interactively, e.g., `get experiments --id 42`. Configuration
+    is loaded and validated once, and the connection to the server is reused between
+    commands. Press Tab to complete command, option and endpoint names. Global options
+    passed before `shell`, e.g., `elapi --OC '{"timeout": 10}' shell`, apply to all
+    commands. Exit with `exit` or Ctrl+D.
+    """
+    from ..configuration import APP_DATA_DIR, get_active_host
+    from ._command_runner import CommandRunner
+    from ._shell import SHELL_HISTORY_FILE_NAME, ElapiShell
+    from .doc import valid_endpoints
+
+    elapi_shell = ElapiShell(
+        CommandRunner(app),
+        endpoints=valid_endpoints,
+        history_path=APP_DATA_DIR / SHELL_HISTORY_FILE_NAME,
+        intro=f"{APP_NAME} shell for {get_active_host()}. "
+        f"Type 'help' to list commands, and 'exit' to quit.",
+    )
+    raise Exit(elapi_shell.run())
+
+
+daemon_app = Typer(
+    name="daemon",
+    help=f"Manage {APP_NAME} daemon that serves commands with warm configuration "
+    f"and connections.",
+)
+app.add_typer(daemon_app)
+DAEMON_IDLE_TIMEOUT_DEFAULT: float = 3600
+
+
+@daemon_app.command(
+    name="start", short_help=f"Start {APP_NAME} daemon in the background."
+)
+def daemon_start(
+    idle_timeout: Annotated[
+        float,
+        typer.Option(
+            "--idle-timeout", help=docs["daemon_idle_timeout"], show_default=False
+        ),
+    ] = DAEMON_IDLE_TIMEOUT_DEFAULT,
+) -> None:
+    """
+    Start elAPI daemon in the background. While the daemon is running, commands
+    `get`, `post`, `patch`, `delete`, `batch`, `whoami`, `version` and `show-config`
+    are run by the daemon, which keeps the validated configuration and a connection
+    to the server between commands. Any other command, a command that passes
+    `--override-config`, or a command that runs after a configuration file or
+    an `ELAPI_*` environment variable has changed, is run without the daemon.
+    """
+    from ._daemon import DaemonError, start_daemon
+
+    try:
+        status = start_daemon(idle_timeout=idle_timeout)
+    except DaemonError as e:
+        logger.error(e)
+        raise Exit(1) from e
+    logger.info(
+        f"{APP_NAME} daemon (PID {status['pid']}) is listening on {status['socket']}."
+    )
+
+
+@daemon_app.command(name="stop", short_help=f"Stop {APP_NAME} daemon.")
+def daemon_stop() -> None:
+    """
+    Stop elAPI daemon. A command the daemon is running is finished first.
+    """
+    from ._daemon_client import request_daemon_control
+
+    if (status := request_daemon_control("stop")) is None:
+        logger.info(f"{APP_NAME} daemon is not running.")
+        return
+    logger.info(f"{APP_NAME} daemon (PID {status['pid']}) is stopping.")
+
+
+@daemon_app.command(name="status", short_help=f"Show status of {APP_NAME} daemon.")
+def daemon_status() -> None:
+    """
+    Show status of elAPI daemon. Exits with code 1 if the daemon is not running.
+    """
+    from datetime import datetime
+
+    from ._daemon_client import request_daemon_control
+
+    if (status := request_daemon_control("status")) is None:
+        stdout_console.print(f"{APP_NAME} daemon is not running.")
+        raise Exit(1)
+    started_at = datetime.fromtimestamp(status["started_at"]).isoformat(" ", "seconds")
+    idle_timeout = status["idle_timeout"]
+    stdout_console.print(
+        f"{APP_NAME} daemon is running.\n"
+        f"PID: {status['pid']}\n"
+        f"Socket: {status['socket']}\n"
+        f"Started at: {started_at}\n"
+        f"Commands served: {status['served_count']}\n"
+        f"Idle timeout: {f'{idle_timeout} seconds' if idle_timeout else 'None'}",
+        highlight=False,
+    )
+    if not status["is_config_current"]:
+        logger.warning(
+            f"Configuration has changed since {APP_NAME} daemon has started, so "
+            f"commands will not be run by the daemon. "
+            f"Run '{APP_NAME} daemon stop' and '{APP_NAME} daemon start' "
+            f"to use the new configuration."
+        )
+
+
+@daemon_app.command(name="run", short_help=f"Run {APP_NAME} daemon in the foreground.")
+def daemon_run(
+    idle_timeout: Annotated[
+        float,
+        typer.Option(
+            "--idle-timeout", help=docs["daemon_idle_timeout"], show_default=False
+        ),
+    ] = DAEMON_IDLE_TIMEOUT_DEFAULT,
+) -> None:
+    """
+    Run elAPI daemon in the foreground until it is stopped or interrupted.
+    """
+    from ._daemon import DaemonError, ElapiDaemon
+    from ._daemon_client import get_daemon_socket_path
+
+    try:
+        daemon = ElapiDaemon(app, get_daemon_socket_path(), idle_timeout=idle_timeout)
+    except (DaemonError, OSError) as e:
+        logger.error(e)
+        raise Exit(1) from e
+    logger.info(f"{APP_NAME} daemon is listening on {daemon.socket_path}.")
+    daemon.serve()
+
+
 logger.debug(f"{APP_NAME} will load external plugins.")
 # Load external plugins
 for plugin_info in external_local_plugin_typer_apps:
@@ -1482,7 +2523,7 @@ for plugin_info in external_local_plugin_typer_apps:
     else:
         continue
     if ext_app_obj is not None:
-        original_name: str = ext_app_obj.info.name
+        original_name: str = get_plugin_name(ext_app_obj)
         app_name: str = original_name.lower()
         if app_name in EXTERNAL_LOCAL_PLUGIN_NAME_REGISTRY:
             error_message = (
@@ -1581,7 +2622,8 @@ for plugin_info in external_local_plugin_typer_apps:
                 ext_app_obj, _path, _venv, _proj_dir
             )
             COMMANDS_TO_SKIP_CLI_STARTUP.append(app_name)
-            app.add_typer(
+            add_plugin(
+                app,
                 ext_app_obj,
                 rich_help_panel=THIRD_PARTY_PLUGIN_PANEL_NAME,
                 callback=cli_startup_for_plugins,
@@ -12,6 +12,7 @@ from .config import (
     APP_DATA_DIR,
     APP_NAME,
     ASYNC_RATE_LIMIT,
+    CACHE_TTL,
     CANON_YAML_EXTENSION,
     CONFIG_FILE_EXTENSION,
     CONFIG_FILE_NAME,
@@ -38,6 +39,7 @@ from .config import (
     KEY_API_TOKEN,
     KEY_ASYNC_CAPACITY,
     KEY_ASYNC_RATE_LIMIT,
+    KEY_CACHE_TTL,
     KEY_DEVELOPMENT_MODE,
     KEY_ELAB_STRICT_VERSION_MATCH,
     KEY_ENABLE_HTTP2,
@@ -63,6 +65,7 @@ from .overridable_vars import (
     get_active_api_token,
     get_active_async_capacity,
     get_active_async_rate_limit,
+    get_active_cache_ttl,
     get_active_enable_http2,
     get_active_export_dir,
     get_active_host,
@@ -93,6 +96,7 @@ __all__ = [
     "APP_DATA_DIR",
     "APP_NAME",
     "ASYNC_RATE_LIMIT",
+    "CACHE_TTL",
     "CANON_YAML_EXTENSION",
     "CONFIG_FILE_EXTENSION",
     "CONFIG_FILE_NAME",
@@ -128,6 +132,7 @@ __all__ = [
     "KEY_ELAB_STRICT_VERSION_MATCH",
     "KEY_VERIFY_SSL",
     "KEY_ASYNC_CAPACITY",
+    "KEY_CACHE_TTL",
     "LOCAL_CONFIG_LOC",
     "PLUGIN",
     "PROJECT_CONFIG_LOC",
@@ -148,6 +153,7 @@ __all__ = [
     "get_active_timeout",
     "get_active_unsafe_token_warning",
     "get_active_async_capacity",
+    "get_active_cache_ttl",
     "get_active_verify_ssl",
     "get_development_mode",
     "get_elab_version_mode",
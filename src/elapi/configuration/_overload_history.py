@@ -57,6 +57,7 @@ class ApplyConfigHistory:
             KEY_API_TOKEN,
             KEY_ASYNC_CAPACITY,
             KEY_ASYNC_RATE_LIMIT,
+            KEY_CACHE_TTL,
             KEY_DEVELOPMENT_MODE,
             KEY_ELAB_STRICT_VERSION_MATCH,
             KEY_ENABLE_HTTP2,
@@ -112,6 +113,7 @@ class ApplyConfigHistory:
                 KEY_DEVELOPMENT_MODE,
                 KEY_PLUGIN_KEY_NAME,
                 KEY_ELAB_STRICT_VERSION_MATCH,
+                KEY_CACHE_TTL,
             ]:
                 self._modify_history(key_name, value)
 
@@ -12,6 +12,7 @@ from .._names import (
     CONFIG_FILE_NAME,
     DEFAULT_EXPORT_DATA_FORMAT,
     ELAB_API_EXPECTED_VERSION,
+    ELAB_HOSTS_CACHE_NAMESPACE,
     ELAB_BRAND_NAME,
     ELAB_HOST_URL_API_SUFFIX,
     ELAB_NAME,
@@ -21,6 +22,7 @@ from .._names import (
     KEY_API_TOKEN,
     KEY_ASYNC_CAPACITY,
     KEY_ASYNC_RATE_LIMIT,
+    KEY_CACHE_TTL,
     KEY_DEVELOPMENT_MODE,
     KEY_ELAB_STRICT_VERSION_MATCH,
     KEY_ENABLE_HTTP2,
@@ -35,6 +37,7 @@ from .._names import (
     PROJECT_CONFIG_LOC,
     SYSTEM_CONFIG_LOC,
     VERSION_FILE_NAME,
+    CacheFileProperties,
     ElabStrictVersionMatchModes,
 )
 from ..core_validators import (
@@ -78,6 +81,7 @@ __all__ = [
     "KEY_UNSAFE_TOKEN_WARNING",
     "KEY_VERIFY_SSL",
     "KEY_ELAB_STRICT_VERSION_MATCH",
+    "KEY_CACHE_TTL",
     "LOCAL_CONFIG_LOC",
     "LOG_DIR_ROOT",
     "PROJECT_CONFIG_LOC",
@@ -96,6 +100,7 @@ __all__ = [
     "UNSAFE_TOKEN_WARNING_DEFAULT_VAL",
     "VERIFY_SSL_DEFAULT_VAL",
     "ELAB_STRICT_VERSION_MATCH_DEFAULT_VAL",
+    "CACHE_TTL_DEFAULT_VAL",
     "MinimalActiveConfiguration",
     "VERSION_FILE_NAME",
     "DEVELOPMENT_MODE",
@@ -119,6 +124,7 @@ __all__ = [
     "TOKEN_BEARER",
     "UNSAFE_TOKEN_WARNING",
     "ASYNC_RATE_LIMIT",
+    "CACHE_TTL",
     "CANON_YAML_EXTENSION",
     "API_TOKEN",
     "APP_DATA_DIR",
@@ -282,6 +288,12 @@ ELAB_STRICT_VERSION_MATCH_DEFAULT_VAL: ElabStrictVersionMatchModes | str = (
     ElabStrictVersionMatchModes.warn
 )
 
+# Cache TTLs (in seconds) per cache namespace
+CACHE_TTL = settings.get(KEY_CACHE_TTL, None)
+CACHE_TTL_DEFAULT_VAL: dict[str, int] = {
+    ELAB_HOSTS_CACHE_NAMESPACE: CacheFileProperties.default_ttl,
+}
+
 for key_name, key_val in [
     (KEY_HOST, HOST),
     (KEY_API_TOKEN, API_TOKEN),
@@ -295,6 +307,7 @@ for key_name, key_val in [
     (KEY_DEVELOPMENT_MODE, DEVELOPMENT_MODE),
     (KEY_PLUGIN_KEY_NAME, PLUGIN),
     (KEY_ELAB_STRICT_VERSION_MATCH, ELAB_STRICT_VERSION_MATCH),
+    (KEY_CACHE_TTL, CACHE_TTL),
 ]:
     try:
         history.patch(key_name, key_val)
@@ -7,6 +7,7 @@ from .config import (
     KEY_API_TOKEN,
     KEY_ASYNC_CAPACITY,
     KEY_ASYNC_RATE_LIMIT,
+    KEY_CACHE_TTL,
     KEY_DEVELOPMENT_MODE,
     KEY_ELAB_STRICT_VERSION_MATCH,
     KEY_ENABLE_HTTP2,
@@ -75,6 +76,12 @@ def get_active_async_capacity(*, skip_validation: bool = False) -> Optional[int]
     return MinimalActiveConfiguration().get_value(KEY_ASYNC_CAPACITY)
 
 
+def get_active_cache_ttl(*, skip_validation: bool = False) -> dict[str, float]:
+    if not skip_validation:
+        _development_mode_validation_switch()
+    return MinimalActiveConfiguration().get_value(KEY_CACHE_TTL)
+
+
 def _development_mode_validation_switch() -> None:
     _value = MinimalActiveConfiguration().get_value(KEY_DEVELOPMENT_MODE)
     if _value is False or _value == Missing():
@@ -25,12 +25,14 @@ from .config import (
     _XDG_DOWNLOAD_DIR,
     ASYNC_CAPACITY_DEFAULT_VAL,
     ASYNC_RATE_LIMIT_DEFAULT_VAL,
+    CACHE_TTL_DEFAULT_VAL,
     DEVELOPMENT_MODE_DEFAULT_VAL,
     ELAB_STRICT_VERSION_MATCH_DEFAULT_VAL,
     ENABLE_HTTP2_DEFAULT_VAL,
     FALLBACK_EXPORT_DIR,
     KEY_ASYNC_CAPACITY,
     KEY_ASYNC_RATE_LIMIT,
+    KEY_CACHE_TTL,
     KEY_DEVELOPMENT_MODE,
     KEY_ELAB_STRICT_VERSION_MATCH,
     KEY_ENABLE_HTTP2,
@@ -464,6 +466,46 @@ class PluginConfigurationValidator(ConfigurationValidation, Validator):
         return value
 
 
+class CacheTTLConfigurationValidator(ConfigurationValidation, Validator):
+    ALREADY_VALIDATED: bool = False
+    __slots__ = ()
+
+    def __init__(self, *args, key_name: str, fallback_value: dict[str, int]):
+        super().__init__(*args)
+        self.key_name = key_name
+        self.fallback_value = fallback_value
+
+    def validate(self) -> dict[str, float]:
+        self.active_configuration: MinimalActiveConfiguration
+        value = self.active_configuration.get_value(self.key_name)
+        cache_ttl: dict[str, float] = dict(self.fallback_value)
+
+        if isinstance(value, Missing):
+            return cache_ttl
+        if value is None:
+            logger.warning(
+                f"'{self.key_name.lower()}' is detected in configuration file, "
+                f"but it's null."
+            )
+            return cache_ttl
+        if not isinstance(value, dict):
+            logger.warning(
+                f"'{self.key_name.lower()}' is detected in configuration file, "
+                f"but it's not a {CANON_YAML_EXTENSION.upper()} dictionary."
+            )
+            return cache_ttl
+        for cache_name, ttl in value.items():
+            if not isinstance(ttl, (float, int)) or isinstance(ttl, bool) or ttl < 0:
+                logger.warning(
+                    f"Cache TTL for '{cache_name}' under '{self.key_name.lower()}' "
+                    f"is detected in configuration file, but it's not a "
+                    f"non-negative number of seconds. The default value will be used."
+                )
+                continue
+            cache_ttl[str(cache_name).lower()] = float(ttl)
+        return cache_ttl
+
+
 class MainConfigurationValidator(ConfigurationValidation, Validator):
     ALL_VALIDATORS: list = [
         HostConfigurationValidator,
@@ -474,6 +516,7 @@ class MainConfigurationValidator(ConfigurationValidation, Validator):
         DiscreteWithFallbackConfigurationValidator,
         PluginConfigurationValidator,
         ElabVersionModeWithFallbackConfigurationValidator,
+        CacheTTLConfigurationValidator,
     ]
     ESSENTIAL_VALIDATORS: list = [
         HostConfigurationValidator,
@@ -486,6 +529,7 @@ class MainConfigurationValidator(ConfigurationValidation, Validator):
         DiscreteWithFallbackConfigurationValidator,
         PluginConfigurationValidator,
         ElabVersionModeWithFallbackConfigurationValidator,
+        CacheTTLConfigurationValidator,
     ]
     __slots__ = ()
 
@@ -620,4 +664,14 @@ class MainConfigurationValidator(ConfigurationValidation, Validator):
             validated_fields.append(
                 FieldValueWithKey(KEY_ELAB_STRICT_VERSION_MATCH, version_mode)
             )
+        if CacheTTLConfigurationValidator in self.limited_to:
+            cache_ttl = Validate(
+                CacheTTLConfigurationValidator(
+                    self.active_configuration,
+                    key_name=KEY_CACHE_TTL,
+                    fallback_value=CACHE_TTL_DEFAULT_VAL,
+                )
+            ).get()
+            # Update validated_fields after validation
+            validated_fields.append(FieldValueWithKey(KEY_CACHE_TTL, cache_ttl))
         return validated_fields
@@ -273,7 +273,7 @@ else:
         else:
             if highlight_syntax is True:
                 highlight = Highlight(format.name, package_identifier=__package__)
-                stdout_console.print(highlight(formatted_teams))
+                highlight.print(formatted_teams, stdout_console)
             else:
                 typer.echo(formatted_teams)
         return teams
@@ -395,7 +395,7 @@ else:
         else:
             if highlight_syntax is True:
                 highlight = Highlight(format.name, package_identifier=__package__)
-                stdout_console.print(highlight(formatted_owners))
+                highlight.print(formatted_owners, stdout_console)
             else:
                 typer.echo(formatted_owners)
         return owners
@@ -1212,6 +1212,6 @@ else:
                 highlight = Highlight(
                     format.name, package_identifier=styles_package_identifier
                 )
-                stdout_console.print(highlight(formatted_ot))
+                highlight.print(formatted_ot, stdout_console)
             else:
                 typer.echo(formatted_ot)
@@ -2,18 +2,47 @@ __all__ = [
     "Typer",
     "Export",
     "ExportPathValidator",
+    "SQLiteExport",
     "get_structured_data",
+    "iter_structured_data",
+    "is_records_file_path",
     "Information",
     "RecursiveInformation",
+    "RecursiveInformationResult",
     "get_location_from_headers",
     "get_whoami",
-    "AsyncInformation"
+    "AsyncInformation",
+    "Batch",
+    "BatchManifestError",
+    "BatchRequest",
+    "BatchResult",
+    "get_batch_progress",
+    "iter_concurrently",
+    "get_retry_delay",
+    "get_failure_budget",
 ]
 
 
+from .batch import (
+    Batch,
+    BatchManifestError,
+    BatchRequest,
+    BatchResult,
+    get_batch_progress,
+)
 from .cli_helpers import Typer
-from .export import Export, ExportPathValidator
-from .get_data_from_input_or_path import get_structured_data
-from .get_information import Information, RecursiveInformation, AsyncInformation
+from .concurrent_requests import get_failure_budget, get_retry_delay, iter_concurrently
+from .export import Export, ExportPathValidator, SQLiteExport
+from .get_data_from_input_or_path import (
+    get_structured_data,
+    is_records_file_path,
+    iter_structured_data,
+)
+from .get_information import (
+    AsyncInformation,
+    Information,
+    RecursiveInformation,
+    RecursiveInformationResult,
+)
 from .get_location_from_headers import get_location_from_headers
 from .get_whoami import get_whoami
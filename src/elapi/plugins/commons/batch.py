@@ -0,0 +1,341 @@
+import asyncio
+import json
+from contextlib import aclosing
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from json import JSONDecodeError
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, Union
+
+import httpx
+from httpx import AsyncClient, Response
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    ProgressColumn,
+    Task,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+from rich.text import Text
+
+from ...api import (
+    AsyncDELETERequest,
+    AsyncGETRequest,
+    AsyncPATCHRequest,
+    AsyncPOSTRequest,
+    ElabFTWURLError,
+    GlobalSharedSession,
+    SimpleClient,
+)
+from ...configuration import get_active_async_capacity
+from ...core_validators import ValidationError
+from ...loggers import Logger
+from .concurrent_requests import (
+    RETRY_TRIGGER_ERRORS,
+    RETRY_TRIGGER_STATUS_CODES,
+    STREAM_WINDOW_DEFAULT,
+    get_retry_delay,
+    iter_concurrently,
+)
+from .get_location_from_headers import get_location_from_headers
+
+logger = Logger()
+BATCH_VERBS: tuple[str, ...] = ("get", "post", "patch", "delete")
+BATCH_MANIFEST_KEYS: frozenset[str] = frozenset(
+    ("verb", "endpoint", "id", "sub", "sub_id", "query", "data", "headers")
+)
+
+
+class BatchManifestError(Exception): ...
+
+
+@dataclass(slots=True)
+class BatchRequest:
+    index: int
+    verb: str
+    endpoint: str
+    endpoint_id: Union[int, str, None] = None
+    sub_endpoint: Optional[str] = None
+    sub_endpoint_id: Union[int, str, None] = None
+    query: dict = field(default_factory=dict)
+    data: Optional[dict] = None
+    headers: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_record(cls, index: int, record: dict) -> "BatchRequest":
+        """
+        Build a request from a manifest record. Record keys follow the options
+        of the raw API commands: "verb", "endpoint", "id", "sub", "sub_id",
+        "query", "data" and "headers". Values of "query", "data" and "headers"
+        can also be JSON strings, e.g., in a CSV manifest.
+        """
+        if unknown_keys := record.keys() - BATCH_MANIFEST_KEYS:
+            raise BatchManifestError(
+                f"Unknown key(s): {', '.join(map(repr, sorted(unknown_keys)))}. "
+                f"Supported keys are: {', '.join(sorted(BATCH_MANIFEST_KEYS))}."
+            )
+        verb = str(record.get("verb", "")).lower()
+        if verb not in BATCH_VERBS:
+            raise BatchManifestError(
+                f"'verb' must be one of: {', '.join(BATCH_VERBS)}. "
+                f"Given: '{record.get('verb')}'."
+            )
+        endpoint = record.get("endpoint")
+        if not isinstance(endpoint, str) or not endpoint:
+            raise BatchManifestError("'endpoint' is required.")
+        structured_values: dict[str, Optional[dict]] = {}
+        for key in ("query", "data", "headers"):
+            value = record.get(key)
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except ValueError as e:
+                    raise BatchManifestError(
+                        f"'{key}' could not be parsed as JSON. Exception details: {e!r}"
+                    ) from e
+            if value is not None and not isinstance(value, dict):
+                raise BatchManifestError(f"'{key}' must be a JSON object.")
+            structured_values[key] = value
+        if structured_values["data"] is not None and verb in ("get", "delete"):
+            raise BatchManifestError(
+                f"'data' is not supported for a {verb.upper()} request."
+            )
+        if structured_values["data"] is None and verb == "patch":
+            raise BatchManifestError("'data' is required for a PATCH request.")
+        return cls(
+            index,
+            verb,
+            endpoint,
+            record.get("id"),
+            record.get("sub"),
+            record.get("sub_id"),
+            structured_values["query"] or {},
+            structured_values["data"],
+            structured_values["headers"] or {},
+        )
+
+    @property
+    def data_digest(self) -> Optional[str]:
+        # Identifies the request body in a result without storing the body itself
+        if self.data is None:
+            return None
+        return sha256(
+            json.dumps(
+                self.data, sort_keys=True, separators=(",", ":"), default=str
+            ).encode("utf-8")
+        ).hexdigest()
+
+
+@dataclass(slots=True)
+class BatchResult:
+    index: int
+    verb: Optional[str] = None
+    endpoint: Optional[str] = None
+    endpoint_id: Union[int, str, None] = None
+    sub_endpoint: Optional[str] = None
+    sub_endpoint_id: Union[int, str, None] = None
+    # SHA-256 of the request body, so a result can be matched to the request made
+    data_digest: Optional[str] = None
+    status_code: Optional[int] = None
+    success: bool = False
+    # ID of the resource a successful POST request has created, if the server returned it
+    location_id: Optional[str] = None
+    response: Any = None
+    error: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, default=str)
+
+
+class RequestRateColumn(ProgressColumn):
+    """Renders the number of completed requests per second."""
+
+    def render(self, task: Task) -> Text:
+        if task.speed is None:
+            return Text("? req/s", style="progress.data.speed")
+        return Text(f"{task.speed:.1f} req/s", style="progress.data.speed")
+
+
+def get_batch_progress(**kwargs) -> Progress:
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        RequestRateColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        **kwargs,
+    )
+
+
+class Batch:
+    __slots__ = "retries", "backoff"
+
+    def __init__(self, *, retries: int = 3, backoff: float = 0.5):
+        """
+        Run manifest records as requests concurrently over one async client.
+        ``retries`` is the number of re-attempts per request on a network error or
+        a server error (5xx or 429), with the backoff of ``get_retry_delay``.
+        As POST requests are not idempotent, they are only retried if the server
+        could not have processed them, i.e., on a connection error or a 429.
+        """
+        self.retries = retries
+        self.backoff = backoff
+
+    @staticmethod
+    def _parse(
+        records: Iterable[dict],
+    ) -> Iterator[Union[BatchRequest, BatchResult]]:
+        # An invalid record becomes a failed result, so it does not stop the batch.
+        # A manifest that cannot be read any further does, but the requests
+        # already in flight are still completed and logged.
+        index = 0
+        records = iter(records)
+        while True:
+            index += 1
+            try:
+                record = next(records)
+            except StopIteration:
+                return
+            except ValidationError as e:
+                yield BatchResult(index, error=f"{e}")
+                return
+            try:
+                yield BatchRequest.from_record(index, record)
+            except BatchManifestError as e:
+                yield BatchResult(
+                    index,
+                    verb=record.get("verb"),
+                    endpoint=record.get("endpoint"),
+                    endpoint_id=record.get("id"),
+                    error=f"Invalid manifest record. {e}",
+                )
+
+    @staticmethod
+    def _get_response_content(response: Response) -> Any:
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except JSONDecodeError:
+            return response.text
+
+    async def _send(
+        self, sessions: dict, request: Union[BatchRequest, BatchResult]
+    ) -> BatchResult:
+        # Failures are returned rather than raised, as an exception would
+        # cancel every other request of the batch's task group.
+        if isinstance(request, BatchResult):
+            return request
+        result = BatchResult(
+            request.index,
+            request.verb,
+            request.endpoint,
+            request.endpoint_id,
+            request.sub_endpoint,
+            request.sub_endpoint_id,
+            request.data_digest,
+        )
+        for attempt in range(self.retries + 1):
+            response: Optional[Response] = None
+            kwargs: dict = {"headers": request.headers or None}
+            if request.data is not None:
+                kwargs["data"] = request.data
+            try:
+                response = await sessions[request.verb](
+                    request.endpoint,
+                    request.endpoint_id,
+                    request.sub_endpoint,
+                    request.sub_endpoint_id,
+                    request.query,
+                    **kwargs,
+                )
+            except ElabFTWURLError as e:
+                result.error = f"{e}"
+                return result
+            except (AttributeError, TypeError) as e:
+                result.error = (
+                    f"Given data was successfully parsed but there was an error "
+                    f"while processing it. Exception details: {e!r}"
+                )
+                return result
+            except RETRY_TRIGGER_ERRORS as e:
+                result.error = f"Network error. Exception details: {e!r}"
+                if request.verb == "post" and not isinstance(e, httpx.ConnectError):
+                    return result
+            except httpx.HTTPError as e:
+                result.error = f"Request failed. Exception details: {e!r}"
+                return result
+            else:
+                result.status_code = response.status_code
+                result.success = response.is_success
+                result.response = self._get_response_content(response)
+                if response.is_success:
+                    result.error = None
+                    if request.verb == "post":
+                        try:
+                            result.location_id, _ = get_location_from_headers(
+                                response.headers
+                            )
+                        except ValueError:
+                            ...
+                    return result
+                result.error = f"Response status: {response.status_code}."
+                if response.status_code not in RETRY_TRIGGER_STATUS_CODES or (
+                    request.verb == "post" and response.status_code != 429
+                ):
+                    # A client error will not be any different on a retry
+                    return result
+            if attempt < self.retries:
+                delay = get_retry_delay(attempt, response, backoff=self.backoff)
+                logger.debug(
+                    f"Request {request.index} ({request.verb.upper()} "
+                    f"'{request.endpoint}') failed and will be retried in "
+                    f"{delay:.1f} seconds. {result.error}"
+                )
+                await asyncio.sleep(delay)
+        return result
+
+    async def stream(
+        self,
+        records: Iterable[dict],
+        *,
+        window: Optional[int] = None,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Yield the result of each record's request as soon as it completes, so
+        results are not in manifest order (``BatchResult.index`` is). Records
+        are consumed lazily and at most ``window`` requests are in flight at a
+        time (defaults to the configured async capacity, or 100). The configured
+        async rate limit applies, as all requests share one async client.
+
+        With ``ordered=True``, results are yielded in manifest order instead
+        (see ``iter_concurrently``).
+        """
+        window = (
+            window
+            or get_active_async_capacity(skip_validation=True)
+            or STREAM_WINDOW_DEFAULT
+        )
+        client: Optional[AsyncClient] = None
+        if GlobalSharedSession._instance is None:
+            client = SimpleClient(is_async_client=True)
+        sessions = {
+            "get": AsyncGETRequest(shared_client=client),
+            "post": AsyncPOSTRequest(shared_client=client),
+            "patch": AsyncPATCHRequest(shared_client=client),
+            "delete": AsyncDELETERequest(shared_client=client),
+        }
+        requests = (self._send(sessions, _) for _ in self._parse(records))
+        try:
+            async with aclosing(
+                iter_concurrently(requests, window, ordered=ordered)
+            ) as results:
+                async for result in results:
+                    yield result
+        finally:
+            if client is not None:
+                await client.aclose()
@@ -26,7 +26,7 @@ class CLIExport:
         from collections import namedtuple
 
         from ...core_validators import Validate
-        from .export import ExportPathValidator
+        from .export import ExportPathValidator, get_export_compression
 
         try:
             validate_export = Validate(
@@ -37,11 +37,17 @@ class CLIExport:
             raise Exit(1)
         export_dest: ProperPath = validate_export.get()
 
-        _export_file_ext: str = (
-            export_dest.expanded.suffix.removeprefix(".")
-            if export_dest.kind == "file"
-            else None
-        )
+        _export_file_ext: Optional[str] = None
+        if export_dest.kind == "file":
+            _export_file_suffixes: list[str] = export_dest.expanded.suffixes
+            if get_export_compression(export_dest) is not None:
+                # E.g., "experiments.json.gz" still defines "json" as data format
+                _export_file_suffixes = _export_file_suffixes[:-1]
+            _export_file_ext = (
+                _export_file_suffixes[-1].removeprefix(".")
+                if _export_file_suffixes
+                else ""
+            )
         data_format = (
             data_format or _export_file_ext or DEFAULT_EXPORT_DATA_FORMAT
         )  # default data_format format
@@ -0,0 +1,124 @@
+import asyncio
+import random
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from itertools import islice
+from typing import Optional, TypeVar, Union
+
+import httpx
+from httpx import Response
+
+RETRY_TRIGGER_ERRORS: tuple[type[Exception], ...] = (
+    httpx.TimeoutException,
+    httpx.ReadError,
+    httpx.ConnectError,
+    httpx.RemoteProtocolError,
+    TimeoutError,
+)
+RETRY_TRIGGER_STATUS_CODES: frozenset[int] = frozenset((429, 500, 502, 503, 504))
+RETRY_MAX_DELAY: float = 60.0  # seconds
+STREAM_WINDOW_DEFAULT: int = 100
+
+_T = TypeVar("_T")
+_CRAWL_DONE = object()
+
+
+def get_retry_delay(
+    attempt: int, response: Optional[Response], *, backoff: float
+) -> float:
+    """
+    Return how many seconds to wait before re-attempting a failed request:
+    what the server asks for with "Retry-After", or ``backoff * 2 ** attempt``
+    with jitter. Either is at most ``RETRY_MAX_DELAY``.
+    """
+    if response is not None:
+        try:
+            return min(float(response.headers["Retry-After"]), RETRY_MAX_DELAY)
+        except (KeyError, ValueError):
+            ...
+    delay = min(backoff * 2**attempt, RETRY_MAX_DELAY)
+    return delay + random.uniform(0, delay / 2)
+
+
+def get_failure_budget(failure_budget: Union[int, float], total: int) -> int:
+    """
+    Return how many of ``total`` requests may fail. An int ``failure_budget``
+    is an absolute count, a float below 1 a fraction of ``total``.
+    """
+    if isinstance(failure_budget, float) and failure_budget < 1:
+        return int(total * failure_budget)
+    return int(failure_budget)
+
+
+async def _crawl(
+    requests: Iterator[Awaitable], window: int, results: asyncio.Queue
+) -> None:
+    # All requests of one crawl belong to this task group, so aborting the
+    # crawl cancels exactly these requests and nothing else in the loop.
+    async with asyncio.TaskGroup() as task_group:
+        pending = {task_group.create_task(_) for _ in islice(requests, window)}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            pending.update(
+                task_group.create_task(_) for _ in islice(requests, len(done))
+            )
+            for task in done:
+                await results.put(task.result())
+    await results.put(_CRAWL_DONE)
+
+
+async def _get_crawl_result(results: asyncio.Queue, crawler: asyncio.Task):
+    next_result = asyncio.ensure_future(results.get())
+    await asyncio.wait((next_result, crawler), return_when=asyncio.FIRST_COMPLETED)
+    if not next_result.done() and crawler.exception() is not None:
+        next_result.cancel()
+        raise crawler.exception()
+    return await next_result
+
+
+async def iter_concurrently(
+    requests: Iterator[Awaitable[_T]], window: int, *, ordered: bool = False
+) -> AsyncIterator[_T]:
+    """
+    Await ``requests`` concurrently and yield each result as soon as it is
+    ready. Requests are taken from the iterator lazily, and at most ``window``
+    of them are in flight at a time, so memory use does not grow with the
+    number of requests. If a request raises, the other requests are cancelled
+    and the exception is raised. Requests should therefore return their
+    failures instead. Wrap it with ``contextlib.aclosing`` if iteration may
+    stop early, so the remaining requests are cancelled.
+
+    With ``ordered=True``, results are yielded in the order of ``requests``
+    instead. A request is then only started while it is less than ``window``
+    requests ahead of the next result to yield, so a slow request holds back
+    at most ``window`` completed results.
+    """
+    if ordered:
+        tasks: deque[asyncio.Task] = deque()
+        try:
+            while True:
+                tasks.extend(
+                    asyncio.create_task(_)
+                    for _ in islice(requests, window - len(tasks))
+                )
+                if not tasks:
+                    break
+                yield await tasks.popleft()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+        return
+    results: asyncio.Queue = asyncio.Queue(maxsize=window)
+    crawler = asyncio.create_task(_crawl(requests, window, results))
+    try:
+        while (result := await _get_crawl_result(results, crawler)) is not _CRAWL_DONE:
+            yield result
+    finally:
+        if not crawler.done():
+            # Stopped early, either by an error or by the caller
+            crawler.cancel()
+            await asyncio.wait((crawler,))
@@ -1,12 +1,61 @@
+import asyncio
+import io
+import json
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
+from importlib.util import find_spec
+from itertools import islice
 from pathlib import Path
-from typing import Any, Union, Iterable, Optional
+from queue import Full, Queue
+from tempfile import mkstemp
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
 
 from ...core_validators import PathValidator, ValidationError
 from ...loggers import Logger
 from ...path import ProperPath
+from ...styles import BaseFormat
+from ...styles.formats import SQLiteFormat
 
 logger = Logger()
+EXPORT_STREAM_BUFFER_SIZE: int = 1024 * 1024
+EXPORT_STREAM_QUEUE_SIZE: int = 1024
+# Seconds astream waits for room in the full queue before it checks again
+# whether the writer has failed and stopped reading from the queue
+EXPORT_STREAM_PUT_TIMEOUT: float = 0.1
+# Supported compressions and their file extensions
+EXPORT_COMPRESSIONS: dict[str, str] = {"gzip": "gz", "zstd": "zst"}
+EXPORT_GZIP_COMPRESSION_LEVEL: int = 6
+EXPORT_ZSTD_COMPRESSION_LEVEL: int = 3
+SQLITE_FILE_EXTENSIONS: tuple[str, ...] = tuple(SQLiteFormat.convention)
+SQLITE_BATCH_SIZE: int = 1000
+SQLITE_PRIMARY_KEY_CANDIDATES: tuple[str, ...] = ("id", "userid")
+SQLITE_INDEXED_COLUMNS_PATTERN: str = (
+    r"^(id|userid|elabid|.+_id|date|.+_at|.+_until|last_login)$"
+)
+
+
+def get_export_compression(path: Union[ProperPath, Path, str]) -> Optional[str]:
+    """
+    Return the compression implied by the last suffix of ``path``,
+    e.g., "gzip" for "experiments.json.gz", or ``None``.
+    """
+    suffix: str = Path(str(path)).suffix.removeprefix(".").lower()
+    for compression, extension in EXPORT_COMPRESSIONS.items():
+        if suffix == extension:
+            return compression
+    return None
 
 
 class Export:
@@ -19,6 +68,7 @@ class Export:
         "file_name_stub",
         "_file_name",
         "_destination",
+        "_compression",
     )
 
     def __init__(
@@ -28,12 +78,34 @@ class Export:
         file_name_stub: str,
         file_extension: str,
         format_name: str,
+        compression: Optional[str] = None,
     ):
         self.file_extension = file_extension.lower()
         self.format_name = format_name.upper()
+        self.compression = compression
         self.file = self.file_name_stub = file_name_stub
         self.destination = destination
 
+    @property
+    def compression(self) -> Optional[str]:
+        return self._compression
+
+    @compression.setter
+    def compression(self, value):
+        if value is not None:
+            value = value.lower()
+            if value not in EXPORT_COMPRESSIONS:
+                raise ValueError(
+                    f"Compression '{value}' is not supported! Supported "
+                    f"compressions are: {', '.join(EXPORT_COMPRESSIONS)}."
+                )
+            if value == "zstd" and find_spec("zstandard") is None:
+                raise ValueError(
+                    "Compression 'zstd' requires the 'zstandard' package, which is "
+                    "not installed. It can be installed with the 'zstd' extra."
+                )
+        self._compression = value
+
     @property
     def file(self) -> str:
         return self._file_name
@@ -46,6 +118,8 @@ class Export:
             f"{date.strftime(Export.EXPORT_TIME_FORMAT)}"
         )
         self._file_name = f"{file_name_prefix}_{value}.{self.file_extension}"
+        if self.compression is not None:
+            self._file_name += f".{EXPORT_COMPRESSIONS[self.compression]}"
 
     @property
     def destination(self) -> ProperPath:
@@ -59,6 +133,8 @@ class Export:
             except (TypeError, ValueError) as e:
                 raise ValueError("Export path is not valid!") from e
         self._destination = value / (self.file if value.kind == "dir" else "")
+        if value.kind == "file" and self.compression is None:
+            self.compression = get_export_compression(value)
 
     def __call__(
         self,
@@ -67,6 +143,10 @@ class Export:
         append_only: bool = False,
         verbose: bool = False,
     ) -> None:
+        if self.compression is not None:
+            return self.stream(
+                (data,), encoding=encoding, append_only=append_only, verbose=verbose
+            )
         mode: str = "w" if not append_only else "a"
         if isinstance(data, bytes):
             mode += "b"
@@ -79,6 +159,361 @@ class Export:
                 f"in {self.format_name} format."
             )
 
+    def stream(
+        self,
+        chunks: Iterable[Any],
+        /,
+        formatter: Optional[Callable[[Any], Union[str, bytes]]] = None,
+        encoding: Optional[str] = "utf-8",
+        append_only: bool = False,
+        verbose: bool = False,
+        buffer_size: int = EXPORT_STREAM_BUFFER_SIZE,
+    ) -> None:
+        """
+        Write an iterable of str or bytes chunks to the destination as they
+        arrive. If a ``formatter`` is given, the iterable is of items instead:
+        a ``BaseFormat`` formats them with its ``stream`` method, any other
+        callable formats each item to one chunk. Chunks go through a large
+        write buffer into a temporary file next to the destination, which
+        replaces the destination only once everything is written, so an
+        interrupted export never leaves a partial file behind. With
+        ``append_only``, chunks are appended to the destination directly.
+        If ``compression`` is set, chunks are compressed as they are written.
+        """
+        if formatter is not None:
+            chunks = (
+                formatter.stream(chunks)
+                if isinstance(formatter, BaseFormat)
+                else map(formatter, chunks)
+            )
+        chunks = iter(chunks)
+        first_chunk = next(chunks, "")
+        is_binary: bool = isinstance(first_chunk, bytes)
+        destination: Path = self.destination.expanded.resolve()
+        if append_only:
+            with (
+                self.destination.open(mode="ab", buffering=buffer_size) as raw_file,
+                self._open_writer(raw_file, is_binary, encoding) as file,
+            ):
+                self._write_chunks(file, first_chunk, chunks)
+        else:
+            temp_file_descriptor, temp_path = mkstemp(
+                dir=destination.parent, prefix=f".{destination.name}.", suffix=".part"
+            )
+            try:
+                with open(
+                    temp_file_descriptor, mode="wb", buffering=buffer_size
+                ) as raw_file:
+                    with self._open_writer(raw_file, is_binary, encoding) as file:
+                        self._write_chunks(file, first_chunk, chunks)
+                    raw_file.flush()
+                    os.fsync(raw_file.fileno())
+                os.chmod(temp_path, self._get_file_mode(destination))
+                os.replace(temp_path, destination)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        if verbose:
+            logger.info(
+                f"{self.file_name_stub} data successfully exported to {self.destination} "
+                f"in {self.format_name} format."
+            )
+
+    @staticmethod
+    def _get_file_mode(destination: Path) -> int:
+        # mkstemp creates files only readable by the owner. The exported file
+        # should get the same permissions as if it was written with open().
+        try:
+            return destination.stat().st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    @contextmanager
+    def _open_writer(
+        self, raw_file: IO[bytes], is_binary: bool, encoding: Optional[str]
+    ) -> Iterator[IO]:
+        # Wraps raw_file in a compressor and/or a text layer. Closing the
+        # compressor writes its trailer but leaves raw_file open.
+        if self.compression == "gzip":
+            import gzip
+
+            file = gzip.GzipFile(
+                fileobj=raw_file,
+                mode="wb",
+                compresslevel=EXPORT_GZIP_COMPRESSION_LEVEL,
+            )
+        elif self.compression == "zstd":
+            import zstandard
+
+            file = zstandard.ZstdCompressor(
+                level=EXPORT_ZSTD_COMPRESSION_LEVEL
+            ).stream_writer(raw_file, closefd=False)
+        else:
+            file = raw_file
+        text_file = (
+            io.TextIOWrapper(file, encoding=encoding or "utf-8")
+            if not is_binary
+            else None
+        )
+        try:
+            yield text_file or file
+        finally:
+            if text_file is not None:
+                text_file.flush()
+                text_file.detach()
+            if file is not raw_file:
+                file.close()
+
+    @staticmethod
+    def _write_chunks(
+        file: IO, first_chunk: Union[str, bytes], chunks: Iterator[Union[str, bytes]]
+    ) -> None:
+        chunk_type = type(first_chunk)
+        file.write(first_chunk)
+        for chunk in chunks:
+            if not isinstance(chunk, chunk_type):
+                raise TypeError(
+                    f"All exported chunks must be of the same type. "
+                    f"Expected '{chunk_type.__name__}', got '{type(chunk).__name__}'."
+                )
+            file.write(chunk)
+
+    async def astream(
+        self,
+        chunks: AsyncIterable[Any],
+        /,
+        formatter: Optional[Callable[[Any], Union[str, bytes]]] = None,
+        encoding: Optional[str] = "utf-8",
+        append_only: bool = False,
+        verbose: bool = False,
+        buffer_size: int = EXPORT_STREAM_BUFFER_SIZE,
+    ) -> None:
+        """
+        Async counterpart of ``stream``. Formatting and file I/O run in a
+        worker thread, which is fed through a bounded queue, so the event loop
+        is never blocked by disk writes.
+        """
+        handover: Queue = Queue(maxsize=EXPORT_STREAM_QUEUE_SIZE)
+        end_of_stream, aborted = object(), object()
+
+        def iter_handover() -> Iterator[Any]:
+            while (item := handover.get()) is not end_of_stream:
+                if item is aborted:
+                    raise RuntimeError("Export stream was aborted.")
+                yield item
+
+        async def put_handover(item: Any) -> bool:
+            # A failed writer no longer reads from the queue, so waiting
+            # for room in the queue without a timeout could block forever.
+            while not writer.done():
+                try:
+                    handover.put_nowait(item)
+                except Full:
+                    try:
+                        await asyncio.to_thread(
+                            handover.put, item, timeout=EXPORT_STREAM_PUT_TIMEOUT
+                        )
+                    except Full:
+                        continue
+                return True
+            return False
+
+        writer = asyncio.create_task(
+            asyncio.to_thread(
+                self.stream,
+                iter_handover(),
+                formatter=formatter,
+                encoding=encoding,
+                append_only=append_only,
+                verbose=verbose,
+                buffer_size=buffer_size,
+            )
+        )
+        try:
+            async for chunk in chunks:
+                if not await put_handover(chunk):
+                    break  # The writer has failed; its error is raised below
+        except BaseException:
+            # Make the writer fail, so it discards the temporary file
+            if not writer.done():
+                await asyncio.shield(put_handover(aborted))
+                await asyncio.wait((writer,))
+            if not writer.cancelled():
+                writer.exception()  # Consumed; the original error takes precedence
+            raise
+        await put_handover(end_of_stream)
+        await writer
+
+
+class SQLiteExport(Export):
+    """
+    Export records (dictionaries) to a table of a SQLite database. The table is
+    created on the first export and new columns are added as they appear.
+    Top-level values are stored in their own columns, nested values are stored
+    as JSON text that can be queried with SQLite's JSON functions. ID and
+    timestamp columns are indexed. If the records have an ID column, exporting
+    to the same database again updates existing rows instead of duplicating them.
+    """
+
+    __slots__ = ("table_name",)
+
+    def __init__(
+        self,
+        destination: Union[ProperPath, Path, str],
+        /,
+        file_name_stub: str,
+        file_extension: str = SQLITE_FILE_EXTENSIONS[0],
+        format_name: str = "sqlite",
+        table_name: Optional[str] = None,
+    ):
+        super().__init__(
+            destination,
+            file_name_stub=file_name_stub,
+            file_extension=file_extension,
+            format_name=format_name,
+        )
+        self.table_name = table_name or file_name_stub
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        return '"{}"'.format(str(identifier).replace('"', '""'))
+
+    @staticmethod
+    def _get_column_value(value: Any) -> Any:
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, bool):
+            return int(value)
+        return value
+
+    @staticmethod
+    def _get_column_type(value: Any) -> str:
+        if isinstance(value, (bool, int)):
+            return "INTEGER"
+        if isinstance(value, float):
+            return "REAL"
+        if isinstance(value, (dict, list, tuple)):
+            return "JSON"
+        return "TEXT"
+
+    def _get_table_info(self, connection: sqlite3.Connection) -> list[tuple]:
+        return connection.execute(
+            f"PRAGMA table_info({self._quote(self.table_name)})"
+        ).fetchall()
+
+    def _add_columns(
+        self, connection: sqlite3.Connection, record: dict, columns: list[str]
+    ) -> None:
+        # Creates the table if needed and adds any new columns of record
+        table = self._quote(self.table_name)
+        primary_key: Optional[str] = None
+        if not columns:
+            primary_key = next(
+                (_ for _ in SQLITE_PRIMARY_KEY_CANDIDATES if _ in record), None
+            )
+            definitions = (
+                f"{self._quote(name)} {self._get_column_type(value)}"
+                + (" PRIMARY KEY" if name == primary_key else "")
+                for name, value in record.items()
+            )
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(definitions)})"
+            )
+            columns.extend(row[1] for row in self._get_table_info(connection))
+            new_columns = columns
+        else:
+            new_columns = [_ for _ in record if _ not in columns]
+            for name in new_columns:
+                connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {self._quote(name)} "
+                    f"{self._get_column_type(record[name])}"
+                )
+                columns.append(name)
+        for name in new_columns:
+            if name != primary_key and re.match(SQLITE_INDEXED_COLUMNS_PATTERN, name):
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS "
+                    f"{self._quote(f'ix_{self.table_name}_{name}')} "
+                    f"ON {table} ({self._quote(name)})"
+                )
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        records: list[dict],
+        columns: list[str],
+    ) -> None:
+        for record in records:
+            if not columns or any(_ not in columns for _ in record):
+                self._add_columns(connection, record, columns)
+        primary_key: Optional[str] = next(
+            (row[1] for row in self._get_table_info(connection) if row[5]), None
+        )
+        quoted_columns = ", ".join(map(self._quote, columns))
+        statement = (
+            f"INSERT INTO {self._quote(self.table_name)} ({quoted_columns}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        if primary_key is not None:
+            updates = ", ".join(
+                f"{self._quote(_)} = excluded.{self._quote(_)}"
+                for _ in columns
+                if _ != primary_key
+            )
+            statement += (
+                f" ON CONFLICT ({self._quote(primary_key)}) DO UPDATE SET {updates}"
+                if updates
+                else f" ON CONFLICT ({self._quote(primary_key)}) DO NOTHING"
+            )
+        connection.executemany(
+            statement,
+            (
+                tuple(self._get_column_value(record.get(_)) for _ in columns)
+                for record in records
+            ),
+        )
+
+    def __call__(self, data: Any, verbose: bool = False, **kwargs) -> None:
+        self.stream((data,) if isinstance(data, dict) else data, verbose=verbose)
+
+    def stream(
+        self,
+        items: Iterable[dict],
+        /,
+        formatter: Optional[Callable[[Any], Any]] = None,
+        verbose: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Write records to the table in batches, in a single transaction, so an
+        interrupted export leaves the database as it was. ``formatter`` is
+        accepted for compatibility with ``Export.stream``, but records are
+        always stored as they are.
+        """
+        items = iter(items)
+        connection = sqlite3.connect(self.destination.expanded)
+        try:
+            with connection:
+                columns: list[str] = [
+                    row[1] for row in self._get_table_info(connection)
+                ]
+                while records := list(islice(items, SQLITE_BATCH_SIZE)):
+                    if not all(isinstance(_, dict) for _ in records):
+                        raise ValueError(
+                            "Only dictionaries can be exported to a SQLite table."
+                        )
+                    self._upsert(connection, records, columns)
+        finally:
+            connection.close()
+        if verbose:
+            logger.info(
+                f"{self.file_name_stub} data successfully exported to table "
+                f"'{self.table_name}' of {self.destination} in "
+                f"{self.format_name} format."
+            )
+
 
 class ExportPathValidator(PathValidator):
     def __init__(
@@ -126,6 +561,9 @@ class ExportPathValidator(PathValidator):
                     and path.expanded.exists()
                     and path.expanded not in super()._self_created_files
                     and not self.can_overwrite
+                    # Existing SQLite databases are updated, not overwritten
+                    and path.expanded.suffix.removeprefix(".").lower()
+                    not in SQLITE_FILE_EXTENSIONS
                 ):
                     logger.warning(
                         f"--export path '{self.export_path}' already exists! "
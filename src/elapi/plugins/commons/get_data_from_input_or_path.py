@@ -1,9 +1,10 @@
+import csv
 import json
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Union
-
-import yaml
+from typing import Any, Optional, Union
 
+from ..._yaml import YAMLError, safe_load
 from ...core_validators import Exit, Validate, ValidationError, Validator
 from ...loggers import FileLogger
 from ...path import ProperPath
@@ -97,8 +98,8 @@ class ValidateCLIYAMLFile(Validator):
             )
         with self.yaml_file_path.open(mode="r") as f:
             try:
-                data_items = yaml.safe_load(f)
-            except yaml.YAMLError:
+                data_items = safe_load(f)
+            except YAMLError:
                 raise ValidationError(
                     f"{self.option_name} was passed an existing "
                     f"{ValidateCLIYAMLFile.FILE_EXTENSION} "
@@ -111,6 +112,187 @@ class ValidateCLIYAMLFile(Validator):
                 return data_items
 
 
+class ValidateCLIJSONLinesFile(Validator):
+    """
+    Validate a JSON Lines file path. ``validate`` returns an iterator that
+    reads and parses one line (record) at a time, so the file is never loaded
+    into memory as a whole. Empty lines are skipped. Since parsing is lazy,
+    a syntax error is raised as ValidationError only when the offending line is reached.
+    """
+
+    FILE_EXTENSION: str = "jsonl"
+
+    def __init__(
+        self, jsonl_file_path: Union[str, ProperPath, Path], /, option_name: str
+    ):
+        self.option_name = option_name
+        self.jsonl_file_path = jsonl_file_path
+
+    @property
+    def jsonl_file_path(self) -> ProperPath:
+        return self._jsonl_file_path
+
+    @jsonl_file_path.setter
+    def jsonl_file_path(self, value):
+        try:
+            value = ProperPath(value)
+        except ValueError:
+            raise ValidationError(
+                f"{self.option_name} was passed a string '{value}' "
+                f"ending with '.{ValidateCLIJSONLinesFile.FILE_EXTENSION}', but it "
+                f"could not be understood as a path."
+            )
+        self._jsonl_file_path = value
+
+    def _iter_records(self) -> Iterator[dict]:
+        with self.jsonl_file_path.open(mode="r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    err_msg = (
+                        f"{self.option_name} was passed an existing "
+                        f"{ValidateCLIJSONLinesFile.FILE_EXTENSION.upper()} file path "
+                        f"'{self.jsonl_file_path}', but line {line_number} "
+                        f"caused a JSON syntax error."
+                    )
+                    file_logger.warning(err_msg)
+                    raise ValidationError(err_msg)
+                if not isinstance(record, dict):
+                    err_msg = (
+                        f"{self.option_name} was passed an existing "
+                        f"{ValidateCLIJSONLinesFile.FILE_EXTENSION.upper()} file path "
+                        f"'{self.jsonl_file_path}', but line {line_number} "
+                        f"is not a JSON object."
+                    )
+                    file_logger.warning(err_msg)
+                    raise ValidationError(err_msg)
+                yield record
+
+    def validate(self) -> Iterator[dict]:
+        if not self.jsonl_file_path.expanded.exists():
+            err_msg = (
+                f"{self.option_name} was passed a string '{self.jsonl_file_path}' "
+                f"that was assumed as a "
+                f"{ValidateCLIJSONLinesFile.FILE_EXTENSION.upper()} file path, "
+                f"but it doesn't exist."
+            )
+            file_logger.warning(err_msg)
+            raise ValidationError(err_msg)
+        return self._iter_records()
+
+
+class ValidateCLICSVFile(Validator):
+    """
+    Validate a CSV file path. ``validate`` returns an iterator that reads one row
+    (record) at a time as a dictionary keyed by the header. Empty cells are left out
+    of the record. Every other cell is parsed as JSON, and kept as a string if it is
+    not valid JSON. E.g., ``3`` becomes ``3``, ``true`` becomes ``True``, ``[1, 2]``
+    becomes a list, but ``Alpha`` and ``NaN`` stay strings. A number or a literal
+    that is meant as a string must be written as a JSON string, e.g., ``"3"``. If the file was exported by elapi with an extras column (for keys
+    that were not part of the header), the column's JSON is merged back into the record.
+    """
+
+    FILE_EXTENSION: str = "csv"
+
+    def __init__(
+        self, csv_file_path: Union[str, ProperPath, Path], /, option_name: str
+    ):
+        self.option_name = option_name
+        self.csv_file_path = csv_file_path
+
+    @property
+    def csv_file_path(self) -> ProperPath:
+        return self._csv_file_path
+
+    @csv_file_path.setter
+    def csv_file_path(self, value):
+        try:
+            value = ProperPath(value)
+        except ValueError:
+            raise ValidationError(
+                f"{self.option_name} was passed a string '{value}' "
+                f"ending with '.{ValidateCLICSVFile.FILE_EXTENSION}', but it "
+                f"could not be understood as a path."
+            )
+        self._csv_file_path = value
+
+    @staticmethod
+    def _parse_cell(value: Optional[str]) -> Any:
+        # DictReader fills missing cells of a short row with None
+        if value is None:
+            return None
+
+        def reject_constant(constant: str):
+            # Keep "NaN", "Infinity" and "-Infinity" as strings
+            raise ValueError(constant)
+
+        try:
+            return json.loads(value, parse_constant=reject_constant)
+        except ValueError:
+            return value
+
+    def _iter_records(self) -> Iterator[dict]:
+        from ...styles.formats import CSVFormat
+
+        extras_column: str = CSVFormat.extras_column
+        with self.csv_file_path.open(mode="r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            try:
+                for row in reader:
+                    record: dict = {
+                        k: self._parse_cell(v)
+                        for k, v in row.items()
+                        if k is not None and v != ""
+                    }
+                    if (extras := record.pop(extras_column, None)) is not None:
+                        if not isinstance(extras, dict):
+                            err_msg = (
+                                f"{self.option_name} was passed an existing "
+                                f"{ValidateCLICSVFile.FILE_EXTENSION.upper()} file path "
+                                f"'{self.csv_file_path}', but the '{extras_column}' "
+                                f"column on line {reader.line_num} is not a JSON object."
+                            )
+                            file_logger.warning(err_msg)
+                            raise ValidationError(err_msg)
+                        record.update(extras)
+                    yield record
+            except csv.Error as e:
+                err_msg = (
+                    f"{self.option_name} was passed an existing "
+                    f"{ValidateCLICSVFile.FILE_EXTENSION.upper()} file path "
+                    f"'{self.csv_file_path}', but line {reader.line_num} "
+                    f"caused a CSV syntax error. Exception details: {e!r}"
+                )
+                file_logger.warning(err_msg)
+                raise ValidationError(err_msg)
+
+    def validate(self) -> Iterator[dict]:
+        if not self.csv_file_path.expanded.exists():
+            err_msg = (
+                f"{self.option_name} was passed a string '{self.csv_file_path}' "
+                f"that was assumed as a "
+                f"{ValidateCLICSVFile.FILE_EXTENSION.upper()} file path, "
+                f"but it doesn't exist."
+            )
+            file_logger.warning(err_msg)
+            raise ValidationError(err_msg)
+        return self._iter_records()
+
+
+def is_records_file_path(input_: str, /) -> bool:
+    """
+    Return True if ``input_`` is a JSON Lines (``.jsonl``, ``.ndjson``) or CSV
+    file path, i.e., a file with multiple records that ``iter_structured_data``
+    reads one record at a time.
+    """
+    from ...styles.formats import CSVFormat, JSONLinesFormat
+
+    return input_.endswith((*JSONLinesFormat.convention, CSVFormat.convention))
+
+
 def get_structured_data(
     input_: str, /, option_name: str, show_note: bool = True
 ) -> dict:
@@ -119,6 +301,13 @@ def get_structured_data(
     SUPPORTED_INPUT_FORMAT: str = "JSON"
 
     def get_data_from_file():
+        if is_records_file_path(input_):
+            print_typer_error(
+                f"{option_name} was passed a file path '{input_}' that is assumed to "
+                f"contain multiple records, but {option_name} only accepts a single "
+                f"{SUPPORTED_INPUT_FORMAT} object."
+            )
+            raise ValueError
         if input_.endswith(JSONFormat.convention):
             try:
                 items = Validate(ValidateCLIJSONFile(input_, option_name)).get()
@@ -157,7 +346,9 @@ def get_structured_data(
     try:
         data: dict = json.loads(input_)
     except (SyntaxError, ValueError):
-        if input_.endswith((JSONFormat.convention, *YAMLFormat.convention)):
+        if input_.endswith(
+            (JSONFormat.convention, *YAMLFormat.convention)
+        ) or is_records_file_path(input_):
             return get_data_from_file()
         print_typer_error(
             f"{option_name} value has caused a syntax error. "
@@ -171,3 +362,43 @@ def get_structured_data(
             return get_data_from_file()
         else:
             return data
+
+
+def iter_structured_data(
+    input_: str, /, option_name: str, show_note: bool = True
+) -> Iterator[dict]:
+    """
+    Like ``get_structured_data``, but returns an iterator of records (dictionaries)
+    for bulk operations. JSON Lines (``.jsonl``, ``.ndjson``) and CSV files are
+    parsed lazily, one record at a time, so large input files never have to fit
+    in memory. Any other input is resolved with ``get_structured_data``: a single
+    JSON object yields one record, and a JSON/YAML file with a list yields each item.
+    """
+    from ...styles.formats import CSVFormat, JSONLinesFormat
+
+    if input_.endswith(tuple(JSONLinesFormat.convention)):
+        validator = ValidateCLIJSONLinesFile
+    elif input_.endswith(CSVFormat.convention):
+        validator = ValidateCLICSVFile
+    else:
+        try:
+            data = json.loads(input_)
+        except (SyntaxError, ValueError):
+            data = get_structured_data(input_, option_name, show_note=show_note)
+        else:
+            if not isinstance(data, list):
+                data = get_structured_data(input_, option_name, show_note=show_note)
+        if isinstance(data, dict):
+            return iter((data,))
+        if isinstance(data, list) and all(isinstance(_, dict) for _ in data):
+            return iter(data)
+        print_typer_error(
+            f"{option_name} was passed data that could not be understood as "
+            f"a JSON object or a list of JSON objects."
+        )
+        raise ValueError
+    try:
+        return Validate(validator(input_, option_name)).get()
+    except (ValueError, ValidationError) as e:
+        print_typer_error(f"{e}")
+        raise ValueError from e
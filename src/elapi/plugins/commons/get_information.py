@@ -1,25 +1,39 @@
 import asyncio
+import json
+from dataclasses import dataclass, field
 from json import JSONDecodeError
-from typing import Awaitable, Optional
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    TextIO,
+    Union,
+)
 
-import httpx
 from httpx import Response
 from rich.progress import Progress
-from rich.text import Text
 
 from ...api import AsyncGETRequest, GlobalSharedSession
+from ...configuration import get_active_async_capacity
 from ...core_validators import Exit
 from ...loggers import Logger
+from ...path import ProperPath
 from ...styles import stdout_console
+from .concurrent_requests import (
+    RETRY_TRIGGER_ERRORS,
+    RETRY_TRIGGER_STATUS_CODES,
+    STREAM_WINDOW_DEFAULT,
+    get_failure_budget,
+    get_retry_delay,
+    iter_concurrently,
+)
 
 logger = Logger()
-_RETRY_TRIGGER_ERRORS = (
-    httpx.TimeoutException,
-    httpx.ReadError,
-    httpx.ConnectError,
-    httpx.RemoteProtocolError,
-    TimeoutError,
-)
+# An item can be deleted after the list of items was retrieved
+_SKIP_TRIGGER_STATUS_CODES = frozenset((404,))
 
 
 class Information:
@@ -34,7 +48,7 @@ class Information:
         session = GETRequest()
         try:
             response = session(endpoint_name=self.endpoint_name, endpoint_id=None)
-        except _RETRY_TRIGGER_ERRORS as e:
+        except RETRY_TRIGGER_ERRORS as e:
             raise InterruptedError from e
         except KeyboardInterrupt as e:
             raise Exit(1) from e
@@ -60,7 +74,7 @@ class AsyncInformation:
         session = AsyncGETRequest()
         try:
             response = await session(endpoint_name=self.endpoint_name, endpoint_id=None)
-        except _RETRY_TRIGGER_ERRORS as e:
+        except RETRY_TRIGGER_ERRORS as e:
             logger.error(
                 f"Request for '{self.endpoint_name}' information was not successful! "
                 f"Exception details: {e}"
@@ -80,88 +94,303 @@ class AsyncInformation:
             await session.aclose()
 
 
+@dataclass(slots=True)
+class RecursiveInformationResult:
+    items: list[dict] = field(default_factory=list)
+    # Endpoint IDs that still failed after all retries, with the last error
+    failed: dict[Union[int, str], str] = field(default_factory=dict)
+    # Endpoint IDs that no longer exist, e.g., items deleted during the crawl
+    skipped: list[Union[int, str]] = field(default_factory=list)
+
+    @property
+    def failed_ids(self) -> list[Union[int, str]]:
+        return list(self.failed)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.failed
+
+
 class RecursiveInformation:
-    __slots__ = "endpoint_name", "endpoint_id_key_name"
+    __slots__ = (
+        "endpoint_name",
+        "endpoint_id_key_name",
+        "retries",
+        "backoff",
+        "failure_budget",
+        "_checkpoint",
+    )
 
-    def __init__(self, endpoint_name: str, endpoint_id_key_name: str):
+    def __init__(
+        self,
+        endpoint_name: str,
+        endpoint_id_key_name: str,
+        *,
+        retries: int = 3,
+        backoff: float = 0.5,
+        failure_budget: Union[int, float] = 0,
+        checkpoint: Union[Path, ProperPath, str, None] = None,
+    ):
+        """
+        ``retries`` is the number of re-attempts per item on a network error,
+        a server error (5xx or 429) or an unparsable response. Re-attempts
+        wait ``backoff * 2 ** attempt`` seconds (with jitter, at most 60s) or
+        what the server asks for with "Retry-After". ``failure_budget`` is how
+        many items may still fail after all retries before the whole run is
+        interrupted: an int is an absolute count, a float below 1 a fraction
+        of all items. Items that are not found (404) are skipped and do not count
+        against the failure budget. If a ``checkpoint`` file path is given, every retrieved
+        item is appended to it as a JSON line, so an interrupted crawl only
+        fetches the missing items when run again. The checkpoint file is
+        removed once a crawl completes without failures.
+        """
         self.endpoint_name = endpoint_name
         self.endpoint_id_key_name = endpoint_id_key_name
+        self.retries = retries
+        self.backoff = backoff
+        self.failure_budget = failure_budget
+        self.checkpoint = checkpoint
 
-    @staticmethod
-    async def cleanup_remaining(
-        event_loop: asyncio.AbstractEventLoop, endpoint
-    ) -> None:
-        await endpoint.aclose()
-        # Must be closed before cancelling asyncio tasks or stopping the event loop
-        event_loop.set_exception_handler(lambda loop, context: ...)
-        # "lambda loop, context: ..." suppresses asyncio error emission:
-        # https://docs.python.org/3/library/asyncio-dev.html#detect-never-retrieved-exceptions
-        for task in asyncio.all_tasks(event_loop):
-            task.cancel()
+    @property
+    def checkpoint(self) -> Optional[ProperPath]:
+        return self._checkpoint
 
-    async def items(
+    @checkpoint.setter
+    def checkpoint(self, value):
+        if value is not None and not isinstance(value, ProperPath):
+            value = ProperPath(value, kind="file", err_logger=logger)
+        self._checkpoint = value
+
+    def _read_checkpoint(self) -> Iterator[tuple[str, dict]]:
+        if self.checkpoint is None or not self.checkpoint.expanded.exists():
+            return
+        with self.checkpoint.open(encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    yield str(record["id"]), record["item"]
+                except (JSONDecodeError, KeyError, TypeError):
+                    # Most likely the last line was partially written
+                    # when the previous crawl was interrupted.
+                    continue
+
+    async def _fetch(
+        self,
+        endpoint_id: Union[int, str],
+        request: Callable[[], Awaitable[Response]],
+    ) -> tuple[Union[int, str], Optional[dict], Optional[str]]:
+        # Failures are returned rather than raised, as an exception would
+        # cancel every other request of the crawl's task group. An item that
+        # is not found is returned with neither information nor error.
+        for attempt in range(self.retries + 1):
+            response: Optional[Response] = None
+            try:
+                response = await request()
+            except RETRY_TRIGGER_ERRORS as e:
+                error = f"Network error. Exception details: '{e!r}'."
+            else:
+                if response.is_success:
+                    try:
+                        return endpoint_id, response.json(), None
+                    except JSONDecodeError as e:
+                        error = (
+                            f"Response could not be parsed as JSON. "
+                            f"Exception details: '{e!r}'. Response: '{response.text}'"
+                        )
+                elif response.status_code in _SKIP_TRIGGER_STATUS_CODES:
+                    return endpoint_id, None, None
+                else:
+                    error = (
+                        f"Response status: {response.status_code}. "
+                        f"Response: '{response.text}'"
+                    )
+                    if response.status_code not in RETRY_TRIGGER_STATUS_CODES:
+                        # A client error will not be any different on a retry
+                        break
+            if attempt < self.retries:
+                delay = get_retry_delay(attempt, response, backoff=self.backoff)
+                logger.debug(
+                    f"Request for '{self.endpoint_name}' ID '{endpoint_id}' failed "
+                    f"and will be retried in {delay:.1f} seconds. {error}"
+                )
+                await asyncio.sleep(delay)
+        return endpoint_id, None, error
+
+    async def stream(
         self,
         description: Optional[str] = None,
         log_keyboard_interrupt_message: bool = True,
         *,
+        window: Optional[int] = None,
+        result: Optional[RecursiveInformationResult] = None,
         transient: bool = True,
         **kwargs,
-    ):
+    ) -> AsyncIterator[dict]:
+        """
+        Yield each item's information as soon as its response arrives.
+        Requests are created lazily from ``RecursiveGETEndpoint``
+        and at most ``window`` of them are in flight at a time (defaults to
+        the configured async capacity, or 100), so memory use does not grow
+        with the number of source items. Wrap it with ``contextlib.aclosing``
+        if iteration may stop early, so the remaining requests are cancelled.
+        Items that fail after all retries are skipped and recorded in
+        ``result`` (if given), until the failure budget is exceeded.
+        """
         from ...api.endpoint import FixedAsyncEndpoint, RecursiveGETEndpoint
 
-        event_loop = asyncio.get_running_loop()
         endpoint = FixedAsyncEndpoint(endpoint_name=self.endpoint_name)
         endpoint_information = Information(self.endpoint_name).items()
         description = description or f"Getting {self.endpoint_name} data:"
+        window = (
+            window
+            or get_active_async_capacity(skip_validation=True)
+            or STREAM_WINDOW_DEFAULT
+        )
+        result = result if result is not None else RecursiveInformationResult()
+        total, completed = len(endpoint_information), 0
+        failure_budget = get_failure_budget(self.failure_budget, total)
+        crawl_results: Optional[AsyncIterator[tuple]] = None
+        checkpointed_ids: set[str] = set()
+        checkpoint_file: Optional[TextIO] = None
         try:
             recursive_endpoint = RecursiveGETEndpoint(
                 endpoint_information,
                 self.endpoint_id_key_name,
                 target_endpoint=endpoint,
             )
-            tasks: list[Awaitable[Response]] = [
-                item for item in recursive_endpoint.endpoints()
-            ]
-            recursive_information: list = []
+            requests = (
+                self._fetch(endpoint_id, request)
+                for endpoint_id, request in recursive_endpoint.endpoint_requests()
+                if str(endpoint_id) not in checkpointed_ids
+            )
             with Progress(transient=transient, **kwargs) as progress:
-                for task in progress.track(
-                    asyncio.as_completed(tasks),
-                    total=len(tasks),
-                    description=description,
-                ):
-                    response = await task
-                    try:
-                        recursive_information.append(response.json())
-                    except JSONDecodeError as e:
-                        stdout_console.print()  # Print a new line to not overlap with progress bar
-                        logger.warning(
-                            f"Request for '{self.endpoint_name}' data was received by the server but "
-                            f"request was not successful. Response status: {response.status_code}. "
-                            f"Exception details: '{e!r}'. "
-                            f"Response: '{response.text}'"
+                progress_task = progress.add_task(description, total=total)
+                for endpoint_id, information in self._read_checkpoint():
+                    if endpoint_id in checkpointed_ids:
+                        continue
+                    checkpointed_ids.add(endpoint_id)
+                    completed += 1
+                    progress.advance(progress_task)
+                    yield information
+                if checkpointed_ids:
+                    logger.info(
+                        f"{len(checkpointed_ids)} '{self.endpoint_name}' item(s) "
+                        f"were loaded from checkpoint '{self.checkpoint}'."
+                    )
+                if self.checkpoint is not None:
+                    self.checkpoint.create(verbose=False)
+                    checkpoint_file = self.checkpoint.open(mode="a", encoding="utf-8")
+                    if checkpoint_file.tell():
+                        # Start on a new line in case the last one was partially
+                        # written. Blank lines are skipped when reading.
+                        checkpoint_file.write("\n")
+                crawl_results = iter_concurrently(requests, window)
+                async for crawl_result in crawl_results:
+                    endpoint_id, information, error = crawl_result
+                    completed += 1
+                    progress.advance(progress_task)
+                    if information is None and error is None:
+                        result.skipped.append(endpoint_id)
+                        continue
+                    if error is not None:
+                        result.failed[endpoint_id] = error
+                        if len(result.failed) > failure_budget:
+                            stdout_console.print()  # Print a new line to not overlap with progress bar
+                            logger.warning(
+                                f"Request for '{self.endpoint_name}' data with ID "
+                                f"'{endpoint_id}' was not successful, and the "
+                                f"failure budget of {failure_budget} item(s) "
+                                f"is exceeded. {error}"
+                            )
+                            raise InterruptedError(error)
+                        continue
+                    if checkpoint_file is not None:
+                        checkpoint_file.write(
+                            json.dumps({"id": endpoint_id, "item": information}) + "\n"
                         )
-                        await self.cleanup_remaining(event_loop, endpoint)
-                        raise InterruptedError from e
-        except _RETRY_TRIGGER_ERRORS as error:
-            stdout_console.print()
-            logger.warning(
-                f"Retrieving {self.endpoint_name} data was interrupted due to a network error. "
-                f"Exception details: '{error!r}'. "
-            )
-            await self.cleanup_remaining(event_loop, endpoint)
-            raise InterruptedError from error
+                        checkpoint_file.flush()
+                    yield information
         except (KeyboardInterrupt, asyncio.CancelledError) as e:
             if log_keyboard_interrupt_message is True:
-                curr_percentage: Text = progress.columns[2]._renderable_cache[0][1]
-                curr_percentage: str = curr_percentage.plain.strip()
                 logger.error(
                     f"'{KeyboardInterrupt.__name__}' (or similar) aborted "
-                    f"progress at {curr_percentage}."
+                    f"progress at {completed / (total or 1):.0%}."
                 )
-            await self.cleanup_remaining(event_loop, endpoint)
+            if isinstance(e, asyncio.CancelledError):
+                # Cancellation must reach the canceller; converting it to an
+                # exit would stop the whole event loop and every other crawl.
+                raise
             if GlobalSharedSession._instance is not None:
                 GlobalSharedSession().close()
             raise Exit(1) from e
         else:
+            if result.skipped:
+                logger.info(
+                    f"{len(result.skipped)} '{self.endpoint_name}' item(s) were "
+                    f"not found and are skipped, most likely because they were "
+                    f"deleted during retrieval. Skipped IDs: "
+                    f"{', '.join(map(str, result.skipped))}."
+                )
+            if result.failed:
+                logger.warning(
+                    f"{len(result.failed)} out of {total} '{self.endpoint_name}' "
+                    f"item(s) could not be retrieved. Failed IDs: "
+                    f"{', '.join(map(str, result.failed))}."
+                )
+                if self.checkpoint is not None:
+                    logger.info(
+                        f"Retrieved items are kept in checkpoint '{self.checkpoint}'. "
+                        f"Only the failed items will be requested on the next run."
+                    )
+            elif self.checkpoint is not None:
+                checkpoint_file.close()
+                self.checkpoint.remove()
+        finally:
+            if crawl_results is not None:
+                # Cancels the remaining requests if stopped early, either
+                # by an error or by the caller
+                await crawl_results.aclose()
+            if checkpoint_file is not None:
+                checkpoint_file.close()
             await endpoint.aclose()
-            return recursive_information
+
+    async def collect(
+        self,
+        description: Optional[str] = None,
+        log_keyboard_interrupt_message: bool = True,
+        *,
+        window: Optional[int] = None,
+        transient: bool = True,
+        **kwargs,
+    ) -> RecursiveInformationResult:
+        result = RecursiveInformationResult()
+        async for information in self.stream(
+            description,
+            log_keyboard_interrupt_message,
+            window=window,
+            result=result,
+            transient=transient,
+            **kwargs,
+        ):
+            result.items.append(information)
+        return result
+
+    async def items(
+        self,
+        description: Optional[str] = None,
+        log_keyboard_interrupt_message: bool = True,
+        *,
+        window: Optional[int] = None,
+        transient: bool = True,
+        **kwargs,
+    ) -> list[dict]:
+        return [
+            information
+            async for information in self.stream(
+                description,
+                log_keyboard_interrupt_message,
+                window=window,
+                transient=transient,
+                **kwargs,
+            )
+        ]
@@ -120,9 +120,9 @@ def get(
                 if highlight_syntax is True:
                     highlight = Highlight(format.name, package_identifier=__package__)
                     if not response.is_success:
-                        stderr_console.print(highlight(formatted_data))
+                        highlight.print(formatted_data, stderr_console)
                         raise Exit(1)
-                    stdout_console.print(highlight(formatted_data))
+                    highlight.print(formatted_data, stdout_console)
                 else:
                     if not response.is_success:
                         typer.echo(formatted_data, file=sys.stderr)
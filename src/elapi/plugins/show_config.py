@@ -8,6 +8,7 @@ from ..configuration import (
     KEY_API_TOKEN,
     KEY_ASYNC_CAPACITY,
     KEY_ASYNC_RATE_LIMIT,
+    KEY_CACHE_TTL,
     KEY_DEVELOPMENT_MODE,
     KEY_ELAB_STRICT_VERSION_MATCH,
     KEY_ENABLE_HTTP2,
@@ -18,6 +19,7 @@ from ..configuration import (
     KEY_VERIFY_SSL,
     get_active_async_capacity,
     get_active_async_rate_limit,
+    get_active_cache_ttl,
     get_active_enable_http2,
     get_active_export_dir,
     get_active_timeout,
@@ -119,6 +121,19 @@ finally:
         else None
     )
 
+try:
+    cache_ttl_source = detected_config[KEY_CACHE_TTL].source
+    cache_ttl_source = detected_config_files[cache_ttl_source]
+except KeyError:
+    cache_ttl_source = FALLBACK_SOURCE_NAME
+finally:
+    cache_ttl_value = get_active_cache_ttl(skip_validation=True)
+    cache_ttl_value = (
+        ", ".join(f"{k}: {v:g}s" for k, v in cache_ttl_value.items())
+        if isinstance(cache_ttl_value, dict)
+        else cache_ttl_value
+    )
+
 
 try:
     development_mode_source = detected_config[KEY_DEVELOPMENT_MODE].source
@@ -280,6 +295,14 @@ The following information includes configuration values and their sources as det
         )
         + f": {async_capacity_value} ← `{async_capacity_source}`"
         + "\n"
+        + f"- {ColorText('Cache TTL').colorize(LIGHTGREEN)}"
+        + (
+            f" **[{ColorText(KEY_CACHE_TTL.lower()).colorize(YELLOW)}]**"
+            if not no_keys
+            else ""
+        )
+        + f": {cache_ttl_value} ← `{cache_ttl_source}`"
+        + "\n"
         + f"- {ColorText('Development mode').colorize(LIGHTGREEN)}"
         + (
             f" **[{ColorText(KEY_DEVELOPMENT_MODE.lower()).colorize(YELLOW)}]**"
@@ -305,6 +328,7 @@ The following information includes configuration values and their sources as det
                 timeout_source,
                 async_rate_limit_source,
                 async_capacity_source,
+                cache_ttl_source,
                 verify_ssl_source,
                 development_mode_source,
                 elab_strict_version_match_source,
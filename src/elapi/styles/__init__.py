@@ -1,7 +1,13 @@
 # ruff: noqa: F401
+from importlib.util import find_spec
+
 from ._markdown_doc import get_custom_help_text
 from ._missing import Missing
 from .base import stdout_console, stderr_console, __PACKAGE_IDENTIFIER__
 from .formats import BaseFormat, FormatError, Format, RegisterFormattingLanguage
 from .highlight import BaseHighlight, Highlight, NoteText, ColorText, print_typer_error
 from .rich_utils import rich_format_help_with_callback
+
+if find_spec("pyarrow") is not None:
+    # Columnar formats are registered only if the optional pyarrow is installed
+    from .columnar_formats import ArrowFormat, ParquetFormat
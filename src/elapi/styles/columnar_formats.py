@@ -0,0 +1,162 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from io import RawIOBase
+from itertools import islice
+from typing import Any
+
+from .base import __PACKAGE_IDENTIFIER__ as styles_package_identifier
+from .formats import BaseFormat, FormatError
+
+ARROW_RECORD_BATCH_SIZE: int = 10_000
+
+
+class _ChunkSink(RawIOBase):
+    # A write-only file object that keeps track of its position, so Arrow
+    # writers can compute offsets, while written bytes can be drained as chunks.
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position: int = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _get_dropped_fields(data_type, schema_type, /, path: str = "") -> list[str]:
+    # Returns the (nested) fields of data_type that schema_type does not have
+    import pyarrow as pa
+
+    if pa.types.is_struct(data_type) and pa.types.is_struct(schema_type):
+        dropped_fields: list[str] = []
+        for i in range(data_type.num_fields):
+            field = data_type.field(i)
+            if (schema_index := schema_type.get_field_index(field.name)) == -1:
+                dropped_fields.append(f"{path}{field.name}")
+            else:
+                dropped_fields += _get_dropped_fields(
+                    field.type,
+                    schema_type.field(schema_index).type,
+                    f"{path}{field.name}.",
+                )
+        return dropped_fields
+    if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+        if pa.types.is_list(schema_type) or pa.types.is_large_list(schema_type):
+            return _get_dropped_fields(
+                data_type.value_type, schema_type.value_type, path
+            )
+    return []
+
+
+class ArrowBatchFormatMixin(ABC):
+    """
+    Mixin for binary columnar formats written with pyarrow. Items (dictionaries)
+    are written in record batches of ``batch_size`` rows. The schema is inferred
+    from the first batch: nested dictionaries become struct columns and lists
+    become list columns. Later batches are cast to that schema, and missing keys
+    become null. As the schema is already written by then, a later batch with
+    keys that were not part of the first batch raises ``FormatError`` instead
+    of losing data.
+    """
+
+    name: str
+    batch_size: int = ARROW_RECORD_BATCH_SIZE
+
+    @abstractmethod
+    def new_writer(self, sink: RawIOBase, schema):
+        """Return a pyarrow writer with ``write_batch`` and ``close`` methods."""
+
+    def __call__(self, data: Any) -> bytes:
+        if isinstance(data, dict):
+            data = (data,)
+        return b"".join(self.stream(data))
+
+    def stream(self, items: Iterable[Any]) -> Iterator[bytes]:
+        import pyarrow as pa
+
+        items = iter(items)
+        sink = _ChunkSink()
+        schema = writer = None
+        while rows := list(islice(items, self.batch_size)):
+            if not all(isinstance(row, dict) for row in rows):
+                raise FormatError(
+                    f"Only dictionaries or iterables of dictionaries can be "
+                    f"formatted to {self.name.upper()}."
+                )
+            try:
+                # The inferred type has the union of the keys of all rows
+                rows_array = pa.array(rows)
+                if schema is None or rows_array.type == pa.struct(schema):
+                    batch = pa.RecordBatch.from_struct_array(rows_array)
+                elif dropped_fields := _get_dropped_fields(
+                    rows_array.type, pa.struct(schema)
+                ):
+                    raise FormatError(
+                        f"Data has key(s) {', '.join(map(repr, dropped_fields))} "
+                        f"that are not part of the {self.name.upper()} schema "
+                        f"inferred from the first {self.batch_size} items. "
+                        f"The key(s) would be lost, so the export is aborted."
+                    )
+                else:
+                    batch = pa.RecordBatch.from_pylist(rows, schema=schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise FormatError(
+                    f"Data could not be converted to the {self.name.upper()} schema "
+                    f"inferred from the first {self.batch_size} items. "
+                    f"Exception details: {e!r}"
+                ) from e
+            if writer is None:
+                schema = batch.schema
+                writer = self.new_writer(sink, schema)
+            writer.write_batch(batch)
+            if chunk := sink.drain():
+                yield chunk
+        if writer is None:
+            # No items were given, so there are no columns either
+            schema = pa.schema([])
+            writer = self.new_writer(sink, schema)
+        writer.close()
+        yield sink.drain()
+
+
+class ParquetFormat(ArrowBatchFormatMixin, BaseFormat):
+    name: str = "parquet"
+    convention: str = name
+    package_identifier: str = styles_package_identifier
+
+    @classmethod
+    def pattern(cls) -> str:
+        return r"^parquet$"
+
+    def new_writer(self, sink: RawIOBase, schema):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(sink, schema)
+
+
+class ArrowFormat(ArrowBatchFormatMixin, BaseFormat):
+    name: str = "arrow"
+    convention: list[str] = ["arrow", "feather"]
+    package_identifier: str = styles_package_identifier
+
+    @classmethod
+    def pattern(cls) -> str:
+        return r"^(arrow|feather)$"
+
+    def new_writer(self, sink: RawIOBase, schema):
+        import pyarrow as pa
+
+        return pa.ipc.new_file(sink, schema)
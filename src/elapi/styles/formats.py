@@ -1,12 +1,26 @@
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from typing import Any, Optional, Self, Union
 
 from .._names import APP_NAME
 from .base import __PACKAGE_IDENTIFIER__ as styles_package_identifier
 
 
+# Matches a JSON string (up to the end of the input if it's unterminated, in
+# which case the second group is empty), a structural character, a literal
+# (number, true, false, null) or whitespace.
+_JSON_TOKEN_PATTERN = re.compile(
+    rb'("[^"\\]*(?:\\.[^"\\]*)*(?:(")|\\?\Z)|[{}\[\],:]|[^"{}\[\],:\s]+|\s+)', re.DOTALL
+)
+
+# SQLite is registered under its own package identifier, so it is not part of
+# the built-in formats every plugin registry is copied from. Only the commands
+# that export with SQLiteExport look it up.
+SQLITE_PACKAGE_IDENTIFIER: str = f"{styles_package_identifier}.sqlite"
+
+
 class BaseFormat(ABC):
     _registry: dict[str, dict[str, type[Self]]] = {styles_package_identifier: {}}
     _names: dict[str, list[str]] = {styles_package_identifier: []}
@@ -91,6 +105,14 @@ class BaseFormat(ABC):
     @abstractmethod
     def __call__(self, data: Any): ...
 
+    def stream(self, items: Iterable[Any]) -> Iterator[Union[str, bytes]]:
+        """
+        Yield formatted chunks for an iterable of items. Formats that can be
+        written item by item should override it; by default, all items are
+        collected and formatted as a whole.
+        """
+        yield self(list(items))
+
 
 class FormatError(Exception): ...
 
@@ -111,6 +133,85 @@ class JSONFormat(BaseFormat):
             data, indent=2, ensure_ascii=False
         )  # ensure_ascii==False allows unicode
 
+    @staticmethod
+    def reindent(chunks: Iterable[bytes], indent: int = 2) -> Iterator[bytes]:
+        """
+        Indent JSON that arrives as chunks of bytes, without decoding or
+        parsing it, the way ``json.dumps(indent=indent)`` would. Strings
+        (including escape sequences) are copied as they are. A token split
+        across chunks is held back until its next chunk arrives.
+        """
+        newlines: list[bytes] = [b"\n"]
+        level: int = 0
+        is_container_empty: bool = False  # Until the first value of an opened container
+        held_back: bytes = b""
+        for chunk in chain(chunks, (None,)):
+            tokens: list[tuple[bytes, bytes]] = _JSON_TOKEN_PATTERN.findall(
+                held_back + (chunk or b"")
+            )
+            held_back = b""
+            if chunk is not None and tokens:
+                # Only the last token can be incomplete: a string without its
+                # closing quote, or a literal (or whitespace) that may continue.
+                last_token, closing_quote = tokens[-1]
+                if last_token[:1] not in b"{}[],:" and (
+                    last_token[:1] != b'"' or not closing_quote
+                ):
+                    held_back = last_token
+                    tokens.pop()
+            output: list[bytes] = []
+            append = output.append
+            for token, _ in tokens:
+                if token in b"}]":
+                    level -= 1
+                    if is_container_empty:
+                        is_container_empty = False
+                    else:
+                        append(newlines[level])
+                    append(token)
+                    continue
+                if token.isspace():
+                    continue
+                if is_container_empty:
+                    is_container_empty = False
+                    append(newlines[level])
+                if token == b",":
+                    append(b",")
+                    append(newlines[level])
+                elif token == b":":
+                    append(b": ")
+                else:
+                    append(token)
+                    if token in b"{[":
+                        level += 1
+                        if level == len(newlines):
+                            newlines.append(b"\n" + b" " * (indent * level))
+                        is_container_empty = True
+            if output:
+                yield b"".join(output)
+
+
+class JSONLinesFormat(BaseFormat):
+    name: str = "jsonl"
+    convention: list[str] = ["jsonl", "ndjson"]
+    package_identifier: str = styles_package_identifier
+
+    @classmethod
+    def pattern(cls) -> str:
+        return r"^(jsonl|ndjson)$"
+
+    def __call__(self, data: Any) -> str:
+        if isinstance(data, (dict, str, bytes)) or not isinstance(data, Iterable):
+            data = (data,)
+        return "".join(self.stream(data))
+
+    def stream(self, items: Iterable[Any]) -> Iterator[str]:
+        import json
+
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        for item in items:
+            yield f"{encoder.encode(item)}\n"
+
 
 class YAMLFormat(BaseFormat):
     name: str = "yaml"
@@ -121,48 +222,140 @@ class YAMLFormat(BaseFormat):
     def pattern(cls) -> str:
         return r"^ya?ml$"
 
+    stream_batch_size: int = 500
+
     def __call__(self, data: Any) -> str:
-        import yaml
+        from .._yaml import safe_dump
+
+        return safe_dump(data, indent=2, allow_unicode=True, sort_keys=False)
 
-        return yaml.dump(data, indent=2, allow_unicode=True, sort_keys=False)
+    def stream(self, items: Iterable[Any]) -> Iterator[str]:
+        # Dumping items in batches of one-level sequences and concatenating them
+        # gives the same YAML sequence that dumping all items at once would.
+        from itertools import islice
+
+        items = iter(items)
+        is_empty: bool = True
+        while batch := list(islice(items, self.stream_batch_size)):
+            is_empty = False
+            yield self(batch)
+        if is_empty:
+            yield self([])
 
 
 class CSVFormat(BaseFormat):
+    """
+    Rows are written as they are consumed. The header is the union of the
+    keys of the first ``schema_sample_size`` items. If there are more items
+    than that, an ``extras_column`` is added to the header, and keys that
+    first appear after the sample are written to it as a JSON object.
+    """
+
     name: str = "csv"
     convention: str = name
     package_identifier: str = styles_package_identifier
+    schema_sample_size: int = 1000
+    extras_column: str = "_extras"
+    _chunk_size: int = 64 * 1024
 
     @classmethod
     def pattern(cls) -> str:
         return r"^csv$"
 
     def __call__(self, data: Any) -> str:
+        if isinstance(data, dict):
+            data = [data]
+        elif isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
+            data = list(data)  # All items are sampled, so no extras column is needed
+        else:
+            raise FormatError(
+                "Only dictionaries or iterables of dictionaries can be formatted to CSV."
+            )
+        return "".join(self._stream(data, schema_sample_size=len(data)))
+
+    def stream(self, items: Iterable[Any]) -> Iterator[str]:
+        return self._stream(items, schema_sample_size=self.schema_sample_size)
+
+    def _stream(self, items: Iterable[Any], schema_sample_size: int) -> Iterator[str]:
+        import json
         from csv import DictWriter
         from io import StringIO
-
+        from itertools import chain, islice
+
+        items = iter(items)
+        sample: list[dict] = list(islice(items, schema_sample_size))
+        fieldnames: dict[str, None] = {}  # Keeps the order keys first appear in
+        for item in sample:
+            if not isinstance(item, dict):
+                raise FormatError(
+                    "Only dictionaries or iterables of dictionaries can be formatted to CSV."
+                )
+            fieldnames.update(dict.fromkeys(item))
+        if not fieldnames:
+            return
+        end_of_items = object()
+        next_item = next(items, end_of_items)
+        has_extras: bool = next_item is not end_of_items
+        if has_extras:
+            items = chain((next_item,), items)
+            fieldnames[self.extras_column] = None
         with StringIO() as csv_buffer:
-            writer: DictWriter = DictWriter(csv_buffer, fieldnames=[])
-            if isinstance(data, dict):
-                writer.fieldnames = data.keys()
-                writer.writeheader()
-                writer.writerow(data)
-                csv_as_string = csv_buffer.getvalue()
-            elif isinstance(data, Iterable):
-                for item in data:
-                    if not isinstance(item, dict):
-                        raise FormatError(
-                            "Only dictionaries or iterables of dictionaries can be formatted to CSV."
-                        )
-                    if not writer.fieldnames:
-                        writer.fieldnames = item.keys()
-                        writer.writeheader()
-                    if len(item.items()) > len(writer.fieldnames):
-                        raise FormatError(
-                            "Iterable of dictionary contains insistent length of key items."
-                        )
-                    writer.writerow(item)
-                csv_as_string = csv_buffer.getvalue()
-        return csv_as_string
+            writer: DictWriter = DictWriter(
+                csv_buffer, fieldnames=list(fieldnames), extrasaction="ignore"
+            )
+            writer.writeheader()
+            for item in chain(sample, items):
+                if not isinstance(item, dict):
+                    raise FormatError(
+                        "Only dictionaries or iterables of dictionaries can be formatted to CSV."
+                    )
+                if has_extras and (
+                    extras := {k: v for k, v in item.items() if k not in fieldnames}
+                ):
+                    item = {
+                        **item,
+                        self.extras_column: json.dumps(
+                            extras, ensure_ascii=False, default=str
+                        ),
+                    }
+                writer.writerow(item)
+                if csv_buffer.tell() >= self._chunk_size:
+                    yield csv_buffer.getvalue()
+                    csv_buffer.seek(0)
+                    csv_buffer.truncate()
+            if csv_buffer.tell():
+                yield csv_buffer.getvalue()
+
+
+class SQLiteFormat(BaseFormat):
+    """
+    SQLite databases cannot be written as a string, so the format only
+    normalizes data to a list of records. The records are written to
+    the database by ``SQLiteExport``.
+    """
+
+    name: str = "sqlite"
+    convention: list[str] = ["sqlite", "sqlite3", "db"]
+    package_identifier: str = SQLITE_PACKAGE_IDENTIFIER
+
+    @classmethod
+    def pattern(cls) -> str:
+        return r"^(sqlite3?|db)$"
+
+    def __call__(self, data: Any) -> list[dict]:
+        if isinstance(data, dict):
+            return [data]
+        if isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
+            data = list(data)
+            if all(isinstance(item, dict) for item in data):
+                return data
+        raise FormatError(
+            "Only dictionaries or iterables of dictionaries can be formatted to SQLite."
+        )
+
+    def stream(self, items: Iterable[Any]) -> Iterator[dict]:
+        for item in items:
+            yield from self(item)
 
 
 class TXTFormat(BaseFormat):
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable, Iterator
+from typing import Any, Union
 
 from colorama import Fore
+from rich.console import Console
 from rich.padding import Padding
 from rich.syntax import Syntax
 from rich.text import Text
@@ -19,6 +21,10 @@ class BaseHighlight(ABC):
 
 
 class Highlight(BaseHighlight):
+    # Data larger than this (in characters) is highlighted in blocks of lines
+    size_threshold: int = 64 * 1024
+    block_lines: int = 1000
+
     def __init__(
         self, language: str, /, theme: str = "lightbulb", *, package_identifier: str
     ):
@@ -37,6 +43,69 @@ class Highlight(BaseHighlight):
             word_wrap=True,
         )
 
+    def print(self, data: Union[str, Iterable[str]], /, console: Console) -> None:
+        """
+        Print highlighted data to ``console``. Data can also be an iterable of
+        string chunks. Small data is printed as a rich ``Syntax``. Rendering
+        with rich gets very slow for large data, so large data (and chunked data)
+        is highlighted by pygments directly, and written to the console in blocks
+        of lines as soon as they are ready. If the console is not a terminal
+        (e.g., output is piped), data is written as it is.
+        """
+        if isinstance(data, str):
+            if console.is_terminal and len(data) <= self.size_threshold:
+                console.print(self(data))
+                return
+            data = (data,)
+        if not console.is_terminal or console.color_system is None:
+            is_empty: bool = True
+            for chunk in data:
+                console.file.write(chunk)
+                is_empty = is_empty and not chunk
+            if not is_empty:
+                console.file.write("\n")
+            console.file.flush()
+            return
+        from pygments import highlight
+        from pygments.formatters import (
+            Terminal256Formatter,
+            TerminalFormatter,
+            TerminalTrueColorFormatter,
+        )
+        from pygments.lexers import get_lexer_by_name
+        from pygments.util import ClassNotFound
+
+        try:
+            lexer = get_lexer_by_name(self.name)
+        except ClassNotFound:
+            lexer = get_lexer_by_name("text")
+        formatter = {
+            "truecolor": TerminalTrueColorFormatter,
+            "256": Terminal256Formatter,
+        }.get(console.color_system, TerminalFormatter)(style=self.theme)
+        for block in self._iter_line_blocks(data):
+            console.file.write(highlight(block, lexer, formatter))
+            console.file.flush()
+
+    def _iter_line_blocks(self, chunks: Iterable[str]) -> Iterator[str]:
+        lines: list[str] = []
+        partial_line: list[str] = []  # Parts of a line that spans chunks
+        for chunk in chunks:
+            first_line, *complete_lines = chunk.split("\n")
+            partial_line.append(first_line)
+            if not complete_lines:
+                continue
+            lines.append("".join(partial_line))
+            partial_line = [complete_lines.pop()]
+            lines.extend(complete_lines)
+            while len(lines) >= self.block_lines:
+                yield "\n".join(lines[: self.block_lines]) + "\n"
+                del lines[: self.block_lines]
+        if partial_line := "".join(partial_line):
+            lines.append(partial_line)
+        if lines:
+            yield "\n".join(lines) + "\n"
+
 
 class NoteText:
     def __new__(
@@ -1,3 +1,11 @@
+# noinspection PyProtectedMember
+from .._core_init._cache import (
+    CacheEntry,
+    CacheStore,
+    CacheStoreError,
+    get_or_revalidate,
+)
+
 # noinspection PyProtectedMember
 from .._core_init._utils import (
     GlobalCLIGracefulCallback,
@@ -16,6 +24,7 @@ from .utils import (
     UnexpectedAPIResponseType,
     check_reserved_keyword,
     detected_click_feedback,
+    get_cached_venv_value,
     get_external_python_version,
     get_sub_package_name,
     parse_api_id_from_api_token,
@@ -31,6 +40,7 @@ __all__ = [
     "PythonVersionCheckFailed",
     "check_reserved_keyword",
     "get_external_python_version",
+    "get_cached_venv_value",
     "get_sub_package_name",
     "update_kwargs_with_defaults",
     "get_app_version",
@@ -45,4 +55,8 @@ __all__ = [
     "UnexpectedAPIResponseType",
     "detected_click_feedback",
     "SafeCWD",
+    "CacheEntry",
+    "CacheStore",
+    "CacheStoreError",
+    "get_or_revalidate",
 ]
@@ -2,13 +2,17 @@ import os
 import re
 import subprocess
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
 
 import typer
 
 from .._core_init import PatternNotFoundError
-from .._names import ELAB_HOST_URL_API_SUFFIX
+
+# noinspection PyProtectedMember
+from .._core_init._cache import CacheStore, CacheStoreError
+from .._names import ELAB_HOST_URL_API_SUFFIX, PLUGIN_VENV_CACHE_NAMESPACE
 from ..styles import Missing
 
 
@@ -72,11 +76,72 @@ def update_kwargs_with_defaults(kwargs: dict, /, defaults: dict) -> None:
             kwargs.update({default_key: default_val})
 
 
+VENV_CONFIG_FILE_NAME: str = "pyvenv.cfg"
+
+
 def _get_venv_relative_python_binary_path() -> Path:
     return Path("bin/python")
 
 
+def get_venv_fingerprint(venv_dir: Path) -> list:
+    """
+    Return the sizes and modification times of the virtual environment's
+    configuration file and of its resolved Python binary. Both change when
+    the virtual environment is recreated or its Python is upgraded.
+    """
+    fingerprint: list = []
+    for path in (
+        venv_dir / VENV_CONFIG_FILE_NAME,
+        (venv_dir / _get_venv_relative_python_binary_path()).resolve(),
+    ):
+        try:
+            stat = path.stat()
+        except OSError:
+            fingerprint.append([str(path), None])
+        else:
+            fingerprint.append([str(path), stat.st_size, stat.st_mtime_ns])
+    return fingerprint
+
+
+def get_cached_venv_value(
+    venv_dir: Path, key: str, get_value: Callable[[], Any]
+) -> Any:
+    """
+    Return the value of ``key`` for the virtual environment from the cache. The
+    value is found again with ``get_value`` and cached if it is not cached yet,
+    or if it was cached with a different virtual environment fingerprint.
+    The value must be JSON serializable.
+    """
+    store = CacheStore(PLUGIN_VENV_CACHE_NAMESPACE)
+    cache_key: str = f"{venv_dir}:{key}"
+    fingerprint = get_venv_fingerprint(venv_dir)
+    try:
+        cached = store.get(cache_key)
+    except CacheStoreError:
+        cached = None
+    if cached is not None and cached["fingerprint"] == fingerprint:
+        return cached["value"]
+    value = get_value()
+    try:
+        store.set(cache_key, {"fingerprint": fingerprint, "value": value})
+    except CacheStoreError:
+        ...
+    return value
+
+
 def get_external_python_version(venv_dir: Path) -> Tuple[str, str, str]:
+    # Running the Python binary of the virtual environment is slow,
+    # so the version is only checked again if the virtual environment changes.
+    return tuple(
+        get_cached_venv_value(
+            venv_dir,
+            "python_version",
+            partial(_get_external_python_version, venv_dir),
+        )
+    )
+
+
+def _get_external_python_version(venv_dir: Path) -> Tuple[str, str, str]:
     external_python_path: Path = (
         external_python_path_unresolved := (
             venv_dir / _get_venv_relative_python_binary_path()
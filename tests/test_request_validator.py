@@ -0,0 +1,163 @@
+import sys
+from types import ModuleType
+
+import pytest
+
+from elapi.api import _request_validator
+from elapi.api._openapi_parser import (
+    parse_openapi_request_schemas,
+    render_request_schemas_bundle,
+)
+from elapi.api._request_validator import (
+    REQUEST_SCHEMAS_MODULE_NAME,
+    get_route_key,
+    validate_request,
+)
+
+ELAB_VERSION: str = "5.3.9"
+# A trimmed-down specification in the shape of eLabFTW's apidoc/v2/openapi.yaml
+OPENAPI_SPEC: dict = {
+    "openapi": "3.1.0",
+    "paths": {
+        "/{entity_type}": {
+            "parameters": [
+                {
+                    "name": "entity_type",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string", "enum": ["experiments", "items"]},
+                }
+            ],
+            "get": {
+                "parameters": [
+                    {"$ref": "#/components/parameters/limit"},
+                    {
+                        "name": "order",
+                        "in": "query",
+                        "schema": {"type": "string", "enum": ["asc", "desc"]},
+                    },
+                ]
+            },
+        },
+        "/{entity_type}/{id}": {
+            "parameters": [
+                {
+                    "name": "entity_type",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string", "enum": ["experiments", "items"]},
+                },
+                {"name": "id", "in": "path", "required": True},
+            ],
+            "patch": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/entity"}
+                        }
+                    }
+                }
+            },
+        },
+    },
+    "components": {
+        "parameters": {
+            "limit": {
+                "name": "limit",
+                "in": "query",
+                "description": "Maximum number of entries to return.",
+                "schema": {"type": "integer", "minimum": 1},
+            }
+        },
+        "schemas": {
+            "entity": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string", "description": "Title"},
+                    "rating": {"type": "integer", "minimum": 0, "maximum": 5},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+        },
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def request_schemas_bundle(monkeypatch):
+    # The generated bundle is loaded as the validator would load the committed one
+    bundle = ModuleType(REQUEST_SCHEMAS_MODULE_NAME)
+    exec(
+        render_request_schemas_bundle(
+            {ELAB_VERSION: parse_openapi_request_schemas(OPENAPI_SPEC)}
+        ),
+        bundle.__dict__,
+    )
+    monkeypatch.setitem(sys.modules, f"elapi.api.{REQUEST_SCHEMAS_MODULE_NAME}", bundle)
+    _request_validator._load_route_table.cache_clear()
+    _request_validator.get_request_validator.cache_clear()
+    yield bundle
+    _request_validator._load_route_table.cache_clear()
+    _request_validator.get_request_validator.cache_clear()
+
+
+def test_parsed_routes():
+    assert set(parse_openapi_request_schemas(OPENAPI_SPEC)) == {
+        "GET experiments",
+        "GET items",
+        "PATCH experiments/{id}",
+        "PATCH items/{id}",
+    }
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"title": "Test", "rating": 3, "tags": ["a", "b"]},
+        {"title": "Test", "custom_field": 1},
+    ],
+)
+def test_valid_body(data):
+    route_key = get_route_key("experiments", True, None, False)
+    assert validate_request(ELAB_VERSION, "patch", route_key, data=data) == []
+
+
+@pytest.mark.parametrize(
+    ("data", "error"),
+    [
+        ({"title": 1}, "'data.title' must be of type string."),
+        ({"rating": 9}, "'data.rating' must be less than or equal to 5."),
+        ({"rating": True}, "'data.rating' must be of type integer."),
+        ({"tags": ["a", 2]}, "'data.tags[1]' must be of type string."),
+    ],
+)
+def test_invalid_body(data, error):
+    route_key = get_route_key("items", True, None, False)
+    assert validate_request(ELAB_VERSION, "patch", route_key, data=data) == [error]
+
+
+def test_valid_query():
+    # Query values are strings on the command line
+    assert (
+        validate_request(
+            ELAB_VERSION, "get", "experiments", query={"limit": "10", "order": "asc"}
+        )
+        == []
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "error"),
+    [
+        ({"limit": "ten"}, "'query.limit' must be of type integer."),
+        ({"limit": 0}, "'query.limit' must be greater than or equal to 1."),
+        ({"order": "random"}, "'query.order' must be one of: asc, desc."),
+    ],
+)
+def test_invalid_query(query, error):
+    assert validate_request(ELAB_VERSION, "get", "experiments", query=query) == [error]
+
+
+def test_unknown_version_or_route_is_not_validated():
+    assert validate_request("4.0.0", "patch", "items/{id}", data={"title": 1}) == []
+    assert validate_request(ELAB_VERSION, "post", "items", data={"title": 1}) == []